@@ -9,12 +9,29 @@ __version__ = "0.1.0"
 __author__ = "HomeHunt Team"
 __email__ = "contact@homehunt.dev"
 
-from .core.db import Database, Listing
-from .core.models import PropertyListing, SearchConfig
-
 __all__ = [
     "PropertyListing",
     "SearchConfig",
     "Database",
     "Listing",
 ]
+
+# Public names are resolved on first access (PEP 562) so that importing the
+# package, e.g. for ``homehunt --help``, does not pull in SQLModel/pydantic
+_LAZY_IMPORTS = {
+    "Database": ".core.db",
+    "Listing": ".core.db",
+    "PropertyListing": ".core.models",
+    "SearchConfig": ".core.models",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
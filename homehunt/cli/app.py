@@ -3,26 +3,31 @@ Main CLI application for HomeHunt
 Provides commands for searching properties, managing database, and more
 """
 
-import asyncio
+import heapq
+import os
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
 import typer
-from rich import print
+from pydantic import ValidationError
 from rich.console import Console
-from rich.table import Table
 
-from homehunt.core.db import Database, init_db
 from homehunt.core.models import Portal, PropertyType
-from homehunt.traveltime.client import TravelTimeClient
-from homehunt.traveltime.service import TravelTimeService
 
-from .config import FurnishedType, LetType, SearchConfig, SortOrder
-from .search_command import search_properties
+from .config import (
+    FurnishedType,
+    LetType,
+    PortalSet,
+    SearchConfig,
+    SearchRadius,
+    SortOrder,
+)
 from .config_commands import init_config, list_configs, run_config, show_config
 from .export_commands import (
+    export_all,
     export_csv,
     export_json, 
     export_sheets,
@@ -30,34 +35,48 @@ from .export_commands import (
     list_export_templates,
     test_sheets_connection,
 )
+from .runner import add_cleanup, run_async
 
 # Initialize Typer app
 app = typer.Typer(
     name="homehunt",
     help="HomeHunt - Automated property search with commute analysis",
-    add_completion=False,
+    add_completion=True,
 )
 
-# Console for rich output
-console = Console()
+# Console for rich output; automatic highlighting is skipped when piped
+console = Console(highlight=sys.stdout.isatty())
+
+# Lookup tables for resolving parsed options
+_RADIUS_MAP = {e.value: e for e in SearchRadius}
+_PORTAL_MAP = {
+    PortalSet.ALL: [Portal.RIGHTMOVE, Portal.ZOOPLA],
+    PortalSet.RIGHTMOVE: [Portal.RIGHTMOVE],
+    PortalSet.ZOOPLA: [Portal.ZOOPLA],
+}
+
+# Maximum concurrent TravelTime requests in the commute command
+COMMUTE_CONCURRENCY = 8
+# Number of shortest commutes shown in the commute command's table
+COMMUTE_TABLE_ROWS = 20
 
 
 @app.command()
 def search(
     location: str = typer.Argument(..., help="Search location (postcode, area, or city)"),
-    min_price: Optional[int] = typer.Option(None, "--min-price", help="Minimum monthly rent in pounds"),
-    max_price: Optional[int] = typer.Option(None, "--max-price", help="Maximum monthly rent in pounds"),
-    min_bedrooms: Optional[int] = typer.Option(None, "--min-beds", help="Minimum number of bedrooms"),
-    max_bedrooms: Optional[int] = typer.Option(None, "--max-beds", help="Maximum number of bedrooms"),
-    property_type: Optional[str] = typer.Option(None, "--type", help="Property type (flat/house/studio/bungalow/maisonette)"),
-    furnished: str = typer.Option("any", "--furnished", help="Furnished status (furnished/unfurnished/part_furnished/any)"),
+    min_price: Optional[int] = typer.Option(None, "--min-price", min=0, help="Minimum monthly rent in pounds"),
+    max_price: Optional[int] = typer.Option(None, "--max-price", min=0, help="Maximum monthly rent in pounds"),
+    min_bedrooms: Optional[int] = typer.Option(None, "--min-beds", min=0, help="Minimum number of bedrooms"),
+    max_bedrooms: Optional[int] = typer.Option(None, "--max-beds", min=0, help="Maximum number of bedrooms"),
+    property_type: Optional[PropertyType] = typer.Option(None, "--type", case_sensitive=False, help="Property type"),
+    furnished: FurnishedType = typer.Option(FurnishedType.ANY, "--furnished", case_sensitive=False, help="Furnished status"),
     radius: float = typer.Option(0.25, "--radius", help="Search radius in miles"),
     parking: bool = typer.Option(False, "--parking", help="Must have parking"),
     garden: bool = typer.Option(False, "--garden", help="Must have garden"),
     pets: bool = typer.Option(False, "--pets", help="Must allow pets"),
-    portals: str = typer.Option("all", "--portals", help="Portals to search (rightmove/zoopla/all)"),
-    max_results: int = typer.Option(100, "--max-results", help="Maximum results to return"),
-    sort: str = typer.Option("date_desc", "--sort", help="Sort order (price_asc/price_desc/date_desc/date_asc)"),
+    portals: PortalSet = typer.Option(PortalSet.ALL, "--portals", case_sensitive=False, help="Portals to search"),
+    max_results: int = typer.Option(100, "--max-results", min=1, max=1000, help="Maximum results to return"),
+    sort: SortOrder = typer.Option(SortOrder.DATE_DESC, "--sort", case_sensitive=False, help="Sort order"),
     save: bool = typer.Option(True, "--save/--no-save", help="Save results to database"),
     output: Optional[Path] = typer.Option(None, "--output", help="Export results to file (CSV/JSON)"),
 ):
@@ -69,67 +88,55 @@ def search(
         homehunt search "London" --type flat --furnished furnished --parking
         homehunt search "E14" --portals rightmove --radius 1.0
     """
-    # Parse property type
-    property_types = None
-    if property_type:
-        try:
-            prop_type_enum = PropertyType(property_type.lower())
-            property_types = [prop_type_enum]
-        except ValueError:
-            console.print(f"[red]Invalid property type: {property_type}[/red]")
-            console.print("Valid types: flat, house, studio, bungalow, maisonette")
-            raise typer.Exit(1)
-    
-    # Parse furnished status
-    try:
-        furnished_enum = FurnishedType(furnished.lower())
-    except ValueError:
-        console.print(f"[red]Invalid furnished status: {furnished}[/red]")
-        console.print("Valid options: furnished, unfurnished, part_furnished, any")
+    # Enum options are parsed by Typer; only the radius needs a lookup here
+    property_types = [property_type] if property_type else None
+    portal_list = _PORTAL_MAP[portals]
+    search_radius = _RADIUS_MAP.get(radius)
+    if search_radius is None:
+        console.print(f"[red]Invalid radius: {radius}[/red]")
+        console.print(f"Valid options: {', '.join(str(r) for r in _RADIUS_MAP)}")
         raise typer.Exit(1)
     
-    # Parse sort order
-    try:
-        sort_enum = SortOrder(sort.lower())
-    except ValueError:
-        console.print(f"[red]Invalid sort order: {sort}[/red]")
-        console.print("Valid options: price_asc, price_desc, date_desc, date_asc")
+    # Typer has already typed and range-checked the options, so only the
+    # checks it cannot express remain before building the config unvalidated
+    if len(location) < 2:
+        console.print("[red]Location must be at least 2 characters[/red]")
         raise typer.Exit(1)
-    
-    # Parse portals
-    portal_list = []
-    if portals.lower() == "all":
-        portal_list = [Portal.RIGHTMOVE, Portal.ZOOPLA]
-    elif portals.lower() == "rightmove":
-        portal_list = [Portal.RIGHTMOVE]
-    elif portals.lower() == "zoopla":
-        portal_list = [Portal.ZOOPLA]
-    else:
-        console.print(f"[red]Invalid portals: {portals}[/red]")
-        console.print("Valid options: rightmove, zoopla, all")
+    if min_price is not None and max_price is not None and max_price < min_price:
+        console.print("[red]--max-price must be greater than --min-price[/red]")
+        raise typer.Exit(1)
+    if min_bedrooms is not None and max_bedrooms is not None and max_bedrooms < min_bedrooms:
+        console.print("[red]--max-beds must be greater than --min-beds[/red]")
         raise typer.Exit(1)
     
-    # Create search config
-    config = SearchConfig(
-        portals=portal_list,
-        location=location,
-        radius=radius,
-        min_price=min_price,
-        max_price=max_price,
-        min_bedrooms=min_bedrooms,
-        max_bedrooms=max_bedrooms,
-        property_types=property_types,
-        furnished=furnished_enum,
-        parking=parking,
-        garden=garden,
-        pets_allowed=pets,
-        sort_order=sort_enum,
-        max_results=max_results,
-    )
+    # Create search config (HOMEHUNT_STRICT=1 runs full pydantic validation)
+    config_cls = SearchConfig if os.getenv("HOMEHUNT_STRICT") == "1" else SearchConfig.model_construct
+    try:
+        config = config_cls(
+            portals=portal_list,
+            location=location,
+            radius=search_radius,
+            min_price=min_price,
+            max_price=max_price,
+            min_bedrooms=min_bedrooms,
+            max_bedrooms=max_bedrooms,
+            property_types=property_types,
+            furnished=furnished,
+            parking=parking,
+            garden=garden,
+            pets_allowed=pets,
+            sort_order=sort,
+            max_results=max_results,
+        )
+    except ValidationError as e:
+        console.print(f"[red]Invalid search options: {e}[/red]")
+        raise typer.Exit(1)
     
     # Run search
+    from .search_command import search_properties
+    
     try:
-        asyncio.run(search_properties(config, save_to_db=save, output_file=output))
+        run_async(search_properties(config, save_to_db=save, output_file=output))
     except KeyboardInterrupt:
         console.print("\n[yellow]Search cancelled by user[/yellow]")
         raise typer.Exit(0)
@@ -141,54 +148,56 @@ def search(
 @app.command()
 def stats():
     """Show database statistics"""
+    from rich.table import Table
+
+    from homehunt.core.db import Database
+    
     async def show_stats():
-        db = Database()
-        stats = await db.get_statistics()
-        
-        # Overall stats
-        console.print("\n[bold cyan]HomeHunt Database Statistics[/bold cyan]\n")
-        console.print(f"Last updated: {stats.get('last_updated', 'Never')}")
-        console.print(f"Properties scraped in last 24h: {stats.get('recent_activity', 0)}")
-        
-        # Portal breakdown
-        portal_table = Table(title="\nProperties by Portal")
-        portal_table.add_column("Portal", style="cyan")
-        portal_table.add_column("Total", justify="right")
-        portal_table.add_column("With Price", justify="right")
-        portal_table.add_column("Avg Price", justify="right")
-        
-        for portal_stat in stats.get('portal_stats', []):
-            avg_price = portal_stat.get('avg_price')
-            avg_price_str = f"£{int(avg_price/100):,}" if avg_price else "N/A"
+        async with Database() as db:
+            stats = await db.get_statistics()
             
-            portal_table.add_row(
-                portal_stat['portal'],
-                str(portal_stat['total']),
-                str(portal_stat['with_price']),
-                avg_price_str
-            )
-        
-        console.print(portal_table)
-        
-        # Price statistics
-        price_stats = stats.get('price_stats', {})
-        if price_stats:
-            console.print("\n[bold]Price Range:[/bold]")
-            min_price = price_stats.get('min_price')
-            max_price = price_stats.get('max_price')
-            avg_price = price_stats.get('avg_price')
+            # Overall stats
+            console.print("\n[bold cyan]HomeHunt Database Statistics[/bold cyan]\n")
+            console.print(f"Last updated: {stats.get('last_updated', 'Never')}")
+            console.print(f"Properties scraped in last 24h: {stats.get('recent_activity', 0)}")
+            
+            # Portal breakdown
+            portal_table = Table(title="\nProperties by Portal")
+            portal_table.add_column("Portal", style="cyan")
+            portal_table.add_column("Total", justify="right")
+            portal_table.add_column("With Price", justify="right")
+            portal_table.add_column("Avg Price", justify="right")
             
-            if min_price:
-                console.print(f"  Minimum: £{int(min_price/100):,}/month")
-            if max_price:
-                console.print(f"  Maximum: £{int(max_price/100):,}/month")
-            if avg_price:
-                console.print(f"  Average: £{int(avg_price/100):,}/month")
-        
-        await db.close()
+            for portal_stat in stats.get('portal_stats', []):
+                avg_price = portal_stat.get('avg_price')
+                avg_price_str = f"£{int(avg_price/100):,}" if avg_price else "N/A"
+                
+                portal_table.add_row(
+                    portal_stat['portal'],
+                    str(portal_stat['total']),
+                    str(portal_stat['with_price']),
+                    avg_price_str
+                )
+            
+            console.print(portal_table)
+            
+            # Price statistics
+            price_stats = stats.get('price_stats', {})
+            if price_stats:
+                console.print("\n[bold]Price Range:[/bold]")
+                min_price = price_stats.get('min_price')
+                max_price = price_stats.get('max_price')
+                avg_price = price_stats.get('avg_price')
+                
+                if min_price:
+                    console.print(f"  Minimum: £{int(min_price/100):,}/month")
+                if max_price:
+                    console.print(f"  Maximum: £{int(max_price/100):,}/month")
+                if avg_price:
+                    console.print(f"  Average: £{int(avg_price/100):,}/month")
     
     try:
-        asyncio.run(show_stats())
+        run_async(show_stats())
     except Exception as e:
         console.print(f"[red]Error getting statistics: {e}[/red]")
         raise typer.Exit(1)
@@ -203,80 +212,104 @@ def list(
     portal: Optional[str] = typer.Option(None, "--portal", help="Filter by portal"),
 ):
     """List properties from database"""
+    from rich.table import Table
+
+    from homehunt.core.db import Database
+    
     async def list_properties():
-        db = Database()
-        
-        # Parse portal if provided
-        portal_enum = None
-        if portal:
-            try:
-                portal_enum = Portal(portal.lower())
-            except ValueError:
-                console.print(f"[red]Invalid portal: {portal}[/red]")
+        async with Database() as db:
+            # Parse portal if provided
+            portal_enum = None
+            if portal:
+                try:
+                    portal_enum = Portal(portal.lower())
+                except ValueError:
+                    console.print(f"[red]Invalid portal: {portal}[/red]")
+                    return
+            
+            # Convert prices to pence
+            min_price_pence = min_price * 100 if min_price else None
+            max_price_pence = max_price * 100 if max_price else None
+            
+            # Piped output gets plain tab-separated rows (URL included) rather
+            # than a Rich table and the interactive URL prompt
+            interactive = sys.stdout.isatty()
+            
+            # Create table; rows are added as properties stream in
+            table = Table()
+            table.add_column("Portal", style="cyan", width=10)
+            table.add_column("Price", justify="right", width=12)
+            table.add_column("Beds", justify="center", width=5)
+            table.add_column("Type", width=12)
+            table.add_column("Area", width=20)
+            table.add_column("Address", width=40)
+            table.add_column("Last Seen", width=10)
+            
+            # Stored timestamps are naive UTC, so compare against one naive UTC "now";
+            # the day boundaries are precomputed so recent rows need no subtraction
+            now = datetime.utcnow()
+            one_day_ago = now - timedelta(days=1)
+            two_days_ago = now - timedelta(days=2)
+            
+            # Only the URLs are kept for the optional listing below
+            urls = []
+            found = 0
+            
+            async for prop in db.iter_properties(
+                portal=portal_enum,
+                min_price=min_price_pence,
+                max_price=max_price_pence,
+                bedrooms=bedrooms,
+                limit=limit
+            ):
+                # Format price
+                price_str = prop.price or "N/A"
+                
+                # Format date
+                if prop.last_scraped > one_day_ago:
+                    last_seen = "Today"
+                elif prop.last_scraped > two_days_ago:
+                    last_seen = "Yesterday"
+                else:
+                    last_seen = f"{(now - prop.last_scraped).days}d ago"
+                
+                row = (
+                    prop.portal.value.title(),
+                    price_str,
+                    str(prop.bedrooms or "-"),
+                    prop.property_type.value if prop.property_type else "-",
+                    prop.area or "-",
+                    prop.address or "-",
+                    last_seen
+                )
+                found += 1
+                
+                if interactive:
+                    table.add_row(*row)
+                    urls.append(prop.url)
+                else:
+                    if found == 1:
+                        sys.stdout.write("\t".join(col.header for col in table.columns) + "\tURL\n")
+                    sys.stdout.write("\t".join(row) + f"\t{prop.url}\n")
+            
+            if not found:
+                console.print("[yellow]No properties found matching criteria[/yellow]")
                 return
-        
-        # Convert prices to pence
-        min_price_pence = min_price * 100 if min_price else None
-        max_price_pence = max_price * 100 if max_price else None
-        
-        # Search properties
-        properties = await db.search_properties(
-            portal=portal_enum,
-            min_price=min_price_pence,
-            max_price=max_price_pence,
-            bedrooms=bedrooms,
-            limit=limit
-        )
-        
-        if not properties:
-            console.print("[yellow]No properties found matching criteria[/yellow]")
-            return
-        
-        # Create table
-        table = Table(title=f"\nShowing {len(properties)} Properties")
-        table.add_column("Portal", style="cyan", width=10)
-        table.add_column("Price", justify="right", width=12)
-        table.add_column("Beds", justify="center", width=5)
-        table.add_column("Type", width=12)
-        table.add_column("Area", width=20)
-        table.add_column("Address", width=40)
-        table.add_column("Last Seen", width=10)
-        
-        for prop in properties:
-            # Format price
-            price_str = prop.price or "N/A"
             
-            # Format date
-            days_ago = (datetime.utcnow() - prop.last_scraped).days
-            if days_ago == 0:
-                last_seen = "Today"
-            elif days_ago == 1:
-                last_seen = "Yesterday"
-            else:
-                last_seen = f"{days_ago}d ago"
+            if not interactive:
+                return
             
-            table.add_row(
-                prop.portal.value.title(),
-                price_str,
-                str(prop.bedrooms or "-"),
-                prop.property_type.value if prop.property_type else "-",
-                prop.area or "-",
-                prop.address or "-",
-                last_seen
-            )
-        
-        console.print(table)
-        
-        # Show URLs if requested
-        if typer.confirm("\nShow property URLs?", default=False):
-            console.print("\n[bold]Property URLs:[/bold]")
-            for i, prop in enumerate(properties, 1):
-                console.print(f"{i}. {prop.url}")
-        
-        await db.close()
+            table.title = f"\nShowing {found} Properties"
+            console.print(table)
+            
+            # Show URLs if requested
+            if typer.confirm("\nShow property URLs?", default=False):
+                console.print("\n[bold]Property URLs:[/bold]")
+                for i, url in enumerate(urls, 1):
+                    console.print(f"{i}. {url}")
     
     try:
-        asyncio.run(list_properties())
+        run_async(list_properties())
     except Exception as e:
         console.print(f"[red]Error listing properties: {e}[/red]")
         raise typer.Exit(1)
@@ -285,13 +318,15 @@ def list(
 @app.command()
 def init():
     """Initialize the database"""
+    from homehunt.core.db import init_db
+    
     async def initialize():
         console.print("[cyan]Initializing HomeHunt database...[/cyan]")
         await init_db()
         console.print("[green]✓ Database initialized successfully![/green]")
     
     try:
-        asyncio.run(initialize())
+        run_async(initialize())
     except Exception as e:
         console.print(f"[red]Error initializing database: {e}[/red]")
         raise typer.Exit(1)
@@ -311,15 +346,16 @@ def cleanup(
             console.print("[yellow]Cleanup cancelled[/yellow]")
             raise typer.Exit(0)
     
+    from homehunt.core.db import Database
+    
     async def run_cleanup():
-        db = Database()
-        console.print(f"[cyan]Marking properties older than {days} days as inactive...[/cyan]")
-        await db.cleanup_old_data(days)
-        console.print("[green]✓ Cleanup completed![/green]")
-        await db.close()
+        async with Database() as db:
+            console.print(f"[cyan]Marking properties older than {days} days as inactive...[/cyan]")
+            await db.cleanup_old_data(days)
+            console.print("[green]✓ Cleanup completed![/green]")
     
     try:
-        asyncio.run(run_cleanup())
+        run_async(run_cleanup())
     except Exception as e:
         console.print(f"[red]Error during cleanup: {e}[/red]")
         raise typer.Exit(1)
@@ -342,109 +378,122 @@ def commute(
         homehunt commute "King's Cross Station" --transport cycling --max-time 20
         homehunt commute "EC2A 1AA" --update-all --departure 09:00
     """
+    from rich.table import Table
+
+    from homehunt.core.db import Database
+    from homehunt.traveltime.client import get_traveltime_client
+    from homehunt.traveltime.service import TravelTimeService
+    
     async def analyze_commutes():
         # Initialize services
-        db = Database()
-        
-        try:
-            traveltime_client = TravelTimeClient()
-        except ValueError as e:
-            console.print(f"[red]TravelTime API error: {e}[/red]")
-            console.print("Please set TRAVELTIME_APP_ID and TRAVELTIME_API_KEY environment variables")
-            return
-        
-        traveltime_service = TravelTimeService(db, traveltime_client)
-        
-        # Validate transport mode
-        valid_modes = ["public_transport", "cycling", "walking", "driving"]
-        if transport not in valid_modes:
-            console.print(f"[red]Invalid transport mode: {transport}[/red]")
-            console.print(f"Valid options: {', '.join(valid_modes)}")
-            return
-        
-        # Get properties from database
-        if update_all:
-            properties = await db.search_properties(limit=1000)  # Get all properties
-        else:
-            properties = await db.search_properties(limit=limit)
-        
-        if not properties:
-            console.print("[yellow]No properties found in database[/yellow]")
-            console.print("Run a search first: homehunt search \"your location\"")
-            return
-        
-        console.print(f"[cyan]Found {len(properties)} properties to analyze[/cyan]")
-        
-        # Analyze commute times
-        transport_modes = [transport] if not update_all else ["public_transport", "cycling"]
-        commute_results = await traveltime_service.analyze_property_commutes(
-            properties=properties,
-            destination_address=destination,
-            transport_modes=transport_modes,
-            departure_time=departure_time
-        )
-        
-        # Filter properties by max commute time
-        filtered_properties = await traveltime_service.filter_by_commute(
-            properties=properties,
-            max_commute_time=max_time,
-            transport_mode=transport
-        )
-        
-        if not filtered_properties:
-            console.print(f"[yellow]No properties found within {max_time} minutes by {transport}[/yellow]")
-            return
-        
-        # Display results
-        console.print(f"\n[green]Found {len(filtered_properties)} properties within {max_time} minutes[/green]")
-        
-        # Create results table
-        table = Table(title=f"\nProperties within {max_time}min by {transport.replace('_', ' ')}")
-        table.add_column("Portal", style="cyan", width=10)
-        table.add_column("Price", justify="right", width=12)
-        table.add_column("Beds", justify="center", width=5)
-        table.add_column("Area", width=20)
-        table.add_column("Commute", justify="right", width=10)
-        table.add_column("Address", width=40)
-        
-        # Sort by commute time
-        sorted_properties = sorted(
-            filtered_properties,
-            key=lambda p: getattr(p, f"commute_{transport}") or 999
-        )
-        
-        for prop in sorted_properties[:20]:  # Show top 20
-            commute_time = getattr(prop, f"commute_{transport}")
-            commute_str = f"{commute_time}min" if commute_time else "N/A"
+        async with Database() as db:
+            try:
+                traveltime_client = get_traveltime_client()
+            except ValueError as e:
+                console.print(f"[red]TravelTime API error: {e}[/red]")
+                console.print("Please set TRAVELTIME_APP_ID and TRAVELTIME_API_KEY environment variables")
+                return
+            
+            # The client keeps connections alive across commands; close it on exit
+            add_cleanup(traveltime_client.aclose)
+            traveltime_service = TravelTimeService(db, traveltime_client)
+            
+            # Validate transport mode
+            valid_modes = ["public_transport", "cycling", "walking", "driving"]
+            if transport not in valid_modes:
+                console.print(f"[red]Invalid transport mode: {transport}[/red]")
+                console.print(f"Valid options: {', '.join(valid_modes)}")
+                return
+            
+            # Get properties from database
+            if update_all:
+                properties = await db.search_properties(limit=1000)  # Get all properties
+            else:
+                properties = await db.search_properties(limit=limit)
+            
+            if not properties:
+                console.print("[yellow]No properties found in database[/yellow]")
+                console.print("Run a search first: homehunt search \"your location\"")
+                return
+            
+            console.print(f"[cyan]Found {len(properties)} properties to analyze[/cyan]")
             
-            table.add_row(
-                prop.portal.value.title(),
-                prop.price or "N/A",
-                str(prop.bedrooms or "-"),
-                prop.area or "-",
-                commute_str,
-                (prop.address or "-")[:40]
+            # Analyze commute times
+            transport_modes = [transport] if not update_all else ["public_transport", "cycling"]
+            commute_results = await traveltime_service.analyze_property_commutes(
+                properties=properties,
+                destination_address=destination,
+                transport_modes=transport_modes,
+                departure_time=departure_time,
+                max_concurrent=COMMUTE_CONCURRENCY,
             )
-        
-        console.print(table)
-        
-        # Show commute statistics
-        stats = await traveltime_service.get_commute_statistics(
-            filtered_properties, [transport]
-        )
-        
-        mode_stats = stats.get(transport, {})
-        if mode_stats.get("count", 0) > 0:
-            console.print(f"\n[bold]Commute Statistics ({transport.replace('_', ' ')}):[/bold]")
-            console.print(f"  Properties analyzed: {mode_stats['count']}")
-            console.print(f"  Shortest commute: {mode_stats['min']}min")
-            console.print(f"  Longest commute: {mode_stats['max']}min")
-            console.print(f"  Average commute: {mode_stats['avg']:.1f}min")
-        
-        await db.close()
+            
+            # Fold the fresh results into the listings and filter by max
+            # commute time in a single pass, collecting times for the stats
+            results_by_uid = {r.property_id: r for r in commute_results if r.success}
+            commute_field = f"commute_{transport}"
+            get_commute = attrgetter(commute_field)
+            filtered_properties = []
+            commute_times = []
+            for prop in properties:
+                result = results_by_uid.get(prop.uid)
+                if result is not None and getattr(result, transport) is not None:
+                    setattr(prop, commute_field, getattr(result, transport))
+                
+                commute_time = get_commute(prop)
+                if commute_time is not None and commute_time <= max_time:
+                    filtered_properties.append(prop)
+                    if commute_time:
+                        commute_times.append(commute_time)
+            
+            if not filtered_properties:
+                console.print(f"[yellow]No properties found within {max_time} minutes by {transport}[/yellow]")
+                return
+            
+            # Display results
+            console.print(f"\n[green]Found {len(filtered_properties)} properties within {max_time} minutes[/green]")
+            
+            # Create results table
+            table = Table(title=f"\nProperties within {max_time}min by {transport.replace('_', ' ')}")
+            table.add_column("Portal", style="cyan", width=10)
+            table.add_column("Price", justify="right", width=12)
+            table.add_column("Beds", justify="center", width=5)
+            table.add_column("Area", width=20)
+            table.add_column("Commute", justify="right", width=10)
+            table.add_column("Address", width=40)
+            
+            # Select the shortest commutes without sorting the whole list
+            top_properties = heapq.nsmallest(
+                COMMUTE_TABLE_ROWS,
+                filtered_properties,
+                key=lambda p: get_commute(p) or 999
+            )
+            
+            for prop in top_properties:
+                commute_time = get_commute(prop)
+                commute_str = f"{commute_time}min" if commute_time else "N/A"
+                
+                table.add_row(
+                    prop.portal.value.title(),
+                    prop.price or "N/A",
+                    str(prop.bedrooms or "-"),
+                    prop.area or "-",
+                    commute_str,
+                    (prop.address or "-")[:40]
+                )
+            
+            console.print(table)
+            
+            # Show commute statistics
+            if commute_times:
+                console.print(f"\n[bold]Commute Statistics ({transport.replace('_', ' ')}):[/bold]")
+                console.print(f"  Properties analyzed: {len(commute_times)}")
+                console.print(f"  Shortest commute: {min(commute_times)}min")
+                console.print(f"  Longest commute: {max(commute_times)}min")
+                console.print(f"  Average commute: {sum(commute_times) / len(commute_times):.1f}min")
     
     try:
-        asyncio.run(analyze_commutes())
+        run_async(analyze_commutes())
     except KeyboardInterrupt:
         console.print("\n[yellow]Commute analysis cancelled by user[/yellow]")
         raise typer.Exit(0)
@@ -463,6 +512,7 @@ app.command(name="show-config")(show_config)
 app.command(name="export-csv")(export_csv)
 app.command(name="export-json")(export_json)
 app.command(name="export-sheets")(export_sheets)
+app.command(name="export-all")(export_all)
 app.command(name="export-status")(export_status)
 app.command(name="export-templates")(list_export_templates)
 app.command(name="test-sheets")(test_sheets_connection)
@@ -5,9 +5,10 @@ Defines all available search parameters and filters
 
 from datetime import date
 from enum import Enum
+from operator import attrgetter
 from typing import List, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from homehunt.core.models import Portal, PropertyType
 
@@ -38,6 +39,14 @@ class LetType(str, Enum):
     ANY = "any"
 
 
+class PortalSet(str, Enum):
+    """Portal selection options for the search command"""
+    
+    ALL = "all"
+    RIGHTMOVE = "rightmove"
+    ZOOPLA = "zoopla"
+
+
 class SearchRadius(float, Enum):
     """Search radius options in miles"""
     
@@ -59,6 +68,10 @@ class SearchConfig(BaseModel):
     Supports both Rightmove and Zoopla parameters
     """
     
+    # Build the validation schema on first use rather than at import, so CLI
+    # commands that never construct a config skip the cost
+    model_config = ConfigDict(defer_build=True)
+    
     # Portal selection
     portals: List[Portal] = Field(
         default=[Portal.RIGHTMOVE, Portal.ZOOPLA],
@@ -216,25 +229,28 @@ class SearchConfig(BaseModel):
         """Convert to dictionary for URL building"""
         data = self.model_dump(exclude_none=True)
         
-        # Convert enums to strings
-        if 'portals' in data:
-            data['portals'] = [p.value for p in data['portals']]
-        if 'property_types' in data:
-            data['property_types'] = [pt.value for pt in data['property_types']]
-        if 'furnished' in data:
-            data['furnished'] = data['furnished'].value
-        if 'let_type' in data:
-            data['let_type'] = data['let_type'].value
-        if 'sort_order' in data:
-            data['sort_order'] = data['sort_order'].value
-        if 'radius' in data:
-            data['radius'] = float(data['radius'])
-        
-        # Convert date to string
-        if 'available_from' in data:
-            data['available_from'] = data['available_from'].isoformat()
-            
-        return data
+        # Convert enums, radius and dates to plain values
+        return {
+            key: _TO_DICT_SERIALIZERS[key](value) if key in _TO_DICT_SERIALIZERS else value
+            for key, value in data.items()
+        }
+
+
+_enum_value = attrgetter('value')
+
+# Per-field conversions applied by SearchConfig.to_dict
+_TO_DICT_SERIALIZERS = {
+    'portals': lambda portals: [p.value for p in portals],
+    'property_types': lambda types: [pt.value for pt in types],
+    'furnished': _enum_value,
+    'let_type': _enum_value,
+    'sort_order': _enum_value,
+    'radius': float,
+    'available_from': date.isoformat,
+}
+
+# Allowed commute transport modes, shared by the field validators
+TRANSPORT_MODES = frozenset({"public_transport", "cycling", "walking", "driving"})
 
 
 class CommuteConfig(BaseModel):
@@ -243,6 +259,8 @@ class CommuteConfig(BaseModel):
     Used after property search to filter by commute times
     """
     
+    model_config = ConfigDict(defer_build=True)
+    
     destination: str = Field(
         ...,
         description="Commute destination (address or postcode)",
@@ -269,10 +287,11 @@ class CommuteConfig(BaseModel):
     @field_validator('transport_modes')
     def validate_transport_modes(cls, v):
         """Validate transport modes"""
-        valid_modes = {"public_transport", "cycling", "walking", "driving"}
         for mode in v:
-            if mode not in valid_modes:
-                raise ValueError(f"Invalid transport mode: {mode}. Must be one of {valid_modes}")
+            if mode not in TRANSPORT_MODES:
+                raise ValueError(
+                    f"Invalid transport mode: {mode}. Must be one of {sorted(TRANSPORT_MODES)}"
+                )
         return v
     
     @field_validator('departure_time')
@@ -3,32 +3,36 @@ CLI commands for configuration-driven searches
 Handles running searches from YAML/JSON config files
 """
 
-import asyncio
+import sys
+from collections import Counter
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 import typer
-from rich import print
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
-from homehunt.config.executor import ConfigExecutor, ConfigExecutorError
-from homehunt.config.manager import ConfigManager, ConfigManagerError
-from homehunt.config.models import AdvancedSearchConfig, SavedSearchProfile
-from homehunt.config.parser import ConfigParser, ConfigParserError
-from homehunt.core.db import Database
-from homehunt.core.models import PropertyListing
+from .runner import run_async
 
-from .search_command import search_properties
+# The config/search stack is imported inside each command so that building the
+# CLI (e.g. ``homehunt --help``) does not load it
+if TYPE_CHECKING:
+    from homehunt.config.models import AdvancedSearchConfig, SavedSearchProfile
+    from homehunt.core.models import PropertyListing
 
 console = Console()
 
+# Strips currency symbol, thousands separators and spaces from price strings
+_PRICE_TRANS = str.maketrans("", "", "£, ")
+
+_get_portal = attrgetter("portal")
+
 
 async def run_config_search(
-    config: AdvancedSearchConfig,
+    config: "AdvancedSearchConfig",
     profile_names: Optional[List[str]] = None,
-    dry_run: bool = False
+    dry_run: bool = False,
+    config_path: Optional[Path] = None
 ) -> None:
     """
     Execute searches based on configuration
@@ -37,11 +41,14 @@ async def run_config_search(
         config: Advanced search configuration
         profile_names: Specific profile names to run (all if None)
         dry_run: If True, show what would be done without executing
+        config_path: Configuration file the profile run metadata is recorded for
     """
+    from homehunt.config.executor import ConfigExecutor, ConfigExecutorError
+    
     console.print(f"\\n[cyan]Executing configuration: {config.name or 'Unnamed'}[/cyan]")
     
     try:
-        executor = ConfigExecutor(config)
+        executor = ConfigExecutor(config, config_path)
         properties = await executor.execute(profile_names, dry_run)
         
         if not dry_run and properties:
@@ -53,38 +60,52 @@ async def run_config_search(
         raise
 
 
-def show_search_summary(properties: List[PropertyListing], profiles: List[SavedSearchProfile]) -> None:
+def show_search_summary(properties: List["PropertyListing"], profiles: List["SavedSearchProfile"]) -> None:
     """Show summary of search results"""
-    # Profile summary
-    table = Table(title="Search Results Summary")
-    table.add_column("Metric", style="cyan")
-    table.add_column("Value", style="white")
+    rows = [
+        ("Profiles executed", str(len(profiles))),
+        ("Total properties", str(len(properties))),
+    ]
     
-    table.add_row("Profiles executed", str(len(profiles)))
-    table.add_row("Total properties", str(len(properties)))
-    
-    # Property breakdown by portal
-    portal_counts = {}
-    for prop in properties:
-        portal = prop.portal.value
-        portal_counts[portal] = portal_counts.get(portal, 0) + 1
+    # Property breakdown by portal; count the enum members and read each
+    # member's value once rather than once per property
+    portal_counts = Counter(map(_get_portal, properties))
     
     for portal, count in portal_counts.items():
-        table.add_row(f"{portal.title()} properties", str(count))
+        rows.append((f"{portal.value.title()} properties", str(count)))
     
-    # Price statistics
-    prices = []
+    # Price statistics in a single pass
+    count, total = 0, 0.0
+    low, high = float("inf"), float("-inf")
     for prop in properties:
-        if prop.price:
-            try:
-                price_value = float(prop.price.replace('£', '').replace(',', '').replace(' pcm', ''))
-                prices.append(price_value)
-            except (ValueError, AttributeError):
-                pass
+        if not prop.price:
+            continue
+        try:
+            price_value = float(prop.price.translate(_PRICE_TRANS).removesuffix("pcm"))
+        except (ValueError, AttributeError):
+            continue
+        count += 1
+        total += price_value
+        low = min(low, price_value)
+        high = max(high, price_value)
+    
+    if count:
+        rows.append(("Average price", f"£{total / count:,.0f}"))
+        rows.append(("Price range", f"£{low:,.0f} - £{high:,.0f}"))
+    
+    # Piped output gets plain tab-separated rows in one write
+    if not sys.stdout.isatty():
+        sys.stdout.write("".join(f"{metric}\t{value}\n" for metric, value in rows))
+        return
+    
+    from rich.table import Table
     
-    if prices:
-        table.add_row("Average price", f"£{sum(prices) / len(prices):,.0f}")
-        table.add_row("Price range", f"£{min(prices):,.0f} - £{max(prices):,.0f}")
+    table = Table(title="Search Results Summary")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="white")
+    
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
 
@@ -104,10 +125,17 @@ def run_config(
         homehunt run-config config.yaml --profile family_homes --profile budget_flats
         homehunt run-config config.yaml --dry-run
     """
+    from homehunt.config.manager import ConfigManagerError, get_config_manager
+    from homehunt.config.parser import ConfigParser, ConfigParserError
+    
     try:
-        # Validate configuration
-        config_manager = ConfigManager()
-        errors = config_manager.validate_config(config_file)
+        # Parse once, then validate the parsed configuration
+        config_manager = get_config_manager()
+        try:
+            config = ConfigParser.parse_config_cached(config_file)
+            errors = config_manager.validate_model(config)
+        except ConfigParserError as e:
+            errors = [str(e)]
         
         if errors:
             console.print(f"[red]Configuration validation failed:[/red]")
@@ -119,10 +147,8 @@ def run_config(
             console.print("[green]✓ Configuration is valid[/green]")
             return
         
-        # Load and execute configuration
-        config = ConfigParser.parse_config(config_file)
-        
-        asyncio.run(run_config_search(config, profiles, dry_run))
+        # Execute configuration
+        run_async(run_config_search(config, profiles, dry_run, config_file))
         
     except (ConfigParserError, ConfigManagerError) as e:
         console.print(f"[red]Configuration error: {e}[/red]")
@@ -149,8 +175,11 @@ def init_config(
         homehunt init-config
         homehunt init-config --output my-config.yaml
     """
+    from homehunt.config.manager import get_config_manager
+    from homehunt.config.parser import ConfigParser
+    
     try:
-        config_manager = ConfigManager()
+        config_manager = get_config_manager()
         
         if output is None:
             # Use default location
@@ -174,10 +203,26 @@ def init_config(
         raise typer.Exit(1)
 
 
-def list_configs():
-    """List available configuration files"""
+def list_configs(
+    detail: bool = typer.Option(False, "--detail", help="Parse each file to show its profiles"),
+):
+    """
+    List available configuration files
+    
+    Only file names and modification times are shown by default; use
+    --detail to load each configuration and list its profiles.
+    
+    Examples:
+        homehunt list-configs
+        homehunt list-configs --detail
+    """
+    from datetime import datetime
+    
+    from homehunt.config.manager import get_config_manager
+    from homehunt.config.parser import ConfigParser
+    
     try:
-        config_manager = ConfigManager()
+        config_manager = get_config_manager()
         config_files = config_manager.list_config_files()
         
         if not config_files:
@@ -188,11 +233,15 @@ def list_configs():
         console.print(f"\\n[cyan]Found {len(config_files)} configuration file(s):[/cyan]")
         
         for config_file in config_files:
-            console.print(f"  • {config_file}")
+            modified = datetime.fromtimestamp(config_file.stat().st_mtime)
+            console.print(f"  • {config_file} [dim](modified {modified:%Y-%m-%d %H:%M})[/dim]")
+            
+            if not detail:
+                continue
             
-            # Try to show basic info
+            # Show basic info, reusing the parser's sidecar cache where fresh
             try:
-                config = ConfigParser.parse_config(config_file)
+                config = ConfigParser.parse_config_cached(config_file, copy=False)
                 console.print(f"    {len(config.profiles)} profile(s): {', '.join(p.name for p in config.profiles[:3])}")
                 if len(config.profiles) > 3:
                     console.print(f"    ... and {len(config.profiles) - 3} more")
@@ -214,8 +263,11 @@ def show_config(
         homehunt show-config
         homehunt show-config my-config.yaml
     """
+    from homehunt.config.manager import ConfigManagerError, get_config_manager
+    from homehunt.config.parser import ConfigParserError
+    
     try:
-        config_manager = ConfigManager()
+        config_manager = get_config_manager()
         
         if config_file is None:
             config_file = config_manager.default_config_file
@@ -3,24 +3,135 @@ CLI commands for export and sync operations
 Handles exporting property data to various formats including Google Sheets
 """
 
-import asyncio
+import functools
+import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 import typer
-from rich import print
 from rich.console import Console
-from rich.table import Table
 
-from homehunt.core.db import Database
-from homehunt.exports.models import ExportConfig, ExportFormat, GoogleSheetsConfig
-from homehunt.exports.service import ExportService, ExportServiceError
+from .runner import run_async
+
+# The database and export stack are imported inside each command so that
+# building the CLI (e.g. ``homehunt --help``) does not load them
+if TYPE_CHECKING:
+    from homehunt.exports.models import ExportConfig, ExportFormat, ExportResult
 
 console = Console()
 
 
+@functools.lru_cache(maxsize=32)
+def _build_export_config(
+    format: "ExportFormat",
+    output: Optional[Path],
+    include_fields: Optional[Tuple[str, ...]],
+    exclude_fields: Optional[Tuple[str, ...]],
+    portal_filter: Optional[Tuple[str, ...]],
+    min_price: Optional[float],
+    max_price: Optional[float],
+    spreadsheet_id: Optional[str],
+    service_account: Optional[Path],
+    sheet_name: str,
+    clear_existing: bool,
+    share_emails: Optional[Tuple[str, ...]],
+) -> "ExportConfig":
+    """
+    Build and validate an export configuration
+    
+    Cached on the (hashable) CLI options so repeated exports with the same
+    filters skip model validation; callers get a copy via build_export_config.
+    """
+    from homehunt.exports.models import ExportConfig, ExportFormat, GoogleSheetsConfig
+    
+    config_kwargs = {
+        "format": format,
+        "include_fields": include_fields and list(include_fields),
+        "exclude_fields": exclude_fields and list(exclude_fields),
+        "portal_filter": portal_filter and list(portal_filter),
+    }
+    
+    # Add price range if specified
+    if min_price is not None or max_price is not None:
+        price_range = {}
+        if min_price is not None:
+            price_range["min"] = min_price
+        if max_price is not None:
+            price_range["max"] = max_price
+        config_kwargs["price_range"] = price_range
+    
+    # Format-specific configuration
+    if format in [ExportFormat.CSV, ExportFormat.JSON]:
+        if not output:
+            # Generate default filename
+            timestamp = "properties"
+            extension = format.value
+            output = Path(f"./exports/{timestamp}.{extension}")
+        
+        config_kwargs["output_path"] = output
+        
+    elif format == ExportFormat.GOOGLE_SHEETS:
+        # Allow using application default credentials if neither service_account nor spreadsheet_id provided
+        sheets_config_kwargs = {
+            "sheet_name": sheet_name,
+            "include_headers": True,
+            "clear_existing": clear_existing,
+            "append_mode": not clear_existing,
+        }
+        
+        if service_account:
+            sheets_config_kwargs["service_account_file"] = service_account
+        
+        if spreadsheet_id:
+            sheets_config_kwargs["spreadsheet_id"] = spreadsheet_id
+        
+        if share_emails:
+            sheets_config_kwargs["share_with_emails"] = list(share_emails)
+            sheets_config_kwargs["share_type"] = "reader"
+        
+        config_kwargs["google_sheets"] = GoogleSheetsConfig(**sheets_config_kwargs)
+    
+    return ExportConfig(**config_kwargs)
+
+
+def build_export_config(
+    format: "ExportFormat",
+    output: Optional[Path] = None,
+    spreadsheet_id: Optional[str] = None,
+    service_account: Optional[Path] = None,
+    sheet_name: str = "Properties",
+    include_fields: Optional[List[str]] = None,
+    exclude_fields: Optional[List[str]] = None,
+    portal_filter: Optional[List[str]] = None,
+    min_price: Optional[float] = None,
+    max_price: Optional[float] = None,
+    clear_existing: bool = False,
+    share_emails: Optional[List[str]] = None,
+) -> "ExportConfig":
+    """Get a (cached) export configuration for the given CLI options"""
+    def freeze(values: Optional[List[str]]) -> Optional[Tuple[str, ...]]:
+        return tuple(values) if values is not None else None
+    
+    config = _build_export_config(
+        format,
+        output,
+        freeze(include_fields),
+        freeze(exclude_fields),
+        freeze(portal_filter),
+        min_price,
+        max_price,
+        spreadsheet_id,
+        service_account,
+        sheet_name,
+        clear_existing,
+        freeze(share_emails),
+    )
+    # Hand out a copy so callers cannot mutate the cached instance
+    return config.model_copy(deep=True)
+
+
 async def run_export_operation(
-    format: ExportFormat,
+    format: "ExportFormat",
     output: Optional[Path] = None,
     spreadsheet_id: Optional[str] = None,
     service_account: Optional[Path] = None,
@@ -34,81 +145,66 @@ async def run_export_operation(
     share_emails: Optional[List[str]] = None,
 ) -> None:
     """Execute export operation"""
+    from homehunt.core.db import Database
+    from homehunt.exports.service import ExportService, ExportServiceError
     
     db = Database()
     export_service = ExportService(db)
     
     try:
         # Build export configuration
-        config_kwargs = {
-            "format": format,
-            "include_fields": include_fields,
-            "exclude_fields": exclude_fields,
-            "portal_filter": portal_filter,
-        }
-        
-        # Add price range if specified
-        if min_price is not None or max_price is not None:
-            price_range = {}
-            if min_price is not None:
-                price_range["min"] = min_price
-            if max_price is not None:
-                price_range["max"] = max_price
-            config_kwargs["price_range"] = price_range
-        
-        # Format-specific configuration
-        if format in [ExportFormat.CSV, ExportFormat.JSON]:
-            if not output:
-                # Generate default filename
-                timestamp = "properties"
-                extension = format.value
-                output = Path(f"./exports/{timestamp}.{extension}")
-            
-            config_kwargs["output_path"] = output
-            
-        elif format == ExportFormat.GOOGLE_SHEETS:
-            # Allow using application default credentials if neither service_account nor spreadsheet_id provided
-            pass
-            
-            # Build Google Sheets config
-            sheets_config_kwargs = {
-                "sheet_name": sheet_name,
-                "include_headers": True,
-                "clear_existing": clear_existing,
-                "append_mode": not clear_existing,
-            }
-            
-            if service_account:
-                sheets_config_kwargs["service_account_file"] = service_account
-            
-            if spreadsheet_id:
-                sheets_config_kwargs["spreadsheet_id"] = spreadsheet_id
-            
-            if share_emails:
-                sheets_config_kwargs["share_with_emails"] = share_emails
-                sheets_config_kwargs["share_type"] = "reader"
-            
-            config_kwargs["google_sheets"] = GoogleSheetsConfig(**sheets_config_kwargs)
-        
-        # Create export configuration
-        export_config = ExportConfig(**config_kwargs)
+        export_config = build_export_config(
+            format,
+            output=output,
+            spreadsheet_id=spreadsheet_id,
+            service_account=service_account,
+            sheet_name=sheet_name,
+            include_fields=include_fields,
+            exclude_fields=exclude_fields,
+            portal_filter=portal_filter,
+            min_price=min_price,
+            max_price=max_price,
+            clear_existing=clear_existing,
+            share_emails=share_emails,
+        )
         
         # Execute export
         console.print(f"[cyan]Starting {format.value} export...[/cyan]")
         
         result = await export_service.export_properties(export_config)
+        show_export_result(result)
+            
+    except ExportServiceError as e:
+        console.print(f"[red]Export error: {e}[/red]")
+    except Exception as e:
+        console.print(f"[red]Unexpected error: {e}[/red]")
+    finally:
+        await db.close()
+
+
+async def run_export_all(formats: List["ExportFormat"], output_dir: Optional[Path] = None, **options) -> None:
+    """Execute several exports against one database fetch"""
+    from homehunt.core.db import Database
+    from homehunt.exports.service import ExportService, ExportServiceError
+    
+    db = Database()
+    export_service = ExportService(db)
+    
+    try:
+        configs = [
+            build_export_config(
+                format,
+                output=output_dir / f"properties.{format.value}" if output_dir else None,
+                **options,
+            )
+            for format in formats
+        ]
         
-        if result.success:
-            console.print(f"[green]✓ Export completed successfully![/green]")
-            console.print(f"  Properties exported: {result.properties_exported}")
-            if result.output_location:
-                console.print(f"  Output location: {result.output_location}")
-            if result.duration_seconds:
-                console.print(f"  Duration: {result.duration_seconds:.2f} seconds")
-            if result.file_size_bytes:
-                console.print(f"  File size: {result.file_size_bytes:,} bytes")
-        else:
-            console.print(f"[red]✗ Export failed: {result.error_message}[/red]")
+        console.print(f"[cyan]Starting {', '.join(f.value for f in formats)} exports...[/cyan]")
+        
+        for result in await export_service.export_all(configs):
+            console.print(f"\n[bold]{result.format.value}[/bold]")
+            show_export_result(result)
             
     except ExportServiceError as e:
         console.print(f"[red]Export error: {e}[/red]")
@@ -118,6 +214,21 @@ async def run_export_operation(
         await db.close()
 
 
+def show_export_result(result: "ExportResult") -> None:
+    """Print the outcome of a single export"""
+    if result.success:
+        console.print(f"[green]✓ Export completed successfully![/green]")
+        console.print(f"  Properties exported: {result.properties_exported}")
+        if result.output_location:
+            console.print(f"  Output location: {result.output_location}")
+        if result.duration_seconds:
+            console.print(f"  Duration: {result.duration_seconds:.2f} seconds")
+        if result.file_size_bytes:
+            console.print(f"  File size: {result.file_size_bytes:,} bytes")
+    else:
+        console.print(f"[red]✗ Export failed: {result.error_message}[/red]")
+
+
 def export_csv(
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output CSV file path"),
     include_fields: Optional[List[str]] = typer.Option(None, "--include", help="Fields to include"),
@@ -134,7 +245,9 @@ def export_csv(
         homehunt export-csv --include title,price,bedrooms,area
         homehunt export-csv --portal rightmove --min-price 1000 --max-price 3000
     """
-    asyncio.run(run_export_operation(
+    from homehunt.exports.models import ExportFormat
+    
+    run_async(run_export_operation(
         format=ExportFormat.CSV,
         output=output,
         include_fields=include_fields,
@@ -160,7 +273,9 @@ def export_json(
         homehunt export-json --output properties.json
         homehunt export-json --include title,price,bedrooms --portal zoopla
     """
-    asyncio.run(run_export_operation(
+    from homehunt.exports.models import ExportFormat
+    
+    run_async(run_export_operation(
         format=ExportFormat.JSON,
         output=output,
         include_fields=include_fields,
@@ -191,7 +306,9 @@ def export_sheets(
         homehunt export-sheets --spreadsheet-id 1ABC... --sheet-name "New Properties"
         homehunt export-sheets --service-account creds.json --share user@example.com --clear
     """
-    asyncio.run(run_export_operation(
+    from homehunt.exports.models import ExportFormat
+    
+    run_async(run_export_operation(
         format=ExportFormat.GOOGLE_SHEETS,
         spreadsheet_id=spreadsheet_id,
         service_account=service_account,
@@ -206,8 +323,56 @@ def export_sheets(
     ))
 
 
+def export_all(
+    formats: List[str] = typer.Option(["csv", "json"], "--format", "-f", help="Formats to export (csv, json, google_sheets)"),
+    output_dir: Optional[Path] = typer.Option(None, "--output-dir", "-o", help="Directory for CSV/JSON files"),
+    spreadsheet_id: Optional[str] = typer.Option(None, "--spreadsheet-id", help="Google Sheets spreadsheet ID"),
+    service_account: Optional[Path] = typer.Option(None, "--service-account", help="Service account JSON file"),
+    sheet_name: str = typer.Option("Properties", "--sheet-name", help="Name of the sheet"),
+    include_fields: Optional[List[str]] = typer.Option(None, "--include", help="Fields to include"),
+    exclude_fields: Optional[List[str]] = typer.Option(None, "--exclude", help="Fields to exclude"),
+    portal: Optional[List[str]] = typer.Option(None, "--portal", help="Filter by portal(s)"),
+    min_price: Optional[float] = typer.Option(None, "--min-price", help="Minimum price filter"),
+    max_price: Optional[float] = typer.Option(None, "--max-price", help="Maximum price filter"),
+):
+    """
+    Export properties to several formats at once
+    
+    Properties are loaded from the database once and every format is written
+    concurrently.
+    
+    Examples:
+        homehunt export-all
+        homehunt export-all --format csv --format google_sheets --service-account creds.json
+        homehunt export-all --output-dir ./exports/today --portal rightmove
+    """
+    from homehunt.exports.models import ExportFormat
+    
+    try:
+        export_formats = [ExportFormat(f.lower()) for f in dict.fromkeys(formats)]
+    except ValueError as e:
+        console.print(f"[red]Invalid export format: {e}[/red]")
+        raise typer.Exit(1)
+    
+    run_async(run_export_all(
+        export_formats,
+        output_dir=output_dir,
+        spreadsheet_id=spreadsheet_id,
+        service_account=service_account,
+        sheet_name=sheet_name,
+        include_fields=include_fields,
+        exclude_fields=exclude_fields,
+        portal_filter=portal,
+        min_price=min_price,
+        max_price=max_price,
+    ))
+
+
 def list_export_templates():
     """List available export templates"""
+    from homehunt.core.db import Database
+    from homehunt.exports.service import ExportService
+    
     async def show_templates():
         db = Database()
         export_service = ExportService(db)
@@ -244,47 +409,64 @@ def list_export_templates():
         finally:
             await db.close()
     
-    asyncio.run(show_templates())
+    run_async(show_templates())
 
 
 def export_status():
     """Show export and database status"""
+    from rich.table import Table
+
+    from homehunt.core.db import Database
+    
     async def show_status():
         db = Database()
         
         try:
             # Get database statistics
-            stats = await db.get_statistics()
+            stats = await db.get_statistics_cached()
             
             console.print("\\n[bold cyan]HomeHunt Export Status[/bold cyan]\\n")
             
-            # Database stats table
-            stats_table = Table(title="Database Statistics")
-            stats_table.add_column("Metric", style="cyan")
-            stats_table.add_column("Value", style="white")
-            
             total_properties = sum(portal_stat.get('total', 0) for portal_stat in stats.get('portal_stats', []))
-            stats_table.add_row("Total Properties", str(total_properties))
-            stats_table.add_row("Last Updated", stats.get('last_updated', 'Never'))
-            stats_table.add_row("Recent Activity (24h)", str(stats.get('recent_activity', 0)))
-            
-            console.print(stats_table)
+            stats_rows = [
+                ("Total Properties", str(total_properties)),
+                ("Last Updated", stats.get('last_updated', 'Never')),
+                ("Recent Activity (24h)", str(stats.get('recent_activity', 0))),
+            ]
+            portal_rows = [
+                (portal_stat['portal'].title(), str(portal_stat['total']), str(portal_stat['with_price']))
+                for portal_stat in stats.get('portal_stats', [])
+            ]
             
-            # Portal breakdown
-            if stats.get('portal_stats'):
-                portal_table = Table(title="\\nPortal Breakdown")
-                portal_table.add_column("Portal", style="cyan")
-                portal_table.add_column("Properties", justify="right")
-                portal_table.add_column("With Price", justify="right")
+            if not sys.stdout.isatty():
+                # Piped output gets plain tab-separated rows in one write
+                lines = [f"{metric}\t{value}\n" for metric, value in stats_rows]
+                if portal_rows:
+                    lines.append("Portal\tProperties\tWith Price\n")
+                    lines.extend("\t".join(row) + "\n" for row in portal_rows)
+                sys.stdout.write("".join(lines))
+            else:
+                # Database stats table
+                stats_table = Table(title="Database Statistics")
+                stats_table.add_column("Metric", style="cyan")
+                stats_table.add_column("Value", style="white")
+                
+                for row in stats_rows:
+                    stats_table.add_row(*row)
                 
-                for portal_stat in stats['portal_stats']:
-                    portal_table.add_row(
-                        portal_stat['portal'].title(),
-                        str(portal_stat['total']),
-                        str(portal_stat['with_price'])
-                    )
+                console.print(stats_table)
                 
-                console.print(portal_table)
+                # Portal breakdown
+                if portal_rows:
+                    portal_table = Table(title="\\nPortal Breakdown")
+                    portal_table.add_column("Portal", style="cyan")
+                    portal_table.add_column("Properties", justify="right")
+                    portal_table.add_column("With Price", justify="right")
+                    
+                    for row in portal_rows:
+                        portal_table.add_row(*row)
+                    
+                    console.print(portal_table)
             
             # Export recommendations
             console.print("\\n[bold]Export Recommendations:[/bold]")
@@ -301,7 +483,7 @@ def export_status():
         finally:
             await db.close()
     
-    asyncio.run(show_status())
+    run_async(show_status())
 
 
 def test_sheets_connection(
@@ -364,4 +546,4 @@ def test_sheets_connection(
             console.print("  • Service account has Google Drive API enabled")
             console.print("  • Credentials file contains valid JSON")
     
-    asyncio.run(test_connection())
\ No newline at end of file
+    run_async(test_connection())
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""
+Shared event loop for running async CLI commands
+Reuses one loop per process instead of creating one per asyncio.run call
+"""
+
+import asyncio
+import atexit
+from typing import Any, Awaitable, Callable, Coroutine, List, Optional, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; fall back to the stdlib loop
+    uvloop = None
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Async close callbacks for loop-bound resources, run before the loop closes
+_cleanups: List[Callable[[], Awaitable[Any]]] = []
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Get the process-wide CLI event loop (uvloop when installed), creating it on first use"""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on the shared loop
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    return get_loop().run_until_complete(coro)
+
+
+def add_cleanup(close: Callable[[], Awaitable[Any]]) -> None:
+    """
+    Register an async close callback to run when the loop shuts down
+
+    Args:
+        close: Callable returning an awaitable, e.g. a client's ``aclose``
+    """
+    if close not in _cleanups:
+        _cleanups.append(close)
+
+
+@atexit.register
+def close_loop():
+    """Run cleanups, shut down async generators and the executor, then close the loop"""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        return
+    try:
+        while _cleanups:
+            _loop.run_until_complete(_cleanups.pop()())
+        _loop.run_until_complete(_loop.shutdown_asyncgens())
+        _loop.run_until_complete(_loop.shutdown_default_executor())
+    finally:
+        _loop.close()
+        _loop = None
@@ -4,19 +4,14 @@ Coordinates hybrid scraping and database storage
 """
 
 import asyncio
-import json
-from datetime import datetime
+from collections import Counter
 from pathlib import Path
 from typing import List, Optional
 
 from rich.console import Console
-from rich.live import Live
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TaskID, TextColumn, TimeElapsedColumn
-from rich.table import Table
 
 from homehunt.core.db import Database
-from homehunt.core.models import Portal, PropertyListing
+from homehunt.core.models import Portal, PropertyListing, PropertyType
 from homehunt.scrapers.hybrid import HybridScraper
 
 from .config import SearchConfig
@@ -24,6 +19,24 @@ from .url_builder import build_search_urls
 
 console = Console()
 
+# Buffer size for file exports, so large result sets are written in few syscalls
+CSV_WRITE_BUFFER = 1 << 20
+
+# Display names for enum members, computed once rather than per listing
+_PORTAL_TITLES = {portal: portal.value.title() for portal in Portal}
+_TYPE_TITLES = {prop_type: prop_type.value.title() for prop_type in PropertyType}
+
+# Serializes a listing straight to JSON bytes, matching to_dict() encoded as
+# JSON without building the intermediate dict
+_listing_json = PropertyListing.__pydantic_serializer__.to_json
+
+# Columns written by CSV exports, matching _csv_row
+CSV_FIELDS = [
+    'portal', 'property_id', 'url', 'price', 'bedrooms', 'bathrooms',
+    'property_type', 'area', 'postcode', 'address', 'furnished',
+    'agent_name', 'agent_phone', 'description'
+]
+
 
 async def search_properties(
     config: SearchConfig,
@@ -41,6 +54,8 @@ async def search_properties(
     Returns:
         List of PropertyListing objects
     """
+    from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+    
     # Initialize database if saving
     db = None
     if save_to_db:
@@ -62,12 +77,15 @@ async def search_properties(
     all_properties = []
     
     try:
-        # Create progress tracking
+        # Create progress tracking; the bar clears itself when done and
+        # interim counts go into its description rather than console prints
+        status_lines = []
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             TimeElapsedColumn(),
             console=console,
+            transient=True,
         ) as progress:
             
             # Search using hybrid scraper
@@ -81,25 +99,26 @@ async def search_properties(
                 config=config,
                 show_progress=False,
             )
-                
-            console.print(
+            status_lines.append(
                 f"\n[green]✓[/green] Found {len(properties)} properties across all portals"
             )
             
             # Save to database if enabled
             if save_to_db and db:
-                saved_count = 0
-                for prop in properties:
-                    if await db.save_property(prop):
-                        saved_count += 1
-                
-                console.print(
+                progress.update(
+                    search_task,
+                    description=f"[cyan]Found {len(properties)} properties, saving...[/cyan]",
+                )
+                saved_count = await db.save_properties(properties)
+                status_lines.append(
                     f"[green]✓[/green] Saved {saved_count} properties to database"
                 )
             
             all_properties.extend(properties)
             progress.update(search_task, completed=True)
         
+        console.print("\n".join(status_lines))
+        
         # Display results summary
         _display_results_summary(all_properties)
         
@@ -122,36 +141,22 @@ async def search_properties(
 
 def _display_search_config(config: SearchConfig, search_urls: dict):
     """Display search configuration in a nice panel"""
+    from rich.panel import Panel
+    
     lines = []
     
     lines.append(f"[bold]Location:[/bold] {config.location}")
     lines.append(f"[bold]Radius:[/bold] {config.radius.value} miles")
     
     if config.min_price or config.max_price:
-        price_range = []
-        if config.min_price:
-            price_range.append(f"£{config.min_price}")
-        else:
-            price_range.append("Any")
-        price_range.append(" - ")
-        if config.max_price:
-            price_range.append(f"£{config.max_price}")
-        else:
-            price_range.append("Any")
-        lines.append(f"[bold]Price Range:[/bold] {''.join(price_range)}/month")
+        min_price = f"£{config.min_price}" if config.min_price else "Any"
+        max_price = f"£{config.max_price}" if config.max_price else "Any"
+        lines.append(f"[bold]Price Range:[/bold] {min_price} - {max_price}/month")
     
     if config.min_bedrooms or config.max_bedrooms:
-        bed_range = []
-        if config.min_bedrooms:
-            bed_range.append(str(config.min_bedrooms))
-        else:
-            bed_range.append("Any")
-        bed_range.append(" - ")
-        if config.max_bedrooms:
-            bed_range.append(str(config.max_bedrooms))
-        else:
-            bed_range.append("Any")
-        lines.append(f"[bold]Bedrooms:[/bold] {''.join(bed_range)}")
+        lines.append(
+            f"[bold]Bedrooms:[/bold] {config.min_bedrooms or 'Any'} - {config.max_bedrooms or 'Any'}"
+        )
     
     if config.property_types:
         types = ", ".join(pt.value for pt in config.property_types)
@@ -188,45 +193,54 @@ def _display_results_summary(properties: List[PropertyListing]):
         console.print("\n[yellow]No properties found matching your criteria[/yellow]")
         return
     
-    # Calculate statistics
+    from rich.panel import Panel
+    
+    # Calculate statistics in a single pass, counting enum members and
+    # keeping prices in pence until display
     total = len(properties)
-    by_portal = {}
-    by_type = {}
-    prices = []
+    by_portal = Counter()
+    by_type = Counter()
+    price_count, price_total = 0, 0
+    price_min, price_max = float("inf"), float("-inf")
     
     for prop in properties:
-        # Count by portal
-        by_portal[prop.portal.value] = by_portal.get(prop.portal.value, 0) + 1
+        by_portal[prop.portal] += 1
         
-        # Count by type
         if prop.property_type:
-            by_type[prop.property_type.value] = by_type.get(prop.property_type.value, 0) + 1
+            by_type[prop.property_type] += 1
         
-        # Collect prices
-        if prop.price_numeric:
-            prices.append(prop.price_numeric / 100)  # Convert to pounds
+        price = prop.price_numeric
+        if price:
+            price_count += 1
+            price_total += price
+            if price < price_min:
+                price_min = price
+            if price > price_max:
+                price_max = price
     
     # Create summary
-    lines = []
-    lines.append(f"[bold]Total Properties Found:[/bold] {total}")
-    lines.append("")
-    
-    lines.append("[bold]By Portal:[/bold]")
-    for portal, count in sorted(by_portal.items()):
-        lines.append(f"  • {portal.title()}: {count}")
+    lines = [
+        f"[bold]Total Properties Found:[/bold] {total}",
+        "",
+        "[bold]By Portal:[/bold]",
+        *(f"  • {_PORTAL_TITLES[portal]}: {count}" for portal, count in sorted(by_portal.items())),
+    ]
     
     if by_type:
-        lines.append("")
-        lines.append("[bold]By Type:[/bold]")
-        for prop_type, count in sorted(by_type.items()):
-            lines.append(f"  • {prop_type.title()}: {count}")
-    
-    if prices:
-        lines.append("")
-        lines.append("[bold]Price Range:[/bold]")
-        lines.append(f"  • Min: £{int(min(prices)):,}/month")
-        lines.append(f"  • Max: £{int(max(prices)):,}/month")
-        lines.append(f"  • Avg: £{int(sum(prices) / len(prices)):,}/month")
+        lines += [
+            "",
+            "[bold]By Type:[/bold]",
+            *(f"  • {_TYPE_TITLES[prop_type]}: {count}" for prop_type, count in sorted(by_type.items())),
+        ]
+    
+    if price_count:
+        lines += [
+            "",
+            "[bold]Price Range:[/bold]",
+            f"  • Min: £{price_min // 100:,}/month",
+            f"  • Max: £{price_max // 100:,}/month",
+            f"  • Avg: £{int(price_total / price_count / 100):,}/month",
+        ]
     
     panel = Panel(
         "\n".join(lines),
@@ -237,14 +251,37 @@ def _display_results_summary(properties: List[PropertyListing]):
     console.print(panel)
 
 
+def _sample_row(prop: PropertyListing) -> tuple:
+    """Build one sample table row from a listing"""
+    # Furnished status plus the first few features
+    features = [prop.furnished] if prop.furnished else []
+    if prop.features:
+        features.extend(prop.features[:2])
+    
+    return (
+        _PORTAL_TITLES[prop.portal],
+        prop.price or "N/A",
+        str(prop.bedrooms or "-"),
+        prop.property_type.value if prop.property_type else "-",
+        prop.area or "-",
+        ", ".join(features) if features else "-",
+    )
+
+
 def _display_sample_properties(properties: List[PropertyListing]):
     """Display a sample of found properties"""
     if not properties:
         return
     
+    from rich.table import Table
+    
     console.print("\n[bold cyan]Sample Properties:[/bold cyan]\n")
     
-    table = Table(show_header=True, header_style="bold cyan")
+    # Rows are built before the table; auto-highlighting is off since every
+    # cell is plain text
+    rows = [_sample_row(prop) for prop in properties]
+    
+    table = Table(show_header=True, header_style="bold cyan", highlight=False)
     table.add_column("Portal", width=10)
     table.add_column("Price", justify="right", width=12)
     table.add_column("Beds", justify="center", width=5)
@@ -252,24 +289,8 @@ def _display_sample_properties(properties: List[PropertyListing]):
     table.add_column("Area", width=20)
     table.add_column("Features", width=30)
     
-    for prop in properties:
-        # Format features
-        features = []
-        if prop.furnished:
-            features.append(prop.furnished)
-        if prop.features:
-            # Add first few features
-            features.extend(prop.features[:2])
-        features_str = ", ".join(features) if features else "-"
-        
-        table.add_row(
-            prop.portal.value.title(),
-            prop.price or "N/A",
-            str(prop.bedrooms or "-"),
-            prop.property_type.value if prop.property_type else "-",
-            prop.area or "-",
-            features_str
-        )
+    for row in rows:
+        table.add_row(*row)
     
     console.print(table)
     console.print(f"\n[dim]Showing {len(properties)} of {len(properties)} properties[/dim]")
@@ -280,51 +301,72 @@ async def _export_results(properties: List[PropertyListing], output_file: Path):
     console.print(f"\n[cyan]Exporting results to {output_file}...[/cyan]")
     
     try:
-        if output_file.suffix.lower() == '.json':
-            # Export as JSON
-            data = [prop.to_dict() for prop in properties]
-            with open(output_file, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
-        
-        elif output_file.suffix.lower() == '.csv':
-            # Export as CSV
-            import csv
-            
-            # Define CSV fields
-            fields = [
-                'portal', 'property_id', 'url', 'price', 'bedrooms', 'bathrooms',
-                'property_type', 'area', 'postcode', 'address', 'furnished',
-                'agent_name', 'agent_phone', 'description'
-            ]
-            
-            with open(output_file, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=fields)
-                writer.writeheader()
-                
-                for prop in properties:
-                    row = {
-                        'portal': prop.portal.value,
-                        'property_id': prop.property_id,
-                        'url': prop.url,
-                        'price': prop.price,
-                        'bedrooms': prop.bedrooms,
-                        'bathrooms': prop.bathrooms,
-                        'property_type': prop.property_type.value if prop.property_type else '',
-                        'area': prop.area or '',
-                        'postcode': prop.postcode or '',
-                        'address': prop.address or '',
-                        'furnished': prop.furnished or '',
-                        'agent_name': prop.agent_name or '',
-                        'agent_phone': prop.agent_phone or '',
-                        'description': (prop.description or '')[:200],  # Truncate long descriptions
-                    }
-                    writer.writerow(row)
-        
+        suffix = output_file.suffix.lower()
+        if suffix == '.json':
+            writer = _write_json
+        elif suffix == '.csv':
+            writer = _write_csv
         else:
             console.print(f"[red]Unsupported file format: {output_file.suffix}[/red]")
             return
         
+        # File writes run in a worker thread so they don't block the event loop
+        await asyncio.to_thread(writer, properties, output_file)
+        
         console.print(f"[green]✓ Exported {len(properties)} properties to {output_file}[/green]")
         
     except Exception as e:
-        console.print(f"[red]Error exporting results: {e}[/red]")
\ No newline at end of file
+        console.print(f"[red]Error exporting results: {e}[/red]")
+
+
+def _json_item(prop: PropertyListing) -> bytes:
+    """Serialize one listing as a pretty-printed JSON array element"""
+    content = _listing_json(prop, indent=2, exclude_none=True)
+    return b'  ' + content.replace(b'\n', b'\n  ')
+
+
+def _write_json(properties: List[PropertyListing], output_file: Path):
+    """Write listings as a JSON array, serializing one listing at a time"""
+    with open(output_file, 'wb', buffering=CSV_WRITE_BUFFER) as f:
+        if not properties:
+            f.write(b'[]')
+            return
+        
+        f.write(b'[\n')
+        for i, prop in enumerate(properties):
+            if i:
+                f.write(b',\n')
+            f.write(_json_item(prop))
+        f.write(b'\n]')
+
+
+def _csv_row(prop: PropertyListing) -> tuple:
+    """Build one CSV row straight from the listing attributes"""
+    return (
+        prop.portal.value,
+        prop.property_id,
+        prop.url,
+        prop.price,
+        prop.bedrooms,
+        prop.bathrooms,
+        prop.property_type.value if prop.property_type else '',
+        prop.area or '',
+        prop.postcode or '',
+        prop.address or '',
+        prop.furnished or '',
+        prop.agent_name or '',
+        prop.agent_phone or '',
+        (prop.description or '')[:200],  # Truncate long descriptions
+    )
+
+
+def _write_csv(properties: List[PropertyListing], output_file: Path):
+    """Write listings as CSV through a large buffer in one writerows call"""
+    import csv
+    
+    with open(output_file, 'w', newline='', buffering=CSV_WRITE_BUFFER) as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDS)
+        # Rows are built lazily in this (worker) thread; shipping listings to
+        # a process pool would cost more in pickling than building the rows
+        writer.writerows(map(_csv_row, properties))
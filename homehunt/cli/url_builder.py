@@ -4,6 +4,7 @@ Converts SearchConfig into portal-specific search URLs
 """
 
 import re
+from collections import OrderedDict
 from typing import List
 from urllib.parse import quote, urlencode
 
@@ -12,35 +13,80 @@ from homehunt.core.models import Portal, PropertyType
 from .config import FurnishedType, LetType, SearchConfig, SortOrder
 
 
+# build_search_urls results, keyed by the serialized SearchConfig
+SEARCH_URL_CACHE_SIZE = 128
+_search_url_cache: "OrderedDict[str, dict[Portal, List[str]]]" = OrderedDict()
+
+# Zoopla location slug cleanup: drop punctuation, then collapse runs of
+# spaces and dashes into one dash
+_LOCATION_STRIP_RE = re.compile(r'[^\w\s-]')
+_LOCATION_DASH_RE = re.compile(r'[-\s]+')
+
+# Property type mappings for Rightmove
+_RM_PROPERTY_TYPE_MAP = {
+    PropertyType.FLAT: "flats",
+    PropertyType.HOUSE: "houses",
+    PropertyType.STUDIO: "flats",  # Studios are listed under flats
+    PropertyType.BUNGALOW: "bungalows",
+    PropertyType.MAISONETTE: "flats",  # Maisonettes are listed under flats
+}
+
+# Rightmove sort order mappings
+_RM_SORT_MAP = {
+    SortOrder.PRICE_ASC: "1",
+    SortOrder.PRICE_DESC: "2",
+    SortOrder.DATE_DESC: "6",
+    SortOrder.DATE_ASC: "10",
+}
+
+# Rightmove furnished status mappings
+_RM_FURNISHED_MAP = {
+    FurnishedType.FURNISHED: "furnished",
+    FurnishedType.UNFURNISHED: "unfurnished",
+    FurnishedType.PART_FURNISHED: "partFurnished",
+    FurnishedType.ANY: "",
+}
+
+# Property type mappings for Zoopla
+_ZP_PROPERTY_TYPE_MAP = {
+    PropertyType.FLAT: "flats",
+    PropertyType.HOUSE: "houses",
+    PropertyType.STUDIO: "studios",
+    PropertyType.BUNGALOW: "bungalows",
+    PropertyType.MAISONETTE: "flats",  # Maisonettes listed under flats
+}
+
+# Zoopla sort order mappings
+_ZP_SORT_MAP = {
+    SortOrder.PRICE_ASC: "rental_price_ascending",
+    SortOrder.PRICE_DESC: "rental_price_descending",
+    SortOrder.DATE_DESC: "most_recent",
+    SortOrder.DATE_ASC: "oldest_first",
+}
+
+# Zoopla furnished status mappings
+_ZP_FURNISHED_MAP = {
+    FurnishedType.FURNISHED: "furnished",
+    FurnishedType.UNFURNISHED: "unfurnished",
+    FurnishedType.PART_FURNISHED: "part_furnished",
+    FurnishedType.ANY: "",
+}
+
+
+def _mapped_types(property_types: List[PropertyType], type_map: dict) -> List[str]:
+    """Map property types to portal values, dropping unmapped types and repeats"""
+    return list(dict.fromkeys(type_map[t] for t in property_types if t in type_map))
+
+
 class RightmoveURLBuilder:
     """Build search URLs for Rightmove"""
     
     BASE_URL = "https://www.rightmove.co.uk/property-to-rent/find.html"
     
-    # Property type mappings for Rightmove
-    PROPERTY_TYPE_MAP = {
-        PropertyType.FLAT: "flats",
-        PropertyType.HOUSE: "houses",
-        PropertyType.STUDIO: "flats",  # Studios are listed under flats
-        PropertyType.BUNGALOW: "bungalows",
-        PropertyType.MAISONETTE: "flats",  # Maisonettes are listed under flats
-    }
-    
-    # Sort order mappings
-    SORT_MAP = {
-        SortOrder.PRICE_ASC: "1",
-        SortOrder.PRICE_DESC: "2",
-        SortOrder.DATE_DESC: "6",
-        SortOrder.DATE_ASC: "10",
-    }
-    
-    # Furnished status mappings
-    FURNISHED_MAP = {
-        FurnishedType.FURNISHED: "furnished",
-        FurnishedType.UNFURNISHED: "unfurnished",
-        FurnishedType.PART_FURNISHED: "partFurnished",
-        FurnishedType.ANY: "",
-    }
+    # Module-level maps, kept as class attributes for existing callers
+    PROPERTY_TYPE_MAP = _RM_PROPERTY_TYPE_MAP
+    SORT_MAP = _RM_SORT_MAP
+    FURNISHED_MAP = _RM_FURNISHED_MAP
     
     @classmethod
     def build_url(cls, config: SearchConfig) -> str:
@@ -69,16 +115,15 @@ class RightmoveURLBuilder:
         
         # Property types
         if config.property_types:
-            # Rightmove uses multiple propertyTypes[] parameters
-            for prop_type in config.property_types:
-                if prop_type in cls.PROPERTY_TYPE_MAP:
-                    if "propertyTypes" not in params:
-                        params["propertyTypes"] = []
-                    params["propertyTypes"].append(cls.PROPERTY_TYPE_MAP[prop_type])
+            # Rightmove uses multiple propertyTypes[] parameters; several types
+            # map to the same one (e.g. studios are flats), so keep each once
+            property_types = _mapped_types(config.property_types, _RM_PROPERTY_TYPE_MAP)
+            if property_types:
+                params["propertyTypes"] = property_types
         
         # Furnished status
         if config.furnished != FurnishedType.ANY:
-            furnished_value = cls.FURNISHED_MAP.get(config.furnished)
+            furnished_value = _RM_FURNISHED_MAP.get(config.furnished)
             if furnished_value:
                 params["furnishTypes"] = furnished_value
         
@@ -120,22 +165,20 @@ class RightmoveURLBuilder:
             params["keywords"].extend(config.keywords)
         
         # Sort order
-        params["sortType"] = cls.SORT_MAP.get(config.sort_order, "6")
+        params["sortType"] = _RM_SORT_MAP.get(config.sort_order, "6")
         
         # Number of results per page (Rightmove default is 24)
         params["resultsPerPage"] = "24"
         
-        # Build the URL
-        url_parts = []
-        for key, value in params.items():
-            if isinstance(value, list):
-                # Handle array parameters
-                for item in value:
-                    url_parts.append(f"{key}[]={quote(str(item))}")
-            else:
-                url_parts.append(f"{key}={quote(str(value))}")
-        
-        return f"{cls.BASE_URL}?{'&'.join(url_parts)}"
+        # Build the URL; array parameters repeat as key[]=item. Values are
+        # encoded with only '/' kept, then the encoded "[]" suffix is restored
+        # on keys; a value cannot contain "%5B%5D=" because its '=' is escaped
+        params = {
+            (f"{key}[]" if isinstance(value, list) else key): value
+            for key, value in params.items()
+        }
+        query = urlencode(params, doseq=True, safe='/', quote_via=quote)
+        return f"{cls.BASE_URL}?{query.replace('%5B%5D=', '[]=')}"
     
     @classmethod
     def get_pagination_urls(cls, base_url: str, total_results: int, page_size: int = 24) -> List[str]:
@@ -158,30 +201,10 @@ class ZooplaURLBuilder:
     
     BASE_URL = "https://www.zoopla.co.uk/to-rent/property"
     
-    # Property type mappings for Zoopla
-    PROPERTY_TYPE_MAP = {
-        PropertyType.FLAT: "flats",
-        PropertyType.HOUSE: "houses",
-        PropertyType.STUDIO: "studios",
-        PropertyType.BUNGALOW: "bungalows",
-        PropertyType.MAISONETTE: "flats",  # Maisonettes listed under flats
-    }
-    
-    # Sort order mappings
-    SORT_MAP = {
-        SortOrder.PRICE_ASC: "rental_price_ascending",
-        SortOrder.PRICE_DESC: "rental_price_descending",
-        SortOrder.DATE_DESC: "most_recent",
-        SortOrder.DATE_ASC: "oldest_first",
-    }
-    
-    # Furnished status mappings
-    FURNISHED_MAP = {
-        FurnishedType.FURNISHED: "furnished",
-        FurnishedType.UNFURNISHED: "unfurnished",
-        FurnishedType.PART_FURNISHED: "part_furnished",
-        FurnishedType.ANY: "",
-    }
+    # Module-level maps, kept as class attributes for existing callers
+    PROPERTY_TYPE_MAP = _ZP_PROPERTY_TYPE_MAP
+    SORT_MAP = _ZP_SORT_MAP
+    FURNISHED_MAP = _ZP_FURNISHED_MAP
     
     @classmethod
     def build_url(cls, config: SearchConfig) -> str:
@@ -192,14 +215,12 @@ class ZooplaURLBuilder:
         
         # Add property types to URL path
         if config.property_types:
-            for prop_type in config.property_types:
-                if prop_type in cls.PROPERTY_TYPE_MAP:
-                    url_parts.append(cls.PROPERTY_TYPE_MAP[prop_type])
+            url_parts.extend(_mapped_types(config.property_types, _ZP_PROPERTY_TYPE_MAP))
         
         # Add location to URL path
         # Clean location for URL (remove special characters)
-        clean_location = re.sub(r'[^\w\s-]', '', config.location.lower())
-        clean_location = re.sub(r'[-\s]+', '-', clean_location)
+        clean_location = _LOCATION_STRIP_RE.sub('', config.location.lower())
+        clean_location = _LOCATION_DASH_RE.sub('-', clean_location)
         url_parts.append(clean_location)
         
         base_path = "/".join(url_parts)
@@ -225,7 +246,7 @@ class ZooplaURLBuilder:
         
         # Furnished status
         if config.furnished != FurnishedType.ANY:
-            furnished_value = cls.FURNISHED_MAP.get(config.furnished)
+            furnished_value = _ZP_FURNISHED_MAP.get(config.furnished)
             if furnished_value:
                 params["furnished_state"] = furnished_value
         
@@ -274,23 +295,14 @@ class ZooplaURLBuilder:
             params["exclude_shared_ownership"] = "yes"
         
         # Sort order
-        params["results_sort"] = cls.SORT_MAP.get(config.sort_order, "most_recent")
+        params["results_sort"] = _ZP_SORT_MAP.get(config.sort_order, "most_recent")
         
         # Results per page
         params["page_size"] = "25"
         
-        # Build the final URL
+        # Build the final URL; list parameters repeat as key=item
         if params:
-            # Handle list parameters properly
-            query_parts = []
-            for key, value in params.items():
-                if isinstance(value, list):
-                    for item in value:
-                        query_parts.append(f"{key}={quote(str(item))}")
-                else:
-                    query_parts.append(f"{key}={quote(str(value))}")
-            
-            return f"{base_path}/?{'&'.join(query_parts)}"
+            return f"{base_path}/?{urlencode(params, doseq=True, safe='/', quote_via=quote)}"
         else:
             return f"{base_path}/"
     
@@ -313,12 +325,29 @@ def build_search_urls(config: SearchConfig) -> dict[Portal, List[str]]:
     """
     Build search URLs for all requested portals
     
+    Results are cached on the serialized config, so re-running the same
+    search (e.g. a scheduled profile) skips rebuilding its URLs.
+    
     Args:
         config: Search configuration
         
     Returns:
         Dictionary mapping Portal to list of search URLs
     """
+    key = config.model_dump_json()
+    if key in _search_url_cache:
+        _search_url_cache.move_to_end(key)
+    else:
+        _search_url_cache[key] = _build_search_urls(config)
+        if len(_search_url_cache) > SEARCH_URL_CACHE_SIZE:
+            _search_url_cache.popitem(last=False)
+    
+    # Hand out fresh lists so callers cannot alter the cached URLs
+    return {portal: list(urls) for portal, urls in _search_url_cache[key].items()}
+
+
+def _build_search_urls(config: SearchConfig) -> dict[Portal, List[str]]:
+    """Build search URLs for all requested portals, without caching"""
     urls = {}
     
     if Portal.RIGHTMOVE in config.portals:
@@ -329,4 +358,4 @@ def build_search_urls(config: SearchConfig) -> dict[Portal, List[str]]:
         zoopla_url = ZooplaURLBuilder.build_url(config)
         urls[Portal.ZOOPLA] = [zoopla_url]
     
-    return urls
\ No newline at end of file
+    return urls
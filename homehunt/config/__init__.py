@@ -11,7 +11,7 @@ from .models import (
     SavedSearchProfile,
 )
 from .parser import ConfigParser
-from .manager import ConfigManager
+from .manager import ConfigManager, get_config_manager
 
 __all__ = [
     "AdvancedSearchConfig",
@@ -21,4 +21,5 @@ __all__ = [
     "SavedSearchProfile",
     "ConfigParser",
     "ConfigManager",
+    "get_config_manager",
 ]
\ No newline at end of file
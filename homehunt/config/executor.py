@@ -4,23 +4,37 @@ Handles running searches based on advanced configuration files
 """
 
 import asyncio
+import json
+import os
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from rich.console import Console
-from rich.progress import Progress
 
-from homehunt.cli.search_command import search_properties
 from homehunt.core.db import Database
 from homehunt.core.models import PropertyListing
-from homehunt.traveltime.service import TravelTimeService
-from homehunt.traveltime.client import TravelTimeClient
 
 from .models import AdvancedSearchConfig, SavedSearchProfile
 
+if TYPE_CHECKING:
+    from homehunt.traveltime.service import TravelTimeService
+
 console = Console()
 
+# Monthly rent (£) at or above which a listing gets no price score
+SCORE_MAX_PRICE = 5000
+
+# Commute (minutes) at or above which a mode gets no commute score
+SCORE_MAX_COMMUTE = 90
+
+# Bedroom count that earns the full size score
+SCORE_MAX_BEDROOMS = 4
+
+# Profile run metadata (last_run, total_runs), keyed by resolved config path
+# and then profile name; kept out of the user's own configuration files
+RUN_STATE_FILE = Path.home() / ".homehunt" / "run_state.json"
+
 
 class ConfigExecutorError(Exception):
     """Configuration execution error"""
@@ -30,22 +44,29 @@ class ConfigExecutorError(Exception):
 class ConfigExecutor:
     """Executes searches based on configuration files"""
     
-    def __init__(self, config: AdvancedSearchConfig):
+    def __init__(self, config: AdvancedSearchConfig, config_path: Optional[Path] = None):
         """
         Initialize executor with configuration
         
         Args:
             config: Advanced search configuration
+            config_path: File the configuration was loaded from; when given,
+                profile run metadata is recorded for it in RUN_STATE_FILE
         """
         self.config = config
+        self.config_path = config_path
         self.db: Optional[Database] = None
-        self.traveltime_service: Optional[TravelTimeService] = None
+        self.traveltime_service: Optional["TravelTimeService"] = None
+        # Bounds location searches across all profiles; separate from the
+        # profile-level limit so a profile holding a slot cannot starve its
+        # own locations
+        self._search_sem = asyncio.Semaphore(config.concurrent_searches)
         self._initialize_services()
     
     def _initialize_services(self):
         """Initialize required services"""
         if self.config.save_to_database:
-            self.db = Database()
+            self._get_db()
         
         # Initialize TravelTime service if commute filters are present
         has_commute_filters = (
@@ -54,12 +75,21 @@ class ConfigExecutor:
         )
         
         if has_commute_filters:
+            from homehunt.traveltime.client import TravelTimeClient
+            from homehunt.traveltime.service import TravelTimeService
+            
             try:
                 traveltime_client = TravelTimeClient()
-                self.traveltime_service = TravelTimeService(self.db or Database(), traveltime_client)
+                self.traveltime_service = TravelTimeService(self._get_db(), traveltime_client)
             except ValueError:
                 console.print("[yellow]Warning: TravelTime API not configured, skipping commute filtering[/yellow]")
     
+    def _get_db(self) -> Database:
+        """Get the executor's database, shared by all services and closed once in cleanup"""
+        if self.db is None:
+            self.db = Database()
+        return self.db
+    
     async def execute(
         self,
         profile_names: Optional[List[str]] = None,
@@ -107,8 +137,9 @@ class ConfigExecutor:
     def _filter_profiles(self, profile_names: Optional[List[str]]) -> List[SavedSearchProfile]:
         """Filter profiles based on names"""
         if profile_names:
-            profiles = [p for p in self.config.profiles if p.name in profile_names]
-            missing = set(profile_names) - {p.name for p in profiles}
+            wanted = set(profile_names)
+            profiles = [p for p in self.config.profiles if p.name in wanted]
+            missing = wanted - {p.name for p in profiles}
             if missing:
                 console.print(f"[yellow]Warning: Profiles not found: {', '.join(missing)}[/yellow]")
         else:
@@ -137,6 +168,8 @@ class ConfigExecutor:
     
     async def _execute_searches(self, profiles: List[SavedSearchProfile]) -> List[PropertyListing]:
         """Execute searches for all profiles"""
+        from rich.progress import Progress
+        
         all_properties = []
         semaphore = asyncio.Semaphore(self.config.concurrent_searches)
         
@@ -151,62 +184,60 @@ class ConfigExecutor:
                     console.print(f"[red]✗ {profile.name}: {e}[/red]")
                     return []
         
-        # Execute with progress tracking
+        # Execute with progress tracking, advancing as each profile finishes
         with Progress(console=console) as progress:
             task = progress.add_task("Executing searches...", total=len(profiles))
             
-            tasks = [run_profile(profile) for profile in profiles]
+            async def run_tracked(profile: SavedSearchProfile) -> List[PropertyListing]:
+                try:
+                    return await run_profile(profile)
+                finally:
+                    progress.advance(task)
+            
+            tasks = [run_tracked(profile) for profile in profiles]
             results = await asyncio.gather(*tasks, return_exceptions=True)
             
+            # Combine in profile order. run_profile reports ordinary errors
+            # itself, so anything raised here is a cancellation or interrupt
+            # that must propagate rather than be dropped
             for result in results:
-                if isinstance(result, list):
-                    all_properties.extend(result)
-                progress.advance(task)
+                if isinstance(result, BaseException):
+                    raise result
+                all_properties.extend(result)
         
         return all_properties
     
     async def _execute_single_profile(self, profile: SavedSearchProfile) -> List[PropertyListing]:
         """Execute search for a single profile"""
+        # Deferred: the search stack (scrapers, HTTP clients) is only needed
+        # once a search actually runs, not for dry runs
+        from homehunt.cli.search_command import search_properties
+        
         properties = []
         
         if profile.multi_location:
-            # Multi-location search
-            for location in profile.multi_location.locations:
-                location_config = profile.search.model_copy()
-                location_config.location = location
-                
-                # Apply location overrides
-                if (profile.multi_location.location_overrides and 
-                    location in profile.multi_location.location_overrides):
-                    overrides = profile.multi_location.location_overrides[location]
-                    for key, value in overrides.items():
-                        if hasattr(location_config, key):
-                            setattr(location_config, key, value)
-                
-                # Limit results per location
-                if profile.multi_location.max_results_per_location:
-                    location_config.max_results = profile.multi_location.max_results_per_location
-                
-                # Execute search
-                location_properties = await search_properties(
-                    location_config,
-                    save_to_db=self.config.save_to_database,
-                    output_file=None,
-                    show_progress=False
-                )
-                
-                properties.extend(location_properties)
-                
-                # Delay between locations
-                if self.config.delay_between_searches > 0:
-                    await asyncio.sleep(self.config.delay_between_searches)
+            # Multi-location search: locations run concurrently, with start
+            # times staggered by the configured delay to respect rate limits
+            locations = profile.multi_location.locations
+            results = await asyncio.gather(*(
+                self._run_location(profile, index, location)
+                for index, location in enumerate(locations)
+            ), return_exceptions=True)
+            
+            # Combine in location order, skipping locations that failed
+            for location, result in zip(locations, results):
+                if isinstance(result, asyncio.CancelledError):
+                    raise result
+                if isinstance(result, BaseException):
+                    console.print(f"[yellow]Warning: {profile.name} search for {location} failed: {result}[/yellow]")
+                    continue
+                properties.extend(result)
         else:
             # Single location search
             properties = await search_properties(
                 profile.search,
                 save_to_db=self.config.save_to_database,
-                output_file=None,
-                show_progress=False
+                output_file=None
             )
         
         # Apply profile-specific processing
@@ -214,6 +245,41 @@ class ConfigExecutor:
         
         return properties
     
+    async def _run_location(
+        self,
+        profile: SavedSearchProfile,
+        index: int,
+        location: str
+    ) -> List[PropertyListing]:
+        """Run a profile's search for one of its locations"""
+        from homehunt.cli.search_command import search_properties
+        
+        location_config = profile.search.model_copy()
+        location_config.location = location
+        
+        # Apply location overrides
+        if (profile.multi_location.location_overrides and 
+            location in profile.multi_location.location_overrides):
+            overrides = profile.multi_location.location_overrides[location]
+            for key, value in overrides.items():
+                if hasattr(location_config, key):
+                    setattr(location_config, key, value)
+        
+        # Limit results per location
+        if profile.multi_location.max_results_per_location:
+            location_config.max_results = profile.multi_location.max_results_per_location
+        
+        # Stagger start times rather than blocking between locations
+        if index and self.config.delay_between_searches > 0:
+            await asyncio.sleep(index * self.config.delay_between_searches)
+        
+        async with self._search_sem:
+            return await search_properties(
+                location_config,
+                save_to_db=self.config.save_to_database,
+                output_file=None
+            )
+    
     async def _apply_profile_processing(
         self, 
         profile: SavedSearchProfile, 
@@ -264,81 +330,77 @@ class ConfigExecutor:
         if not self.traveltime_service:
             return properties
         
-        filtered_properties = properties
+        # All filters read stored commute times, so check them in one pass
+        limits = [
+            (
+                commute_filter.transport_modes[0] if commute_filter.transport_modes else "public_transport",
+                commute_filter.max_time
+            )
+            for commute_filter in commute_filters
+        ]
         
-        for commute_filter in commute_filters:
-            # Apply each commute filter
-            try:
-                filtered_properties = await self.traveltime_service.filter_by_commute(
-                    properties=filtered_properties,
-                    max_commute_time=commute_filter.max_time,
-                    transport_mode=commute_filter.transport_modes[0] if commute_filter.transport_modes else "public_transport"
-                )
-            except Exception as e:
-                console.print(f"[yellow]Warning: Commute filtering failed for {commute_filter.destination}: {e}[/yellow]")
-        
-        return filtered_properties
+        try:
+            return await self.traveltime_service.filter_by_commute_limits(properties, limits)
+        except Exception as e:
+            destinations = ', '.join(commute_filter.destination for commute_filter in commute_filters)
+            console.print(f"[yellow]Warning: Commute filtering failed for {destinations}: {e}[/yellow]")
+            return properties
     
     def _apply_scoring(self, score_weights: dict, properties: List[PropertyListing]) -> List[PropertyListing]:
         """Apply scoring algorithm to properties"""
+        # Resolve weights once; an absent or zero weight skips that sub-score
+        price_weight = score_weights.get('price')
+        commute_weight = score_weights.get('commute')
+        size_weight = score_weights.get('size')
+        features_weight = score_weights.get('features')
+        
         for prop in properties:
             score = 0.0
             
             # Price scoring (lower price = higher score)
-            if 'price' in score_weights and prop.price:
+            if price_weight and prop.price:
                 try:
                     price_value = float(prop.price.replace('£', '').replace(',', '').replace(' pcm', ''))
-                    # Normalize to 0-1 scale (max reasonable price £5000)
-                    price_score = max(0, 1 - (price_value / 5000))
-                    score += price_score * score_weights['price']
-                except (ValueError, AttributeError):
+                    score += max(0, 1 - (price_value / SCORE_MAX_PRICE)) * price_weight
+                except ValueError:
                     pass
             
-            # Commute scoring
-            if 'commute' in score_weights:
-                # Use existing commute data if available
+            # Commute scoring from existing commute data. Plain attribute
+            # access measured faster here than an operator.attrgetter
+            if commute_weight:
                 commute_score = 0.0
                 commute_count = 0
                 
-                for mode in ['public_transport', 'cycling', 'walking', 'driving']:
-                    commute_time = getattr(prop, f'commute_{mode}', None)
+                for commute_time in (
+                    prop.commute_public_transport,
+                    prop.commute_cycling,
+                    prop.commute_walking,
+                    prop.commute_driving,
+                ):
                     if commute_time:
-                        # Normalize to 0-1 scale (max reasonable commute 90 min)
-                        mode_score = max(0, 1 - (commute_time / 90))
-                        commute_score += mode_score
+                        mode_score = 1 - (commute_time / SCORE_MAX_COMMUTE)
+                        if mode_score > 0:
+                            commute_score += mode_score
                         commute_count += 1
                 
-                if commute_count > 0:
-                    commute_score /= commute_count
-                    score += commute_score * score_weights['commute']
+                if commute_count:
+                    score += commute_score / commute_count * commute_weight
             
             # Size scoring
-            if 'size' in score_weights and prop.bedrooms:
-                # Normalize to 0-1 scale (max 4 bedrooms)
-                size_score = min(1.0, prop.bedrooms / 4)
-                score += size_score * score_weights['size']
+            if size_weight and prop.bedrooms:
+                score += min(1.0, prop.bedrooms / SCORE_MAX_BEDROOMS) * size_weight
             
-            # Feature scoring
-            if 'features' in score_weights:
-                feature_score = 0.0
-                feature_count = 0
-                
-                # Check boolean features
-                for feature in ['parking', 'garden', 'balcony']:
-                    if hasattr(prop, feature):
-                        feature_count += 1
-                        if getattr(prop, feature, False):
-                            feature_score += 1
-                
-                if feature_count > 0:
-                    feature_score /= feature_count
-                    score += feature_score * score_weights['features']
+            # Feature scoring over boolean features
+            if features_weight:
+                feature_score = bool(prop.parking) + bool(prop.garden) + bool(prop.balcony)
+                score += feature_score / 3 * features_weight
             
-            # Store calculated score
-            setattr(prop, 'calculated_score', score)
+            # Store calculated score; listings forbid extra fields, so bypass
+            # validation to keep it out of serialized output
+            object.__setattr__(prop, 'calculated_score', score)
         
         # Sort by score (highest first)
-        return sorted(properties, key=lambda p: getattr(p, 'calculated_score', 0), reverse=True)
+        return sorted(properties, key=lambda p: p.calculated_score, reverse=True)
     
     async def _handle_exports(self, profile: SavedSearchProfile, properties: List[PropertyListing]) -> None:
         """Handle property exports for profile"""
@@ -348,20 +410,26 @@ class ConfigExecutor:
         # Use advanced export configs if available
         if profile.export_configs:
             from homehunt.exports.service import ExportService
-            from homehunt.core.db import Database
-            export_service = ExportService(self.db or Database())
+            export_service = ExportService(self._get_db())
             
-            for export_config in profile.export_configs:
-                try:
-                    result = await export_service.export_properties(export_config, properties)
-                    if result.success:
-                        console.print(f"[green]✓ Exported {result.properties_exported} properties via {result.format.value}[/green]")
-                        if result.output_location:
-                            console.print(f"  Location: {result.output_location}")
-                    else:
-                        console.print(f"[red]✗ Export failed: {result.error_message}[/red]")
-                except Exception as e:
-                    console.print(f"[red]Export error: {e}[/red]")
+            # Exports are independent, so run them concurrently and report
+            # results in configuration order
+            results = await asyncio.gather(*(
+                export_service.export_properties(export_config, properties)
+                for export_config in profile.export_configs
+            ), return_exceptions=True)
+            
+            for result in results:
+                if isinstance(result, asyncio.CancelledError):
+                    raise result
+                if isinstance(result, BaseException):
+                    console.print(f"[red]Export error: {result}[/red]")
+                elif result.success:
+                    console.print(f"[green]✓ Exported {result.properties_exported} properties via {result.format.value}[/green]")
+                    if result.output_location:
+                        console.print(f"  Location: {result.output_location}")
+                else:
+                    console.print(f"[red]✗ Export failed: {result.error_message}[/red]")
         
         # Fallback to legacy export settings
         elif profile.auto_export and profile.export_formats:
@@ -371,26 +439,64 @@ class ConfigExecutor:
             console.print(f"[yellow]Consider upgrading to export_configs for full functionality[/yellow]")
     
     def _deduplicate_properties(self, properties: List[PropertyListing]) -> List[PropertyListing]:
-        """Remove duplicate properties based on URL"""
-        seen_urls = set()
-        deduplicated = []
+        """Remove duplicate properties based on portal and property ID (or URL)"""
+        # Dicts keep insertion order, so setdefault keeps each first listing
+        # in place. The same listing can be reached through different URLs
+        # (e.g. search-specific query strings), so prefer the portal's own ID
+        unique = {}
         
         for prop in properties:
-            if prop.url not in seen_urls:
-                seen_urls.add(prop.url)
-                deduplicated.append(prop)
+            unique.setdefault((prop.portal, prop.property_id) if prop.property_id else prop.url, prop)
         
-        return deduplicated
+        return list(unique.values())
     
     async def _update_profile_metadata(self, profiles: List[SavedSearchProfile]) -> None:
-        """Update profile execution metadata"""
+        """Update profile execution metadata, recording it in a single write"""
         current_time = datetime.utcnow()
         
         for profile in profiles:
             profile.last_run = current_time
             profile.total_runs += 1
+        
+        if self.config_path is None:
+            return
+        
+        try:
+            await asyncio.to_thread(
+                _record_profile_runs, RUN_STATE_FILE, str(self.config_path.resolve()), profiles
+            )
+        except (OSError, ValueError) as e:
+            console.print(f"[yellow]Warning: Could not save profile run metadata: {e}[/yellow]")
     
     async def _cleanup(self) -> None:
         """Clean up resources"""
         if self.db:
-            await self.db.close()
\ No newline at end of file
+            await self.db.close()
+
+
+def _record_profile_runs(state_file: Path, config_key: str, profiles: List[SavedSearchProfile]) -> None:
+    """Merge profile run metadata into the run state file, continuing stored run counts"""
+    try:
+        state = json.loads(state_file.read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        state = {}
+    
+    runs = state.setdefault(config_key, {})
+    for profile in profiles:
+        previous = runs.get(profile.name)
+        if previous is not None:
+            profile.total_runs = previous["total_runs"] + 1
+        runs[profile.name] = {
+            "last_run": profile.last_run.isoformat(),
+            "total_runs": profile.total_runs,
+        }
+    
+    # Write beside the state file and rename over it, like config saves
+    state_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = state_file.with_name(state_file.name + ".tmp")
+    try:
+        temp_path.write_text(json.dumps(state, indent=2), encoding='utf-8')
+        os.replace(temp_path, state_file)
+    except OSError:
+        temp_path.unlink(missing_ok=True)
+        raise
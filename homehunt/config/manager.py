@@ -3,18 +3,27 @@ Configuration manager for HomeHunt
 Handles loading, saving, and managing configuration profiles
 """
 
+import functools
 import os
+import shutil
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from rich.console import Console
-from rich.table import Table
 
 from .models import AdvancedSearchConfig, SavedSearchProfile
 from .parser import ConfigParser, ConfigParserError
 
 console = Console()
 
+# File name endings list_config_files treats as configuration files
+CONFIG_FILE_SUFFIXES = (".yaml", ".yml", ".json")
+
+# validate_config results, keyed by resolved path, modification time and size
+VALIDATION_CACHE_SIZE = 64
+_validation_cache: "OrderedDict[Tuple[str, int, int], List[str]]" = OrderedDict()
+
 
 class ConfigManagerError(Exception):
     """Configuration manager error"""
@@ -35,33 +44,44 @@ class ConfigManager:
             config_dir = Path.home() / ".homehunt" / "config"
         
         self.config_dir = config_dir
-        self.config_dir.mkdir(parents=True, exist_ok=True)
         
         # Default config file locations
         self.default_config_file = self.config_dir / "default.yaml"
         self.profiles_dir = self.config_dir / "profiles"
-        self.profiles_dir.mkdir(exist_ok=True)
+        
+        # Creating the nested profiles directory creates the config directory
+        # too, and costs a single failed mkdir once both exist
+        self.profiles_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Name -> profile index for the last shared config get_profile read
+        self._profile_index: Optional[Tuple[AdvancedSearchConfig, Dict[str, SavedSearchProfile]]] = None
     
     def list_config_files(self) -> List[Path]:
         """List all configuration files in the config directory"""
         config_files = []
         
-        # Add main config files
-        for pattern in ["*.yaml", "*.yml", "*.json"]:
-            config_files.extend(self.config_dir.glob(pattern))
-        
-        # Add profile files
-        for pattern in ["*.yaml", "*.yml", "*.json"]:
-            config_files.extend(self.profiles_dir.glob(pattern))
+        # One directory scan each for main config files and profile files
+        for directory in (self.config_dir, self.profiles_dir):
+            with os.scandir(directory) as entries:
+                config_files.extend(
+                    directory / entry.name
+                    for entry in entries
+                    if entry.name.endswith(CONFIG_FILE_SUFFIXES)
+                )
         
         return sorted(config_files)
     
-    def load_config(self, config_path: Optional[Path] = None) -> AdvancedSearchConfig:
+    def load_config(self, config_path: Optional[Path] = None, copy: bool = True) -> AdvancedSearchConfig:
         """
         Load configuration from file
         
+        Parsed configs are cached while the file is unchanged, so repeated
+        loads skip disk reads and validation.
+        
         Args:
             config_path: Path to config file (defaults to default.yaml)
+            copy: Return a private copy; read-only callers can pass False
+                to share the cached instance
             
         Returns:
             AdvancedSearchConfig instance
@@ -76,7 +96,7 @@ class ConfigManager:
             raise ConfigManagerError(f"Configuration file not found: {config_path}")
         
         try:
-            return ConfigParser.parse_config(config_path)
+            return ConfigParser.parse_config_cached(config_path, copy=copy)
         except ConfigParserError as e:
             raise ConfigManagerError(f"Failed to load configuration: {e}")
     
@@ -98,6 +118,8 @@ class ConfigManager:
             ConfigParser.save_file(config, config_path)
         except ConfigParserError as e:
             raise ConfigManagerError(f"Failed to save configuration: {e}")
+        finally:
+            _validation_cache.clear()
     
     def create_default_config(self, overwrite: bool = False) -> Path:
         """
@@ -153,11 +175,20 @@ class ConfigManager:
             SavedSearchProfile if found, None otherwise
         """
         try:
-            config = self.load_config(config_path)
-            return config.get_profile(name)
+            # Copy just the requested profile rather than the whole config
+            profile = self._profiles_by_name(self.load_config(config_path, copy=False)).get(name)
+            return profile.model_copy(deep=True) if profile else None
         except ConfigManagerError:
             return None
     
+    def _profiles_by_name(self, config: AdvancedSearchConfig) -> Dict[str, SavedSearchProfile]:
+        """Index a shared cached config's profiles by name, first match winning"""
+        # The parse cache hands out a new instance whenever the file changes,
+        # so the index is rebuilt exactly when the profiles can differ
+        if self._profile_index is None or self._profile_index[0] is not config:
+            self._profile_index = (config, config.profiles_by_name())
+        return self._profile_index[1]
+    
     def add_profile(self, profile: SavedSearchProfile, config_path: Optional[Path] = None) -> None:
         """
         Add a profile to configuration
@@ -203,41 +234,85 @@ class ConfigManager:
         """
         Validate configuration file and return any errors
         
+        Results are reused while the file is unchanged, unless the
+        configuration has export paths whose directories must be re-checked.
+        
         Args:
             config_path: Path to config file
             
         Returns:
             List of validation error messages (empty if valid)
         """
-        errors = []
+        config_path = Path(config_path)
+        try:
+            stat = config_path.stat()
+            key = (str(config_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            key = None
+        
+        if key in _validation_cache:
+            _validation_cache.move_to_end(key)
+            return list(_validation_cache[key])
         
         try:
-            config = ConfigParser.parse_config(config_path)
-            
-            # Additional validation checks
-            if not config.profiles:
-                errors.append("Configuration must have at least one profile")
-            
-            # Check for duplicate profile names
-            profile_names = [p.name for p in config.profiles]
-            if len(profile_names) != len(set(profile_names)):
-                errors.append("Profile names must be unique")
-            
-            # Validate each profile
-            for i, profile in enumerate(config.profiles):
-                profile_errors = self._validate_profile(profile)
-                for error in profile_errors:
-                    errors.append(f"Profile '{profile.name}' (#{i+1}): {error}")
-                    
+            config = ConfigParser.parse_config_cached(config_path, copy=False)
+            errors = self.validate_model(config)
         except ConfigParserError as e:
-            errors.append(str(e))
+            return [str(e)]
         except Exception as e:
-            errors.append(f"Unexpected validation error: {e}")
+            return [f"Unexpected validation error: {e}"]
+        
+        # Export directory checks depend on the filesystem, not just this file
+        checks_filesystem = any(
+            profile.auto_export and profile.export_formats and profile.export_path
+            for profile in config.profiles
+        )
+        if key is not None and not checks_filesystem:
+            _validation_cache[key] = list(errors)
+            if len(_validation_cache) > VALIDATION_CACHE_SIZE:
+                _validation_cache.popitem(last=False)
         
         return errors
     
-    def _validate_profile(self, profile: SavedSearchProfile) -> List[str]:
-        """Validate individual profile"""
+    def validate_model(self, config: AdvancedSearchConfig) -> List[str]:
+        """
+        Validate an already parsed configuration and return any errors
+        
+        Args:
+            config: Parsed configuration
+            
+        Returns:
+            List of validation error messages (empty if valid)
+        """
+        errors = []
+        
+        # Additional validation checks
+        if not config.profiles:
+            errors.append("Configuration must have at least one profile")
+        
+        # Check for duplicate profile names
+        profile_names = [p.name for p in config.profiles]
+        if len(profile_names) != len(set(profile_names)):
+            errors.append("Profile names must be unique")
+        
+        # Validate each profile, checking each export directory only once
+        export_dirs: Dict[Path, bool] = {}
+        for i, profile in enumerate(config.profiles):
+            profile_errors = self._validate_profile(profile, export_dirs)
+            for error in profile_errors:
+                errors.append(f"Profile '{profile.name}' (#{i+1}): {error}")
+        
+        return errors
+    
+    def _validate_profile(
+        self,
+        profile: SavedSearchProfile,
+        export_dirs: Optional[Dict[Path, bool]] = None
+    ) -> List[str]:
+        """Validate individual profile, recording export directory checks in export_dirs"""
+        if export_dirs is None:
+            export_dirs = {}
+        
         errors = []
         
         # Check required fields
@@ -258,9 +333,11 @@ class ConfigManager:
             
             if profile.export_path:
                 try:
-                    export_path = Path(profile.export_path)
-                    if not export_path.parent.exists():
-                        errors.append(f"Export directory does not exist: {export_path.parent}")
+                    parent = Path(profile.export_path).parent
+                    if parent not in export_dirs:
+                        export_dirs[parent] = parent.exists()
+                    if not export_dirs[parent]:
+                        errors.append(f"Export directory does not exist: {parent}")
                 except Exception:
                     errors.append("Invalid export path")
         
@@ -269,7 +346,7 @@ class ConfigManager:
     def show_config_summary(self, config_path: Optional[Path] = None) -> None:
         """Display a summary of the configuration"""
         try:
-            config = self.load_config(config_path)
+            config = self.load_config(config_path, copy=False)
             
             console.print(f"\n[bold cyan]Configuration Summary[/bold cyan]")
             console.print(f"Name: {config.name or 'Unnamed'}")
@@ -278,6 +355,8 @@ class ConfigManager:
             console.print(f"Profiles: {len(config.profiles)}")
             
             if config.profiles:
+                from rich.table import Table
+                
                 table = Table(title="Search Profiles")
                 table.add_column("Name", style="cyan")
                 table.add_column("Description", style="white")
@@ -314,6 +393,11 @@ class ConfigManager:
         except ConfigManagerError as e:
             console.print(f"[red]Error loading configuration: {e}[/red]")
     
+    def clear_cache(self) -> None:
+        """Forget cached parsed configurations and validation results"""
+        ConfigParser.clear_cache()
+        _validation_cache.clear()
+    
     def get_config_dir(self) -> Path:
         """Get the configuration directory path"""
         return self.config_dir
@@ -339,5 +423,23 @@ class ConfigManager:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         backup_path = config_path.with_suffix(f".backup_{timestamp}{config_path.suffix}")
         
-        backup_path.write_bytes(config_path.read_bytes())
-        return backup_path
\ No newline at end of file
+        # copyfile uses the kernel's copy path (sendfile) instead of reading
+        # the file into memory; the rename keeps partial backups out of view
+        temp_path = backup_path.with_name(backup_path.name + ".tmp")
+        try:
+            shutil.copyfile(config_path, temp_path)
+            os.replace(temp_path, backup_path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+            raise
+        return backup_path
+
+
+@functools.cache
+def get_config_manager() -> ConfigManager:
+    """
+    Get the process-wide configuration manager for the default config directory
+
+    Use ``get_config_manager.cache_clear()`` to drop it, e.g. in tests.
+    """
+    return ConfigManager()
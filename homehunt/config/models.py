@@ -3,6 +3,7 @@ Advanced configuration models for HomeHunt
 Supports YAML/JSON configuration files with complex search criteria
 """
 
+import re
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -10,8 +11,14 @@ from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field, field_validator
 
-from homehunt.cli.config import CommuteConfig, SearchConfig
-from homehunt.exports.models import ExportConfig
+from homehunt.cli.config import TRANSPORT_MODES, CommuteConfig, SearchConfig
+from homehunt.exports.models import ExportConfig, ExportFormat
+
+# Allowed scheduled export formats, built once rather than per validation
+EXPORT_FORMATS = frozenset(fmt.value for fmt in ExportFormat)
+
+# Canonical zero-padded HH:MM times, accepted without splitting and parsing
+_HHMM_RE = re.compile(r"(?:[01]\d|2[0-3]):[0-5]\d")
 
 
 class ConfigFormat(str, Enum):
@@ -137,9 +144,8 @@ class CommuteFilter(BaseModel):
     @field_validator('transport_modes')
     def validate_transport_modes(cls, v):
         """Validate transport modes"""
-        valid_modes = {"public_transport", "cycling", "walking", "driving"}
         for mode in v:
-            if mode not in valid_modes:
+            if mode not in TRANSPORT_MODES:
                 raise ValueError(f"Invalid transport mode: {mode}")
         return v
     
@@ -148,6 +154,10 @@ class CommuteFilter(BaseModel):
         """Validate time format"""
         if v:
             for time_str in v:
+                if _HHMM_RE.fullmatch(time_str):
+                    continue
+                
+                # Anything else (e.g. "8:00") goes through the full check
                 try:
                     hours, minutes = time_str.split(':')
                     hour = int(hours)
@@ -292,9 +302,8 @@ class SavedSearchProfile(BaseModel):
     def validate_export_formats(cls, v):
         """Validate export formats"""
         if v:
-            valid_formats = {"csv", "json", "google_sheets"}
             for fmt in v:
-                if fmt not in valid_formats:
+                if fmt not in EXPORT_FORMATS:
                     raise ValueError(f"Invalid export format: {fmt}")
         return v
 
@@ -390,6 +399,17 @@ class AdvancedSearchConfig(BaseModel):
             raise ValueError("Profile names must be unique")
         return v
     
+    def profiles_by_name(self) -> Dict[str, SavedSearchProfile]:
+        """
+        Index profiles by name for repeated lookups, first match winning
+        
+        The index is a snapshot; rebuild it after changing the profiles.
+        """
+        index: Dict[str, SavedSearchProfile] = {}
+        for profile in self.profiles:
+            index.setdefault(profile.name, profile)
+        return index
+    
     def get_profile(self, name: str) -> Optional[SavedSearchProfile]:
         """Get a profile by name"""
         for profile in self.profiles:
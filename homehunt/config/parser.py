@@ -3,9 +3,12 @@ Configuration file parser for HomeHunt
 Handles YAML and JSON configuration files with validation
 """
 
+import hashlib
 import json
+import os
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 import yaml
 from pydantic import ValidationError
@@ -15,6 +18,37 @@ from homehunt.core.models import Portal, PropertyType
 
 from .models import AdvancedSearchConfig, ConfigFormat, SavedSearchProfile
 
+# Use libyaml's C loader and dumper when PyYAML was built with them
+try:
+    from yaml import CSafeDumper as YamlSafeDumper
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeDumper as YamlSafeDumper
+    from yaml import SafeLoader as YamlSafeLoader
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib json module
+    orjson = None
+
+# Parsed YAML configs are cached as JSON in the user's HomeHunt directory,
+# one file per source path, rather than beside the user's own files. Bump the
+# version when the config models change shape so stale caches are ignored.
+CONFIG_CACHE_DIR = Path.home() / ".homehunt" / "cache" / "configs"
+CONFIG_CACHE_VERSION = 1
+
+# Parsed configs by resolved path, with the (mtime_ns, size) they were
+# parsed at and their JSON form for making copies; a changed file replaces
+# its own entry rather than adding one
+CONFIG_CACHE_SIZE = 64
+_config_cache: "OrderedDict[str, Tuple[int, int, AdvancedSearchConfig, bytes]]" = OrderedDict()
+
+# Enum-valued list fields of a search config, with their name in errors
+_ENUM_FIELDS = (
+    ('portals', Portal, 'portal'),
+    ('property_types', PropertyType, 'property type'),
+)
+
 
 class ConfigParserError(Exception):
     """Configuration parsing error"""
@@ -43,19 +77,22 @@ class ConfigParser:
             raise ConfigParserError(f"Configuration file not found: {file_path}")
         
         try:
-            content = file_path.read_text(encoding='utf-8')
             format_type = ConfigParser.detect_format(file_path)
             
             if format_type == ConfigFormat.YAML:
-                return yaml.safe_load(content) or {}
+                content = file_path.read_text(encoding='utf-8')
+                return yaml.load(content, Loader=YamlSafeLoader) or {}
             elif format_type == ConfigFormat.JSON:
-                return json.loads(content)
+                # Both parsers take raw bytes, skipping a separate text decode
+                content = file_path.read_bytes()
+                return orjson.loads(content) if orjson is not None else json.loads(content)
             else:
                 raise ConfigParserError(f"Unsupported format: {format_type}")
                 
         except yaml.YAMLError as e:
             raise ConfigParserError(f"Invalid YAML syntax: {e}")
         except json.JSONDecodeError as e:
+            # orjson.JSONDecodeError subclasses this
             raise ConfigParserError(f"Invalid JSON syntax: {e}")
         except Exception as e:
             raise ConfigParserError(f"Error reading file: {e}")
@@ -75,17 +112,37 @@ class ConfigParser:
             if format_type == ConfigFormat.YAML:
                 content = yaml.dump(
                     config_dict,
+                    Dumper=YamlSafeDumper,
                     default_flow_style=False,
                     allow_unicode=True,
                     sort_keys=False,
                     indent=2
                 )
             elif format_type == ConfigFormat.JSON:
-                content = json.dumps(config_dict, indent=2, ensure_ascii=False)
+                if orjson is not None:
+                    content = orjson.dumps(config_dict, option=orjson.OPT_INDENT_2).decode('utf-8')
+                else:
+                    content = json.dumps(config_dict, indent=2, ensure_ascii=False)
             else:
                 raise ConfigParserError(f"Unsupported format: {format_type}")
             
-            file_path.write_text(content, encoding='utf-8')
+            # Write beside the target and rename over it, so readers never
+            # see a partially written configuration
+            temp_path = file_path.with_name(file_path.name + ".tmp")
+            try:
+                temp_path.write_text(content, encoding='utf-8')
+                stat = temp_path.stat()
+                os.replace(temp_path, file_path)
+            except OSError:
+                temp_path.unlink(missing_ok=True)
+                raise
+            
+            # Drop cached parses of the old contents, even if the rewrite kept
+            # the same size within the filesystem's mtime resolution
+            ConfigParser.cache_path(file_path).unlink(missing_ok=True)
+            _config_cache.pop(str(file_path.resolve()), None)
+            
+            _seed_config_cache(file_path, config_dict, stat.st_mtime_ns, stat.st_size)
             
         except Exception as e:
             raise ConfigParserError(f"Error saving file: {e}")
@@ -93,33 +150,21 @@ class ConfigParser:
     @staticmethod
     def normalize_enum_values(data: Dict[str, Any]) -> Dict[str, Any]:
         """Normalize enum values in configuration data"""
-        normalized = data.copy()
+        normalized = dict(data)
         
-        # Normalize portal values
-        if 'portals' in normalized:
-            portals = []
-            for portal in normalized['portals']:
-                if isinstance(portal, str):
-                    try:
-                        portals.append(Portal(portal.lower()))
-                    except ValueError:
-                        raise ConfigParserError(f"Invalid portal: {portal}")
-                else:
-                    portals.append(portal)
-            normalized['portals'] = portals
-        
-        # Normalize property types
-        if 'property_types' in normalized:
-            prop_types = []
-            for prop_type in normalized['property_types']:
-                if isinstance(prop_type, str):
+        for key, enum_cls, label in _ENUM_FIELDS:
+            if key not in normalized:
+                continue
+            
+            values = []
+            for value in normalized[key]:
+                if isinstance(value, str):
                     try:
-                        prop_types.append(PropertyType(prop_type.lower()))
+                        value = enum_cls(value.lower())
                     except ValueError:
-                        raise ConfigParserError(f"Invalid property type: {prop_type}")
-                else:
-                    prop_types.append(prop_type)
-            normalized['property_types'] = prop_types
+                        raise ConfigParserError(f"Invalid {label}: {value}")
+                values.append(value)
+            normalized[key] = values
         
         return normalized
     
@@ -201,6 +246,68 @@ class ConfigParser:
         except Exception as e:
             raise ConfigParserError(f"Unexpected error parsing configuration: {e}")
     
+    @staticmethod
+    def parse_config_cached(file_path: Union[str, Path], copy: bool = True) -> AdvancedSearchConfig:
+        """
+        Parse configuration file, reusing the result while the file is unchanged
+
+        Parsed configs are cached by path, modification time and size, so
+        repeated loads of the same file in one process skip re-parsing, and
+        YAML files also get a JSON cache under CONFIG_CACHE_DIR that is reused
+        across runs while the file is unchanged. By default each call returns its own
+        copy, so callers may modify it freely.
+
+        Args:
+            file_path: Path to configuration file
+            copy: Return a private copy; read-only callers can pass
+                False to share the cached instance and skip the copy
+
+        Returns:
+            AdvancedSearchConfig instance
+
+        Raises:
+            ConfigParserError: If parsing fails
+        """
+        file_path = Path(file_path)
+        
+        try:
+            stat = file_path.stat()
+        except OSError:
+            # Let the uncached path report the missing/unreadable file
+            return ConfigParser.parse_config(file_path)
+        
+        key = str(file_path.resolve())
+        entry = _config_cache.get(key)
+        if entry is not None and entry[:2] == (stat.st_mtime_ns, stat.st_size):
+            _config_cache.move_to_end(key)
+        else:
+            config = _parse_config_source(Path(key), stat.st_mtime_ns, stat.st_size)
+            entry = (stat.st_mtime_ns, stat.st_size, config, _config_json(config))
+            _config_cache[key] = entry
+            if len(_config_cache) > CONFIG_CACHE_SIZE:
+                _config_cache.popitem(last=False)
+        
+        if not copy:
+            return entry[2]
+        
+        # Validating fresh data from the JSON form is several times faster than
+        # model_copy(deep=True) and shares no mutable state with the cache
+        payload = entry[3]
+        return AdvancedSearchConfig.model_validate(
+            orjson.loads(payload) if orjson is not None else json.loads(payload)
+        )
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget all in-memory parsed configs (JSON cache files are left alone)"""
+        _config_cache.clear()
+    
+    @staticmethod
+    def cache_path(file_path: Path) -> Path:
+        """Path of the JSON cache for a configuration file, named by its resolved path"""
+        digest = hashlib.sha256(str(file_path.resolve()).encode('utf-8')).hexdigest()
+        return CONFIG_CACHE_DIR / f"{file_path.stem}-{digest[:16]}.json"
+    
     @staticmethod
     def create_template_config() -> AdvancedSearchConfig:
         """Create a template configuration with examples"""
@@ -279,4 +386,82 @@ class ConfigParser:
             save_to_database=True
         )
         
-        return config
\ No newline at end of file
+        return config
+
+
+def _parse_config_source(file_path: Path, mtime_ns: int, size: int) -> AdvancedSearchConfig:
+    """Parse a config file, via its JSON cache for YAML files"""
+    if file_path.suffix.lower() not in ('.yaml', '.yml'):
+        return ConfigParser.parse_config(file_path)
+    
+    cache_path = ConfigParser.cache_path(file_path)
+    source = _cache_source(file_path, mtime_ns, size)
+    
+    config = _read_config_cache(cache_path, source)
+    if config is None:
+        config = ConfigParser.parse_config(file_path)
+        _write_config_cache(cache_path, source, config)
+    return config
+
+
+def _cache_source(file_path: Path, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Identify the exact source file state a JSON cache was written for"""
+    return {
+        "version": CONFIG_CACHE_VERSION,
+        "path": str(file_path.resolve()),
+        "mtime_ns": mtime_ns,
+        "size": size,
+    }
+
+
+def _read_config_cache(cache_path: Path, source: Dict[str, Any]) -> Optional[AdvancedSearchConfig]:
+    """Load a JSON cache if it was written for this exact source file state"""
+    try:
+        content = cache_path.read_bytes()
+        cached = orjson.loads(content) if orjson is not None else json.loads(content)
+        if cached.get("source") != source:
+            return None
+        return AdvancedSearchConfig.model_validate(cached["config"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        # Missing, unreadable or stale cache: fall back to parsing the source
+        return None
+
+
+def _seed_config_cache(file_path: Path, config_dict: Dict[str, Any], mtime_ns: int, size: int) -> None:
+    """Cache a just-saved config, so reloading it skips reading and parsing the file"""
+    # Validating the dict that was written gives what a re-parse would; a
+    # config that does not survive the round trip is simply left uncached
+    try:
+        config = AdvancedSearchConfig.model_validate(config_dict)
+    except ValidationError:
+        return
+    
+    if file_path.suffix.lower() in ('.yaml', '.yml'):
+        source = _cache_source(file_path, mtime_ns, size)
+        _write_config_cache(ConfigParser.cache_path(file_path), source, config)
+    
+    _config_cache[str(file_path.resolve())] = (mtime_ns, size, config, _config_json(config))
+    if len(_config_cache) > CONFIG_CACHE_SIZE:
+        _config_cache.popitem(last=False)
+
+
+def _config_json(config: AdvancedSearchConfig) -> bytes:
+    """Serialize a config to JSON bytes"""
+    data = config.model_dump(mode='json')
+    return orjson.dumps(data) if orjson is not None else json.dumps(data).encode('utf-8')
+
+
+def _write_config_cache(cache_path: Path, source: Dict[str, Any], config: AdvancedSearchConfig) -> None:
+    """Write a JSON cache atomically; failures only cost the next run a re-parse"""
+    cached = {"source": source, "config": config.model_dump(mode='json')}
+    if orjson is not None:
+        payload = orjson.dumps(cached)
+    else:
+        payload = json.dumps(cached).encode('utf-8')
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(payload)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
@@ -2,7 +2,6 @@
 Core data models and database functionality for HomeHunt
 """
 
-from .db import Database, Listing, PriceHistory, SearchHistory, db, get_db, init_db
 from .models import (
     ExtractionMethod,
     Portal,
@@ -25,7 +24,30 @@ __all__ = [
     "Listing",
     "PriceHistory",
     "SearchHistory",
-    "db",
     "init_db",
     "get_db",
 ]
+
+# Database names are resolved on first access (PEP 562): importing any
+# ``homehunt.core`` submodule runs this file, and the CLI should not pull in
+# SQLModel/SQLAlchemy until a command needs the database. The shared
+# ``Database`` instance stays at ``homehunt.core.db.db``: once imported, the
+# ``db`` submodule itself is bound to that name on this package.
+_LAZY_IMPORTS = {
+    "Database": ".db",
+    "Listing": ".db",
+    "PriceHistory": ".db",
+    "SearchHistory": ".db",
+    "init_db": ".db",
+    "get_db": ".db",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,12 +2,17 @@
 Database models and connection management for HomeHunt
 """
 
+import copy
+import functools
 import json
 import logging
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlmodel import Field, Session, SQLModel, create_engine, func, select, update
 
@@ -247,22 +252,68 @@ class SearchHistory(SQLModel, table=True):
     )
 
 
+DEFAULT_DATABASE_URL = "sqlite:///homehunt.db"
+
+# Listings committed per transaction by Database.save_properties
+SAVE_BATCH_SIZE = 500
+
+# get_statistics_cached results, keyed by database URL and table version,
+# with the monotonic time they were computed; entries expire after the TTL
+# because recent_activity and last_updated are relative to the current time
+STATISTICS_CACHE_SIZE = 4
+STATISTICS_CACHE_TTL = 60.0
+_statistics_cache: "OrderedDict[tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+
+@functools.cache
+def get_engine(database_url: str = DEFAULT_DATABASE_URL) -> Engine:
+    """Get the process-wide synchronous engine for a database URL"""
+    return create_engine(database_url, echo=False)
+
+
+@functools.cache
+def get_async_engine(database_url: str = DEFAULT_DATABASE_URL) -> AsyncEngine:
+    """Get the process-wide asynchronous engine (and its pool) for a database URL"""
+    return create_async_engine(
+        database_url.replace("sqlite:///", "sqlite+aiosqlite:///"),
+        echo=False,
+        pool_pre_ping=True,
+    )
+
+
 class Database:
     """
     Database connection and operations manager
+
+    Instances for the same URL share one engine and connection pool, so
+    creating a Database per command or service is cheap. Use it as an async
+    context manager to release pooled connections when done.
     """
 
-    def __init__(self, database_url: str = "sqlite:///homehunt.db"):
+    def __init__(
+        self,
+        database_url: str = DEFAULT_DATABASE_URL,
+        engine: Optional[Engine] = None,
+        async_engine: Optional[AsyncEngine] = None,
+    ):
         self.database_url = database_url
-        self.engine = create_engine(database_url, echo=False)
-        self.async_engine = create_async_engine(
-            database_url.replace("sqlite:///", "sqlite+aiosqlite:///"), echo=False
-        )
+        self.engine = engine or get_engine(database_url)
+        self.async_engine = async_engine or get_async_engine(database_url)
         self.async_session = sessionmaker(
             self.async_engine, class_=AsyncSession, expire_on_commit=False
         )
         self.logger = logging.getLogger(__name__)
 
+    async def __aenter__(self) -> "Database":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def pool_status(self) -> str:
+        """Describe the state of the shared async connection pool"""
+        return self.async_engine.pool.status()
+
     def create_tables(self):
         """Create all database tables"""
         SQLModel.metadata.create_all(self.engine)
@@ -301,46 +352,7 @@ class Database:
                 existing = result.scalar_one_or_none()
 
                 if existing:
-                    # Update existing property
-                    existing.last_scraped = datetime.utcnow()
-                    existing.scrape_count += 1
-
-                    # Update fields that might have changed
-                    existing.price = listing.price
-                    existing.price_numeric = listing.price_numeric
-                    existing.description = listing.description
-                    existing.available_date = listing.available_date
-                    existing.agent_name = listing.agent_name
-                    existing.agent_phone = listing.agent_phone
-                    existing.parking = listing.parking
-                    existing.garden = listing.garden
-                    existing.balcony = listing.balcony
-                    existing.pets_allowed = listing.pets_allowed
-                    existing.let_type = listing.let_type
-                    existing.latitude = listing.latitude
-                    existing.longitude = listing.longitude
-                    existing.is_active = listing.is_active
-                    existing.status = "active"
-
-                    # Track price changes
-                    if (
-                        existing.price_numeric
-                        and listing.price_numeric
-                        and existing.price_numeric != listing.price_numeric
-                    ):
-                        price_change = PriceHistory(
-                            property_uid=listing.uid,
-                            price=listing.price,
-                            price_numeric=listing.price_numeric,
-                            price_change=listing.price_numeric - existing.price_numeric,
-                            price_change_percent=(
-                                (listing.price_numeric - existing.price_numeric)
-                                / existing.price_numeric
-                            )
-                            * 100,
-                        )
-                        session.add(price_change)
-
+                    self._update_listing(session, existing, listing)
                     self.logger.info(f"Updated property {listing.uid}")
                 else:
                     # Create new property
@@ -355,6 +367,98 @@ class Database:
             self.logger.error(f"Error saving property {listing.uid}: {e}")
             return False
 
+    def _update_listing(
+        self, session: AsyncSession, existing: Listing, listing: "PropertyListing"
+    ) -> None:
+        """Refresh a stored listing from a newly scraped one"""
+        existing.last_scraped = datetime.utcnow()
+        existing.scrape_count += 1
+
+        # Update fields that might have changed
+        existing.price = listing.price
+        existing.price_numeric = listing.price_numeric
+        existing.description = listing.description
+        existing.available_date = listing.available_date
+        existing.agent_name = listing.agent_name
+        existing.agent_phone = listing.agent_phone
+        existing.parking = listing.parking
+        existing.garden = listing.garden
+        existing.balcony = listing.balcony
+        existing.pets_allowed = listing.pets_allowed
+        existing.let_type = listing.let_type
+        existing.latitude = listing.latitude
+        existing.longitude = listing.longitude
+        existing.is_active = listing.is_active
+        existing.status = "active"
+
+        # Track price changes
+        if (
+            existing.price_numeric
+            and listing.price_numeric
+            and existing.price_numeric != listing.price_numeric
+        ):
+            price_change = PriceHistory(
+                property_uid=listing.uid,
+                price=listing.price,
+                price_numeric=listing.price_numeric,
+                price_change=listing.price_numeric - existing.price_numeric,
+                price_change_percent=(
+                    (listing.price_numeric - existing.price_numeric)
+                    / existing.price_numeric
+                )
+                * 100,
+            )
+            session.add(price_change)
+
+    async def save_properties(
+        self,
+        listings: Sequence["PropertyListing"],
+        batch_size: int = SAVE_BATCH_SIZE,
+    ) -> int:
+        """
+        Save or update many property listings
+
+        Each batch is handled in one session: existing rows are loaded with a
+        single query and all inserts and updates are committed together.
+
+        Args:
+            listings: PropertyListings to save
+            batch_size: Number of listings per transaction
+
+        Returns:
+            Number of listings saved successfully
+        """
+        saved = 0
+        for start in range(0, len(listings), batch_size):
+            batch = listings[start : start + batch_size]
+            try:
+                async with self.async_session() as session:
+                    result = await session.execute(
+                        select(Listing).where(
+                            Listing.uid.in_({listing.uid for listing in batch})
+                        )
+                    )
+                    rows = {row.uid: row for row in result.scalars()}
+
+                    for listing in batch:
+                        existing = rows.get(listing.uid)
+                        if existing:
+                            self._update_listing(session, existing, listing)
+                        else:
+                            rows[listing.uid] = Listing.from_property_listing(listing)
+                            session.add(rows[listing.uid])
+
+                    await session.commit()
+                    saved += len(batch)
+                    self.logger.info(f"Saved batch of {len(batch)} properties")
+
+            except Exception as e:
+                self.logger.error(
+                    f"Error saving batch of {len(batch)} properties: {e}"
+                )
+
+        return saved
+
     async def get_property(self, uid: str) -> Optional["PropertyListing"]:
         """Get a property by UID"""
         try:
@@ -372,9 +476,120 @@ class Database:
             self.logger.error(f"Error getting property {uid}: {e}")
             return None
 
+    def _search_query(
+        self,
+        portal: Optional[Portal],
+        portals: Optional[Sequence[Portal]],
+        min_price: Optional[int],
+        max_price: Optional[int],
+        bedrooms: Optional[int],
+        property_type: Optional[PropertyType],
+        postcode_area: Optional[str],
+        max_commute: Optional[int],
+        limit: int,
+        columns: Optional[Sequence[Any]] = None,
+    ):
+        """Build the filtered listing query shared by search and iteration"""
+        query = select(*columns) if columns else select(Listing)
+        query = query.where(Listing.is_active == True)
+
+        if portal:
+            query = query.where(Listing.portal == portal)
+
+        if portals:
+            query = query.where(Listing.portal.in_(portals))
+
+        if min_price:
+            query = query.where(Listing.price_numeric >= min_price)
+
+        if max_price:
+            query = query.where(Listing.price_numeric <= max_price)
+
+        if bedrooms:
+            query = query.where(Listing.bedrooms == bedrooms)
+
+        if property_type:
+            query = query.where(Listing.property_type == property_type)
+
+        if postcode_area:
+            query = query.where(Listing.postcode.like(f"{postcode_area}%"))
+
+        if max_commute:
+            query = query.where(Listing.commute_public_transport <= max_commute)
+
+        return query.limit(limit).order_by(Listing.last_scraped.desc())
+
+    async def iter_properties(
+        self,
+        portal: Optional[Portal] = None,
+        portals: Optional[Sequence[Portal]] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        bedrooms: Optional[int] = None,
+        property_type: Optional[PropertyType] = None,
+        postcode_area: Optional[str] = None,
+        max_commute: Optional[int] = None,
+        limit: int = 100,
+        batch_size: int = 100,
+    ) -> AsyncIterator["PropertyListing"]:
+        """
+        Stream properties matching the filters, batch_size rows at a time
+
+        Takes the same filters as search_properties, but yields each listing as
+        it is fetched instead of materializing the full result list.
+        """
+        try:
+            async with self.async_session() as session:
+                query = self._search_query(
+                    portal, portals, min_price, max_price, bedrooms,
+                    property_type, postcode_area, max_commute, limit,
+                ).execution_options(yield_per=batch_size)
+
+                async for listing in await session.stream_scalars(query):
+                    yield listing.to_property_listing()
+
+        except Exception as e:
+            self.logger.error(f"Error streaming properties: {e}")
+
+    async def iter_rows(
+        self,
+        columns: Sequence[str],
+        portal: Optional[Portal] = None,
+        portals: Optional[Sequence[Portal]] = None,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        bedrooms: Optional[int] = None,
+        property_type: Optional[PropertyType] = None,
+        postcode_area: Optional[str] = None,
+        max_commute: Optional[int] = None,
+        limit: int = 100,
+        batch_size: int = 100,
+    ) -> AsyncIterator[tuple]:
+        """
+        Stream raw column values for listings matching the filters
+
+        Takes the same filters as search_properties, but selects only the
+        named listing columns and yields plain tuples, skipping model
+        construction entirely.
+        """
+        try:
+            async with self.async_session() as session:
+                query = self._search_query(
+                    portal, portals, min_price, max_price, bedrooms,
+                    property_type, postcode_area, max_commute, limit,
+                    columns=[getattr(Listing, name) for name in columns],
+                ).execution_options(yield_per=batch_size)
+
+                async for row in await session.stream(query):
+                    yield tuple(row)
+
+        except Exception as e:
+            self.logger.error(f"Error streaming listing rows: {e}")
+
     async def search_properties(
         self,
         portal: Optional[Portal] = None,
+        portals: Optional[Sequence[Portal]] = None,
         min_price: Optional[int] = None,
         max_price: Optional[int] = None,
         bedrooms: Optional[int] = None,
@@ -388,6 +603,7 @@ class Database:
 
         Args:
             portal: Filter by portal
+            portals: Filter by any of several portals
             min_price: Minimum price in pence
             max_price: Maximum price in pence
             bedrooms: Exact number of bedrooms
@@ -401,30 +617,10 @@ class Database:
         """
         try:
             async with self.async_session() as session:
-                query = select(Listing).where(Listing.is_active == True)
-
-                if portal:
-                    query = query.where(Listing.portal == portal)
-
-                if min_price:
-                    query = query.where(Listing.price_numeric >= min_price)
-
-                if max_price:
-                    query = query.where(Listing.price_numeric <= max_price)
-
-                if bedrooms:
-                    query = query.where(Listing.bedrooms == bedrooms)
-
-                if property_type:
-                    query = query.where(Listing.property_type == property_type)
-
-                if postcode_area:
-                    query = query.where(Listing.postcode.like(f"{postcode_area}%"))
-
-                if max_commute:
-                    query = query.where(Listing.commute_public_transport <= max_commute)
-
-                query = query.limit(limit).order_by(Listing.last_scraped.desc())
+                query = self._search_query(
+                    portal, portals, min_price, max_price, bedrooms,
+                    property_type, postcode_area, max_commute, limit,
+                )
 
                 result = await session.execute(query)
                 listings = result.scalars().all()
@@ -491,6 +687,44 @@ class Database:
             self.logger.error(f"Error getting statistics: {e}")
             return {}
 
+    async def get_statistics_cached(self) -> Dict[str, Any]:
+        """
+        Get database statistics, reusing a recent result while the table is unchanged
+
+        The table version is the latest scrape time, the row count, the number
+        of active rows and the sum of prices, which is one cheap aggregate
+        query compared with the full statistics scan. Results are kept in
+        memory for STATISTICS_CACHE_TTL seconds, so this only helps long-lived
+        processes that ask for statistics repeatedly.
+        """
+        try:
+            async with self.async_session() as session:
+                version = await session.execute(
+                    select(
+                        func.max(Listing.last_scraped),
+                        func.count(Listing.uid),
+                        func.sum(Listing.is_active),
+                        func.sum(Listing.price_numeric),
+                    )
+                )
+                key = (self.database_url, *version.one())
+        except Exception as e:
+            self.logger.error(f"Error getting statistics version: {e}")
+            return await self.get_statistics()
+
+        entry = _statistics_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < STATISTICS_CACHE_TTL:
+            _statistics_cache.move_to_end(key)
+            return copy.deepcopy(entry[1])
+
+        stats = await self.get_statistics()
+        if stats:
+            _statistics_cache[key] = (time.monotonic(), copy.deepcopy(stats))
+            _statistics_cache.move_to_end(key)
+            if len(_statistics_cache) > STATISTICS_CACHE_SIZE:
+                _statistics_cache.popitem(last=False)
+        return stats
+
     async def cleanup_old_data(self, days: int = 30):
         """Remove old inactive properties"""
         try:
@@ -511,9 +745,14 @@ class Database:
             self.logger.error(f"Error cleaning up old data: {e}")
 
     async def close(self):
-        """Close database connections"""
+        """
+        Release pooled connections
+
+        The engines stay usable afterwards. Async connections are bound to the
+        running event loop, so they must be released before the loop closes;
+        the next use opens fresh ones.
+        """
         await self.async_engine.dispose()
-        self.engine.dispose()
 
 
 # Global database instance
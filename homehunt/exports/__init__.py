@@ -9,8 +9,6 @@ from .models import (
     GoogleSheetsConfig,
     SyncConfig,
 )
-from .client import GoogleSheetsClient
-from .service import ExportService
 
 __all__ = [
     "ExportConfig",
@@ -19,4 +17,22 @@ __all__ = [
     "SyncConfig",
     "GoogleSheetsClient",
     "ExportService",
-]
\ No newline at end of file
+]
+
+# The service (database stack) and Google Sheets client (Google API stack) are
+# resolved on first access (PEP 562) so that file exports and importing
+# ``homehunt.exports.models`` do not pay for them
+_LAZY_IMPORTS = {
+    "GoogleSheetsClient": ".client",
+    "ExportService": ".service",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
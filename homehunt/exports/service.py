@@ -3,19 +3,24 @@ Export service for HomeHunt
 Handles property data formatting and export operations
 """
 
+import asyncio
 import csv
 import json
 import uuid
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional
 
 from rich.console import Console
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 from homehunt.core.db import Database
 from homehunt.core.models import PropertyListing
 
-from .client import GoogleSheetsClient, GoogleSheetsError
 from .models import (
     ExportConfig,
     ExportFormat,
@@ -27,6 +32,51 @@ from .models import (
 
 console = Console()
 
+# Scraping metadata fields dropped when include_metadata is off
+METADATA_FIELDS = ['first_seen', 'last_seen', 'is_active', 'scrape_count', 'extraction_method', 'content_length']
+
+# Export fields of a stored listing, in export order, mapped to the listing
+# column they come from and how the stored value is converted (None: as is)
+_COLUMN_FIELDS = {
+    'property_id': ('property_id', None),
+    'uid': ('uid', None),
+    'url': ('url', None),
+    'title': ('title', None),
+    'price': ('price', None),
+    'price_numeric': ('price_numeric', None),
+    'bedrooms': ('bedrooms', None),
+    'bathrooms': ('bathrooms', None),
+    'property_type': ('property_type', 'enum'),
+    'portal': ('portal', 'enum'),
+    'area': ('area', None),
+    'address': ('address', None),
+    'postcode': ('postcode', None),
+    'latitude': ('latitude', None),
+    'longitude': ('longitude', None),
+    'description': ('description', None),
+    'features': ('features', 'json_list'),
+    'parking': ('parking', None),
+    'garden': ('garden', None),
+    'balcony': ('balcony', None),
+    'pets_allowed': ('pets_allowed', None),
+    'let_type': ('let_type', 'enum'),
+    'furnished': ('furnished', None),
+    'available_date': ('available_date', None),
+    'agent_name': ('agent_name', None),
+    'agent_phone': ('agent_phone', None),
+    'extraction_method': ('extraction_method', 'enum'),
+    'content_length': ('content_length', None),
+    'images': ('images', 'json_list'),
+    'is_active': ('is_active', None),
+    'first_seen': ('first_seen', 'date'),
+    'last_seen': ('last_scraped', 'date'),
+    'scrape_count': ('scrape_count', None),
+    'commute_public_transport': ('commute_public_transport', None),
+    'commute_cycling': ('commute_cycling', None),
+    'commute_walking': ('commute_walking', None),
+    'commute_driving': ('commute_driving', None),
+}
+
 
 class ExportServiceError(Exception):
     """Export service error"""
@@ -63,6 +113,14 @@ class ExportService:
         started_at = datetime.utcnow()
         
         try:
+            # File exports straight from the database are streamed row by row;
+            # CSV reads just the selected columns when no Python-side filter applies
+            if properties is None and config.format in (ExportFormat.CSV, ExportFormat.JSON):
+                if (config.format == ExportFormat.CSV and not config.date_range
+                        and self._selected_fields(_COLUMN_FIELDS, config)):
+                    return await self._export_csv_rows(config, started_at)
+                return await self._export_stream(config, started_at)
+            
             # Get properties if not provided
             if properties is None:
                 properties = await self._fetch_properties(config)
@@ -121,6 +179,30 @@ class ExportService:
                 error_details={"exception_type": type(e).__name__}
             )
     
+    async def export_all(self, configs: List[ExportConfig]) -> List[ExportResult]:
+        """
+        Run several exports concurrently, querying the database once per filter set
+        
+        Args:
+            configs: Export configurations (typically one per format)
+            
+        Returns:
+            Export results, in the same order as configs
+        """
+        # Exports that share database filters share one fetched property list
+        fetched: Dict[frozenset, List[PropertyListing]] = {}
+        batches = []
+        for config in configs:
+            filters = frozenset(self._search_filters(config).items())
+            if filters not in fetched:
+                fetched[filters] = await self._fetch_properties(config)
+            batches.append(fetched[filters])
+        
+        return await asyncio.gather(*(
+            self.export_properties(config, properties)
+            for config, properties in zip(configs, batches)
+        ))
+    
     async def sync_exports(self, sync_config: SyncConfig) -> SyncResult:
         """
         Execute multiple exports as part of sync operation
@@ -192,9 +274,8 @@ class ExportService:
                 errors=[str(e)]
             )
     
-    async def _fetch_properties(self, config: ExportConfig) -> List[PropertyListing]:
-        """Fetch properties from database based on config filters"""
-        # Build filter parameters
+    def _search_filters(self, config: ExportConfig) -> Dict[str, Any]:
+        """Build database search filters from export config"""
         kwargs = {}
         
         if config.portal_filter:
@@ -207,7 +288,7 @@ class ExportService:
                 except ValueError:
                     console.print(f"[yellow]Warning: Unknown portal '{portal_str}'[/yellow]")
             if portals:
-                kwargs['portal'] = portals[0]  # Database search takes single portal
+                kwargs['portals'] = tuple(portals)
         
         if config.price_range:
             if 'min' in config.price_range:
@@ -215,11 +296,31 @@ class ExportService:
             if 'max' in config.price_range:
                 kwargs['max_price'] = int(config.price_range['max'] * 100)  # Convert to pence
         
-        # Fetch properties
-        properties = await self.db.search_properties(limit=10000, **kwargs)
+        return kwargs
+    
+    async def _fetch_properties(self, config: ExportConfig) -> List[PropertyListing]:
+        """Fetch properties from database based on config filters"""
+        properties = await self.db.search_properties(limit=10000, **self._search_filters(config))
         
         return properties
     
+    async def stream_properties(self, config: ExportConfig) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream formatted export rows from the database
+        
+        Applies the same filters and formatting as export_properties, but
+        yields one row at a time instead of building the full list.
+        
+        Args:
+            config: Export configuration
+            
+        Yields:
+            Formatted property rows
+        """
+        async for prop in self.db.iter_properties(limit=10000, **self._search_filters(config)):
+            if self._matches_filters(prop, config):
+                yield self._format_property(prop, config)
+    
     async def _fetch_properties_for_sync(self, sync_config: SyncConfig) -> List[PropertyListing]:
         """Fetch properties for sync operation"""
         if sync_config.only_active_properties:
@@ -232,91 +333,111 @@ class ExportService:
     
     def _filter_properties(self, properties: List[PropertyListing], config: ExportConfig) -> List[PropertyListing]:
         """Apply additional filtering to properties"""
-        filtered = properties
+        if not config.date_range:
+            return properties
         
+        return [p for p in properties if self._matches_filters(p, config)]
+    
+    def _matches_filters(self, prop: PropertyListing, config: ExportConfig) -> bool:
+        """Check a single property against the additional filters"""
         # Date range filtering
         if config.date_range:
-            if 'start' in config.date_range:
-                start_date = config.date_range['start']
-                filtered = [p for p in filtered if p.last_scraped >= start_date]
+            if 'start' in config.date_range and prop.last_scraped < config.date_range['start']:
+                return False
             
-            if 'end' in config.date_range:
-                end_date = config.date_range['end']
-                filtered = [p for p in filtered if p.last_scraped <= end_date]
+            if 'end' in config.date_range and prop.last_scraped > config.date_range['end']:
+                return False
         
-        return filtered
+        return True
     
     def _format_property_data(self, properties: List[PropertyListing], config: ExportConfig) -> List[Dict[str, Any]]:
         """Format property data for export"""
-        formatted_properties = []
-        
-        for prop in properties:
-            # Convert property to dict - now includes all new fields
-            data = {
-                'property_id': prop.property_id,
-                'uid': prop.uid,
-                'url': prop.url,
-                'title': prop.title,
-                'price': prop.price,
-                'price_numeric': prop.price_numeric,
-                'bedrooms': prop.bedrooms,
-                'bathrooms': prop.bathrooms,
-                'property_type': prop.property_type.value if prop.property_type else None,
-                'portal': prop.portal.value,
-                'area': prop.area,
-                'address': prop.address,
-                'postcode': prop.postcode,
-                'latitude': prop.latitude,
-                'longitude': prop.longitude,
-                'description': prop.description,
-                'features': ', '.join(prop.features) if prop.features else None,
-                'parking': prop.parking,
-                'garden': prop.garden,
-                'balcony': prop.balcony,
-                'pets_allowed': prop.pets_allowed,
-                'let_type': prop.let_type.value if prop.let_type else None,
-                'furnished': prop.furnished,
-                'available_date': prop.available_date,
-                'agent_name': prop.agent_name,
-                'agent_phone': prop.agent_phone,
-                'extraction_method': prop.extraction_method.value,
-                'content_length': prop.content_length,
-                'images': ', '.join(prop.images) if prop.images else None,
-                'is_active': prop.is_active,
-                'first_seen': prop.first_seen.strftime(config.date_format) if prop.first_seen else None,
-                'last_seen': prop.last_scraped.strftime(config.date_format) if prop.last_scraped else None,
-                'scrape_count': prop.scrape_count,
-            }
-            
-            # Add commute data if available
-            commute_fields = ['commute_public_transport', 'commute_cycling', 'commute_walking', 'commute_driving']
-            for field in commute_fields:
-                if hasattr(prop, field):
-                    data[field] = getattr(prop, field)
-            
-            # Add calculated score if available
-            if hasattr(prop, 'calculated_score'):
-                data['score'] = getattr(prop, 'calculated_score')
-            
-            # Apply field filtering
-            if config.include_fields:
-                data = {k: v for k, v in data.items() if k in config.include_fields}
-            elif config.exclude_fields:
-                data = {k: v for k, v in data.items() if k not in config.exclude_fields}
-            
-            # Handle URLs
-            if not config.include_urls and 'url' in data:
-                del data['url']
-            
-            # Remove metadata if not wanted
-            if not config.include_metadata:
-                metadata_fields = ['first_seen', 'last_seen', 'is_active', 'scrape_count', 'extraction_method', 'content_length']
-                for field in metadata_fields:
-                    data.pop(field, None)
-            
-            formatted_properties.append(data)
-        
-        return formatted_properties
+        return [self._format_property(prop, config) for prop in properties]
+    
+    def _format_property(self, prop: PropertyListing, config: ExportConfig) -> Dict[str, Any]:
+        """Format a single property for export"""
+        # Convert property to dict - now includes all new fields
+        data = {
+            'property_id': prop.property_id,
+            'uid': prop.uid,
+            'url': prop.url,
+            'title': prop.title,
+            'price': prop.price,
+            'price_numeric': prop.price_numeric,
+            'bedrooms': prop.bedrooms,
+            'bathrooms': prop.bathrooms,
+            'property_type': prop.property_type.value if prop.property_type else None,
+            'portal': prop.portal.value,
+            'area': prop.area,
+            'address': prop.address,
+            'postcode': prop.postcode,
+            'latitude': prop.latitude,
+            'longitude': prop.longitude,
+            'description': prop.description,
+            'features': ', '.join(prop.features) if prop.features else None,
+            'parking': prop.parking,
+            'garden': prop.garden,
+            'balcony': prop.balcony,
+            'pets_allowed': prop.pets_allowed,
+            'let_type': prop.let_type.value if prop.let_type else None,
+            'furnished': prop.furnished,
+            'available_date': prop.available_date,
+            'agent_name': prop.agent_name,
+            'agent_phone': prop.agent_phone,
+            'extraction_method': prop.extraction_method.value,
+            'content_length': prop.content_length,
+            'images': ', '.join(prop.images) if prop.images else None,
+            'is_active': prop.is_active,
+            'first_seen': prop.first_seen.strftime(config.date_format) if prop.first_seen else None,
+            'last_seen': prop.last_scraped.strftime(config.date_format) if prop.last_scraped else None,
+            'scrape_count': prop.scrape_count,
+        }
+        
+        # Add commute data if available
+        commute_fields = ['commute_public_transport', 'commute_cycling', 'commute_walking', 'commute_driving']
+        for field in commute_fields:
+            if hasattr(prop, field):
+                data[field] = getattr(prop, field)
+        
+        # Add calculated score if available
+        if hasattr(prop, 'calculated_score'):
+            data['score'] = getattr(prop, 'calculated_score')
+        
+        return {field: data[field] for field in self._selected_fields(data, config)}
+    
+    def _selected_fields(self, fields: Iterable[str], config: ExportConfig) -> List[str]:
+        """Apply field selection, URL and metadata settings to ordered field names"""
+        # Apply field filtering
+        if config.include_fields:
+            selected = [f for f in fields if f in config.include_fields]
+        elif config.exclude_fields:
+            selected = [f for f in fields if f not in config.exclude_fields]
+        else:
+            selected = list(fields)
+        
+        # Handle URLs
+        if not config.include_urls:
+            selected = [f for f in selected if f != 'url']
+        
+        # Remove metadata if not wanted
+        if not config.include_metadata:
+            selected = [f for f in selected if f not in METADATA_FIELDS]
+        
+        return selected
+    
+    def _column_converter(self, kind: str, config: ExportConfig) -> Callable[[Any], Any]:
+        """Conversion from a stored listing value to its export value"""
+        if kind == 'enum':
+            return lambda value: value.value if value is not None else None
+        if kind == 'json_list':
+            def join_list(value):
+                items = json.loads(value) if value else None
+                return ', '.join(items) if items else None
+            return join_list
+        if kind == 'date':
+            date_format = config.date_format
+            return lambda value: value.strftime(date_format) if value else None
+        raise ValueError(f"Unknown column kind: {kind}")
     
     async def _export_csv(self, data: List[Dict[str, Any]], config: ExportConfig) -> str:
         """Export data to CSV file"""
@@ -360,17 +481,159 @@ class ExportService:
             'properties': data
         }
         
-        with open(output_path, 'w', encoding='utf-8') as jsonfile:
-            json.dump(export_data, jsonfile, indent=2, default=str)
+        if orjson is not None:
+            output_path.write_bytes(orjson.dumps(export_data, option=orjson.OPT_INDENT_2, default=str))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as jsonfile:
+                json.dump(export_data, jsonfile, indent=2, default=str)
         
         console.print(f"[green]Exported {len(data)} properties to {output_path}[/green]")
         return str(output_path)
     
+    async def _export_stream(self, config: ExportConfig, started_at: datetime) -> ExportResult:
+        """Stream rows from the database straight into a CSV or JSON file"""
+        if not config.output_path:
+            raise ExportServiceError(f"Output path required for {config.format.value.upper()} export")
+        
+        rows = self.stream_properties(config)
+        try:
+            first_row = await anext(rows)
+        except StopAsyncIteration:
+            return ExportResult(
+                success=True,
+                format=config.format,
+                properties_exported=0,
+                started_at=started_at,
+                completed_at=datetime.utcnow(),
+                error_message="No properties to export"
+            )
+        
+        output_path = Path(config.output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        count = 1
+        try:
+            if config.format == ExportFormat.CSV:
+                with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
+                    writer = csv.DictWriter(csvfile, fieldnames=list(first_row.keys()))
+                    writer.writeheader()
+                    writer.writerow(first_row)
+                    async for row in rows:
+                        writer.writerow(row)
+                        count += 1
+            else:
+                with open(output_path, 'wb') as jsonfile:
+                    # Same document shape as _export_json; metadata goes last
+                    # because the row count is only known once streaming ends
+                    jsonfile.write(b'{\n  "properties": [\n')
+                    jsonfile.write(self._json_row(first_row, indent=4))
+                    async for row in rows:
+                        jsonfile.write(b',\n')
+                        jsonfile.write(self._json_row(row, indent=4))
+                        count += 1
+                    metadata = {
+                        'exported_at': datetime.utcnow().isoformat(),
+                        'property_count': count,
+                        'format_version': '1.0'
+                    }
+                    jsonfile.write(b'\n  ],\n  "metadata": ')
+                    jsonfile.write(self._json_row(metadata, indent=2).lstrip())
+                    jsonfile.write(b'\n}')
+        finally:
+            await rows.aclose()
+        
+        console.print(f"[green]Exported {count} properties to {output_path}[/green]")
+        
+        return ExportResult(
+            success=True,
+            format=config.format,
+            output_location=str(output_path),
+            properties_exported=count,
+            file_size_bytes=output_path.stat().st_size,
+            started_at=started_at,
+            completed_at=datetime.utcnow()
+        )
+    
+    async def _export_csv_rows(self, config: ExportConfig, started_at: datetime) -> ExportResult:
+        """Stream the selected listing columns straight from the database into a CSV file"""
+        if not config.output_path:
+            raise ExportServiceError("Output path required for CSV export")
+        
+        fields = self._selected_fields(_COLUMN_FIELDS, config)
+        converters = [
+            (index, self._column_converter(_COLUMN_FIELDS[field][1], config))
+            for index, field in enumerate(fields)
+            if _COLUMN_FIELDS[field][1]
+        ]
+        
+        rows = self.db.iter_rows(
+            [_COLUMN_FIELDS[field][0] for field in fields],
+            limit=10000,
+            **self._search_filters(config),
+        )
+        try:
+            first_row = await anext(rows)
+        except StopAsyncIteration:
+            return ExportResult(
+                success=True,
+                format=config.format,
+                properties_exported=0,
+                started_at=started_at,
+                completed_at=datetime.utcnow(),
+                error_message="No properties to export"
+            )
+        
+        def convert(row: tuple) -> list:
+            values = list(row)
+            for index, converter in converters:
+                values[index] = converter(values[index])
+            return values
+        
+        output_path = Path(config.output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        count = 1
+        try:
+            with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(fields)
+                writer.writerow(convert(first_row))
+                async for row in rows:
+                    writer.writerow(convert(row))
+                    count += 1
+        finally:
+            await rows.aclose()
+        
+        console.print(f"[green]Exported {count} properties to {output_path}[/green]")
+        
+        return ExportResult(
+            success=True,
+            format=config.format,
+            output_location=str(output_path),
+            properties_exported=count,
+            file_size_bytes=output_path.stat().st_size,
+            started_at=started_at,
+            completed_at=datetime.utcnow()
+        )
+    
+    @staticmethod
+    def _json_row(row: Dict[str, Any], indent: int) -> bytes:
+        """Serialize one object as pretty-printed JSON bytes, nested indent spaces deep"""
+        if orjson is not None:
+            content = orjson.dumps(row, option=orjson.OPT_INDENT_2, default=str)
+        else:
+            content = json.dumps(row, indent=2, default=str).encode('utf-8')
+        padding = b' ' * indent
+        return padding + content.replace(b'\n', b'\n' + padding)
+    
     async def _export_google_sheets(self, data: List[Dict[str, Any]], config: ExportConfig) -> str:
         """Export data to Google Sheets"""
         if not config.google_sheets:
             raise ExportServiceError("Google Sheets configuration required")
         
+        # The Google API client stack is slow to import, so only load it here
+        from .client import GoogleSheetsClient, GoogleSheetsError
+        
         sheets_config = config.google_sheets
         
         try:
@@ -6,6 +6,7 @@ import asyncio
 import logging
 import time
 from abc import ABC, abstractmethod
+from collections import Counter
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
@@ -262,10 +263,10 @@ class BaseScraper(ABC):
         
         if failed > 0:
             # Log common error types
-            error_types = {}
-            for result in results:
-                if not result.success and result.error:
-                    error_type = result.error.split(':')[0]
-                    error_types[error_type] = error_types.get(error_type, 0) + 1
+            error_types = Counter(
+                result.error.partition(':')[0]
+                for result in results
+                if not result.success and result.error
+            )
             
-            self.logger.info(f"Error breakdown: {error_types}")
\ No newline at end of file
+            self.logger.info(f"Error breakdown: {dict(error_types)}")
\ No newline at end of file
@@ -3,6 +3,7 @@ Fire Crawl scraper for search discovery and Zoopla properties
 Based on validated testing showing Fire Crawl's effectiveness for these use cases
 """
 
+import asyncio
 import json
 import os
 import re
@@ -74,10 +75,12 @@ class FireCrawlScraper(BaseScraper):
             
             self.logger.info(f"Fire Crawl scraping search page: {url}")
             
-            # Make Fire Crawl request
-            response = self.firecrawl_client.scrape_url(
+            # Make Fire Crawl request; the client is synchronous, so run it in a
+            # worker thread to keep concurrent scrapes from blocking the loop
+            response = await asyncio.to_thread(
+                self.firecrawl_client.scrape_url,
                 url=url,
-                params=scrape_options
+                params=scrape_options,
             )
             
             if not response.get("success", False):
@@ -119,10 +122,12 @@ class FireCrawlScraper(BaseScraper):
             
             self.logger.debug(f"Fire Crawl scraping property: {url}")
             
-            # Make Fire Crawl request
-            response = self.firecrawl_client.scrape_url(
+            # Make Fire Crawl request; the client is synchronous, so run it in a
+            # worker thread to keep concurrent scrapes from blocking the loop
+            response = await asyncio.to_thread(
+                self.firecrawl_client.scrape_url,
                 url=url,
-                params=scrape_options
+                params=scrape_options,
             )
             
             if not response.get("success", False):
@@ -8,7 +8,7 @@ Hybrid scraper coordinator implementing optimal cost/performance strategy
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 from rich.console import Console
@@ -29,6 +29,9 @@ from .firecrawl import FireCrawlScraper
 # Import URL builder from CLI
 from homehunt.cli.url_builder import build_search_urls
 
+# Portal batches saved to the database at once while scraping continues
+MAX_CONCURRENT_SAVES = 2
+
 
 class HybridScraper:
     """
@@ -45,6 +48,7 @@ class HybridScraper:
     ):
         self.database = database or Database()
         self.dedupe_hours = dedupe_hours
+        self.max_concurrent = max_concurrent
         self.logger = logging.getLogger(__name__)
         self.console = Console()
         
@@ -135,13 +139,34 @@ class HybridScraper:
                     "Scraping properties...", total=len(deduplicated_urls)
                 )
                 
-                properties = await self._scrape_properties_hybrid(
-                    deduplicated_urls, progress, scraping_task
-                )
+                # Step 4: Save each portal's properties in the background as soon
+                # as that portal is scraped, overlapping saves with scraping
+                save_task = progress.add_task("Saving properties...", total=None)
+                save_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SAVES)
+                pending_saves = []
+                self.stats["properties_saved"] = 0
+                
+                async def save_batch(listings: List[PropertyListing]) -> None:
+                    async with save_semaphore:
+                        await self._save_properties(listings, progress, save_task)
+                
+                try:
+                    properties = await self._scrape_properties_hybrid(
+                        deduplicated_urls,
+                        progress,
+                        scraping_task,
+                        on_scraped=lambda listings: pending_saves.append(
+                            asyncio.create_task(save_batch(listings))
+                        ),
+                    )
+                    progress.update(save_task, total=len(properties))
+                finally:
+                    # Let in-flight saves finish even if scraping failed
+                    save_results = await asyncio.gather(*pending_saves, return_exceptions=True)
                 
-                # Step 4: Save properties to database
-                save_task = progress.add_task("Saving properties...", total=len(properties))
-                await self._save_properties(properties, progress, save_task)
+                for result in save_results:
+                    if isinstance(result, Exception):
+                        raise result
                 
                 self.stats["end_time"] = datetime.utcnow()
                 
@@ -178,23 +203,31 @@ class HybridScraper:
             
             progress.update(task_id, total=len(search_urls))
             
-            # Scrape each search page
-            for search_url in search_urls:
-                try:
-                    urls = await self.firecrawl_scraper.scrape_search_page(search_url)
-                    all_urls.extend(urls)
-                    self.stats["firecrawl_requests"] += 1
+            # Scrape search pages concurrently, bounded by max_concurrent
+            semaphore = asyncio.Semaphore(self.max_concurrent)
+            
+            async def scrape_page(search_url: str) -> List[str]:
+                async with semaphore:
+                    try:
+                        urls = await self.firecrawl_scraper.scrape_search_page(search_url)
+                    except Exception as e:
+                        self.logger.error(f"Error scraping search page {search_url}: {e}")
+                        self.stats["errors"] += 1
+                        urls = []
+                    else:
+                        self.stats["firecrawl_requests"] += 1
+                        all_urls.extend(urls)
                     
                     progress.update(
                         task_id,
                         advance=1,
                         description=f"Discovered {len(all_urls)} properties..."
                     )
-                    
-                except Exception as e:
-                    self.logger.error(f"Error scraping search page {search_url}: {e}")
-                    self.stats["errors"] += 1
-                    continue
+                    return urls
+            
+            # Results come back in search page order, whatever order pages finish in
+            page_results = await asyncio.gather(*(scrape_page(url) for url in search_urls))
+            all_urls = [url for urls in page_results for url in urls]
             
             # Remove duplicates
             unique_urls = list(dict.fromkeys(all_urls))
@@ -270,8 +303,21 @@ class HybridScraper:
         urls: List[str],
         progress: Progress,
         task_id: int,
+        on_scraped: Optional[Callable[[List[PropertyListing]], Any]] = None,
     ) -> List[PropertyListing]:
-        """Scrape properties using hybrid approach (Fire Crawl + Direct HTTP)"""
+        """
+        Scrape properties using hybrid approach (Fire Crawl + Direct HTTP)
+        
+        Args:
+            urls: Property URLs to scrape
+            progress: Progress tracker
+            task_id: Progress task to advance per scraped URL
+            on_scraped: Optional callback given each portal's listings as soon
+                as that portal finishes, while other portals are still running
+            
+        Returns:
+            List of PropertyListing objects
+        """
         properties = []
         
         try:
@@ -291,51 +337,28 @@ class HybridScraper:
                 f"{len(zoopla_urls)} Zoopla properties via Fire Crawl"
             )
             
-            # Scrape Rightmove properties using Direct HTTP (90% of requests)
+            # Scrape Rightmove properties using Direct HTTP (90% of requests) and
+            # Zoopla properties using Fire Crawl (10% of requests) concurrently
+            batches = []
             if rightmove_urls:
-                rightmove_results = await self.direct_http_scraper.scrape_properties_batch(
+                batches.append(self.direct_http_scraper.scrape_properties_batch(
                     rightmove_urls, progress, task_id
-                )
+                ))
                 self.stats["direct_http_requests"] += len(rightmove_urls)
-                
-                # Convert successful results to PropertyListing objects
-                for result in rightmove_results:
-                    if result.success and result.data:
-                        try:
-                            property_listing = PropertyListing.from_extraction_result(
-                                portal=result.portal.value,
-                                property_id=result.property_id,
-                                url=result.url,
-                                extraction_result=result.data,
-                                extraction_method=result.extraction_method.value,
-                            )
-                            properties.append(property_listing)
-                        except Exception as e:
-                            self.logger.error(f"Error creating PropertyListing: {e}")
-                            self.stats["errors"] += 1
-            
-            # Scrape Zoopla properties using Fire Crawl (10% of requests)
             if zoopla_urls:
-                zoopla_results = await self.firecrawl_scraper.scrape_properties_batch(
+                batches.append(self.firecrawl_scraper.scrape_properties_batch(
                     zoopla_urls, progress, task_id
-                )
+                ))
                 self.stats["firecrawl_requests"] += len(zoopla_urls)
-                
-                # Convert successful results to PropertyListing objects
-                for result in zoopla_results:
-                    if result.success and result.data:
-                        try:
-                            property_listing = PropertyListing.from_extraction_result(
-                                portal=result.portal.value,
-                                property_id=result.property_id,
-                                url=result.url,
-                                extraction_result=result.data,
-                                extraction_method=result.extraction_method.value,
-                            )
-                            properties.append(property_listing)
-                        except Exception as e:
-                            self.logger.error(f"Error creating PropertyListing: {e}")
-                            self.stats["errors"] += 1
+            
+            async def scrape_portal(batch) -> List[PropertyListing]:
+                listings = self._to_listings(await batch)
+                if on_scraped is not None:
+                    on_scraped(listings)
+                return listings
+            
+            for listings in await asyncio.gather(*(scrape_portal(batch) for batch in batches)):
+                properties.extend(listings)
             
             self.stats["properties_scraped"] = len(properties)
             
@@ -350,29 +373,37 @@ class HybridScraper:
             self.logger.error(f"Error scraping properties: {e}")
             raise ScraperError(f"Property scraping failed: {e}")
     
+    def _to_listings(self, results: List[ScrapingResult]) -> List[PropertyListing]:
+        """Convert successful scraping results to PropertyListing objects"""
+        listings = []
+        for result in results:
+            if result.success and result.data:
+                try:
+                    property_listing = PropertyListing.from_extraction_result(
+                        portal=result.portal.value,
+                        property_id=result.property_id,
+                        url=result.url,
+                        extraction_result=result.data,
+                        extraction_method=result.extraction_method.value,
+                    )
+                    listings.append(property_listing)
+                except Exception as e:
+                    self.logger.error(f"Error creating PropertyListing: {e}")
+                    self.stats["errors"] += 1
+        return listings
+    
     async def _save_properties(
         self,
         properties: List[PropertyListing],
         progress: Progress,
         task_id: int,
     ) -> None:
-        """Save properties to database"""
-        saved_count = 0
-        
+        """Save properties to database in batched transactions"""
         try:
-            for property_listing in properties:
-                try:
-                    success = await self.database.save_property(property_listing)
-                    if success:
-                        saved_count += 1
-                    
-                    progress.update(task_id, advance=1)
-                    
-                except Exception as e:
-                    self.logger.error(f"Error saving property {property_listing.uid}: {e}")
-                    self.stats["errors"] += 1
+            saved_count = await self.database.save_properties(properties)
+            progress.update(task_id, advance=len(properties))
             
-            self.stats["properties_saved"] = saved_count
+            self.stats["properties_saved"] += saved_count
             
             self.logger.info(
                 f"Saved {saved_count}/{len(properties)} properties to database"
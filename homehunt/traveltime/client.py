@@ -2,6 +2,8 @@
 TravelTime API client for commute analysis
 """
 
+import functools
+import importlib.util
 import logging
 import os
 from typing import Dict, List, Optional, Tuple
@@ -11,6 +13,29 @@ from pydantic import ValidationError
 
 from .models import CommuteResult, GeocodingResult, Location
 
+# Transport modes with a travel time field on CommuteResult
+COMMUTE_MODES = frozenset({"public_transport", "driving", "cycling", "walking"})
+
+# HTTP/2 needs the optional h2 package; fall back to keep-alive HTTP/1.1
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def build_async_client(timeout: int = 30) -> httpx.AsyncClient:
+    """
+    Build an httpx client for the TravelTime API with connection reuse
+
+    Args:
+        timeout: Request timeout in seconds
+
+    Returns:
+        AsyncClient keeping up to 16 connections alive (HTTP/2 when available)
+    """
+    return httpx.AsyncClient(
+        timeout=timeout,
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+    )
+
 
 class TravelTimeClient:
     """
@@ -22,7 +47,8 @@ class TravelTimeClient:
         self,
         app_id: Optional[str] = None,
         api_key: Optional[str] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        http_client: Optional[httpx.AsyncClient] = None
     ):
         self.app_id = app_id or os.getenv("TRAVELTIME_APP_ID")
         self.api_key = api_key or os.getenv("TRAVELTIME_API_KEY")
@@ -34,6 +60,31 @@ class TravelTimeClient:
             raise ValueError(
                 "TravelTime API credentials required. Set TRAVELTIME_APP_ID and TRAVELTIME_API_KEY"
             )
+        
+        # One HTTP client is reused for every request so connections stay
+        # alive; it is created on first use unless one is injected
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
+    
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Shared HTTP client for API requests"""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = build_async_client(self.timeout)
+            self._owns_http_client = True
+        return self._http_client
+    
+    async def aclose(self):
+        """Close the HTTP client if this instance created it"""
+        if self._owns_http_client and self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+    
+    async def __aenter__(self) -> "TravelTimeClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
     
     @property
     def headers(self) -> Dict[str, str]:
@@ -55,31 +106,30 @@ class TravelTimeClient:
             GeocodingResult with coordinates or None if failed
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/v4/geocoding/search",
-                    headers=self.headers,
-                    params={"query": address, "limit": 1}
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                if not data.get("features"):
-                    self.logger.warning(f"No geocoding results for address: {address}")
-                    return None
-                
-                feature = data["features"][0]
-                geometry = feature["geometry"]
-                properties = feature.get("properties", {})
-                
-                return GeocodingResult(
-                    address=address,
-                    lat=geometry["coordinates"][1],  # TravelTime returns [lng, lat]
-                    lng=geometry["coordinates"][0],
-                    formatted_address=properties.get("label"),
-                    confidence=properties.get("confidence")
-                )
-                
+            response = await self.http_client.get(
+                f"{self.base_url}/v4/geocoding/search",
+                headers=self.headers,
+                params={"query": address, "limit": 1}
+            )
+            response.raise_for_status()
+            
+            data = response.json()
+            if not data.get("features"):
+                self.logger.warning(f"No geocoding results for address: {address}")
+                return None
+            
+            feature = data["features"][0]
+            geometry = feature["geometry"]
+            properties = feature.get("properties", {})
+            
+            return GeocodingResult(
+                address=address,
+                lat=geometry["coordinates"][1],  # TravelTime returns [lng, lat]
+                lng=geometry["coordinates"][0],
+                formatted_address=properties.get("label"),
+                confidence=properties.get("confidence")
+            )
+            
         except httpx.HTTPError as e:
             self.logger.error(f"HTTP error geocoding address {address}: {e}")
             return None
@@ -168,17 +218,16 @@ class TravelTimeClient:
                 "departure_searches": departure_searches
             }
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/v4/time-filter",
-                    headers=self.headers,
-                    json=request_body
-                )
-                response.raise_for_status()
-                
-                data = response.json()
-                return self._parse_commute_results(data, origins, dest_id, transport_modes)
-                
+            response = await self.http_client.post(
+                f"{self.base_url}/v4/time-filter",
+                headers=self.headers,
+                json=request_body
+            )
+            response.raise_for_status()
+            
+            data = response.json()
+            return self._parse_commute_results(data, origins, dest_id, transport_modes)
+            
         except httpx.HTTPError as e:
             self.logger.error(f"HTTP error calculating commutes: {e}")
             return self._create_error_results(origins, dest_id, str(e))
@@ -196,6 +245,19 @@ class TravelTimeClient:
         """Parse API response into CommuteResult objects"""
         results = []
         
+        # Index each requested mode's locations by origin ID once, rather
+        # than scanning every location list for every origin
+        mode_locations = []
+        for search in api_response.get("results", []):
+            mode = search["search_id"].replace("commute_", "")
+            if mode not in transport_modes or mode not in COMMUTE_MODES:
+                continue
+            
+            locations = {}
+            for location in search.get("locations", []):
+                locations.setdefault(location["id"], location)
+            mode_locations.append((mode, locations))
+        
         # Create a result for each origin
         for origin_id, _, _ in origins:
             result_data = {
@@ -205,26 +267,11 @@ class TravelTimeClient:
             }
             
             # Extract travel times for each mode
-            for search in api_response.get("results", []):
-                mode = search["search_id"].replace("commute_", "")
-                if mode not in transport_modes:
-                    continue
-                
-                # Find this origin in the results
-                for location in search.get("locations", []):
-                    if location["id"] == origin_id:
-                        travel_time_seconds = location["properties"][0]["travel_time"]
-                        travel_time_minutes = travel_time_seconds // 60
-                        
-                        if mode == "public_transport":
-                            result_data["public_transport"] = travel_time_minutes
-                        elif mode == "driving":
-                            result_data["driving"] = travel_time_minutes
-                        elif mode == "cycling":
-                            result_data["cycling"] = travel_time_minutes
-                        elif mode == "walking":
-                            result_data["walking"] = travel_time_minutes
-                        break
+            for mode, locations in mode_locations:
+                location = locations.get(origin_id)
+                if location is not None:
+                    travel_time_seconds = location["properties"][0]["travel_time"]
+                    result_data[mode] = travel_time_seconds // 60
             
             try:
                 results.append(CommuteResult(**result_data))
@@ -298,4 +345,15 @@ class TravelTimeClient:
             departure_time=departure_time
         )
         
-        return results[0] if results else None
\ No newline at end of file
+        return results[0] if results else None
+
+
+@functools.cache
+def get_traveltime_client() -> TravelTimeClient:
+    """
+    Get the process-wide TravelTime client
+
+    Credentials come from the environment. The client keeps its connections
+    alive between commands; close it with ``aclose()`` when done.
+    """
+    return TravelTimeClient()
@@ -15,6 +15,14 @@ from homehunt.core.models import PropertyListing
 from .client import TravelTimeClient
 from .models import CommuteResult
 
+# Listing attribute holding the stored commute time for each transport mode
+COMMUTE_FIELDS = {
+    "public_transport": "commute_public_transport",
+    "cycling": "commute_cycling",
+    "walking": "commute_walking",
+    "driving": "commute_driving",
+}
+
 
 class TravelTimeService:
     """
@@ -188,21 +196,35 @@ class TravelTimeService:
         Returns:
             Filtered list of properties
         """
+        return await self.filter_by_commute_limits(
+            properties, [(transport_mode, max_commute_time)]
+        )
+    
+    async def filter_by_commute_limits(
+        self,
+        properties: List[PropertyListing],
+        limits: List[Tuple[str, int]]
+    ) -> List[PropertyListing]:
+        """
+        Filter properties against several commute limits in a single pass
+        
+        Args:
+            properties: List of properties to filter
+            limits: (transport_mode, max_commute_time) pairs a property must all meet
+            
+        Returns:
+            Filtered list of properties
+        """
+        # Unknown modes have no stored time, so they exclude every property
+        checks = [(COMMUTE_FIELDS.get(mode), max_time) for mode, max_time in limits]
         filtered = []
         
         for prop in properties:
-            commute_time = None
-            
-            if transport_mode == "public_transport":
-                commute_time = prop.commute_public_transport
-            elif transport_mode == "cycling":
-                commute_time = prop.commute_cycling
-            elif transport_mode == "walking":
-                commute_time = prop.commute_walking
-            elif transport_mode == "driving":
-                commute_time = prop.commute_driving
-            
-            if commute_time is not None and commute_time <= max_commute_time:
+            for field, max_time in checks:
+                commute_time = getattr(prop, field) if field else None
+                if commute_time is None or commute_time > max_time:
+                    break
+            else:
                 filtered.append(prop)
         
         return filtered
@@ -5,71 +5,144 @@ Extract structured property data from Fire Crawl response
 
 from firecrawl import FirecrawlApp
 from dotenv import load_dotenv
+import asyncio
 import os
 import re
+from pathlib import Path
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 import json
-from pydantic import BaseModel, Field
+from dataclasses import asdict, dataclass, field
 from typing import List, Optional
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 load_dotenv()
 console = Console()
 
-class PropertyListing(BaseModel):
+# Individual property scraping: how many to sample and how many in flight
+INDIVIDUAL_SAMPLE_SIZE = 5
+MAX_CONCURRENT_SCRAPES = 5
+
+# Precompiled patterns (hot path: run once per property section). Price and
+# bedroom patterns use possessive quantifiers (Python 3.11+) so failed attempts
+# on digit-heavy text never backtrack
+PROP_ID_RE = re.compile(r'rightmove\.co\.uk/properties/(\d+)')
+PRICE_RE = re.compile(r'£[\d,]++\s*+(?:pcm|per month|pw|per week)', re.IGNORECASE)
+BED_RE = re.compile(r'(\d++)\s*+bed(?:room)?+s?+', re.IGNORECASE)
+
+# All four section patterns in one alternation so the markdown is walked once;
+# the matching branch is identified by ``match.lastgroup``. An image match
+# stops at its own ``](`` (markdown-escaped brackets are allowed in the alt
+# text); the alt text it consumes is searched for price and bedrooms separately
+SECTION_RE = re.compile(
+    r'rightmove\.co\.uk/properties/(?P<pid>\d+)'
+    r'|!\[(?P<alt>(?:\\.|[^\]\\])*+)\]\((?P<img>https://media\.rightmove\.co\.uk/[^)]+)\)'
+    r'|(?P<price>£[\d,]++\s*+(?i:pcm|per month|pw|per week))'
+    r'|(?P<beds>\d++)\s*+(?i:bed(?:room)?+s?+)'
+)
+
+@dataclass(slots=True)
+class PropertyListing:
     """Extracted property data"""
-    property_id: Optional[str] = Field(default=None, description="Rightmove property ID")
-    url: Optional[str] = Field(default=None, description="Property URL")
-    price: Optional[str] = Field(default=None, description="Rental price")
-    bedrooms: Optional[int] = Field(default=None, description="Number of bedrooms")
-    address: Optional[str] = Field(default=None, description="Property address")
-    description: Optional[str] = Field(default=None, description="Property description")
-    images: List[str] = Field(default_factory=list, description="Image URLs")
+    property_id: Optional[str] = None  # Rightmove property ID
+    url: Optional[str] = None  # Property URL
+    price: Optional[str] = None  # Rental price
+    bedrooms: Optional[int] = None  # Number of bedrooms
+    address: Optional[str] = None  # Property address
+    description: Optional[str] = None  # Property description
+    images: List[str] = field(default_factory=list)  # Image URLs
+
+def iter_property_ids(markdown_content: str):
+    """Yield every Rightmove property ID in markdown content (may repeat)"""
+    for match in PROP_ID_RE.finditer(markdown_content):
+        yield match.group(1)
 
 def extract_property_ids(markdown_content: str) -> List[str]:
     """Extract property IDs from markdown content"""
-    # Look for Rightmove property URLs
-    pattern = r'rightmove\.co\.uk/properties/(\d+)'
-    matches = re.findall(pattern, markdown_content)
-    return list(set(matches))  # Remove duplicates
+    # De-duplicate in first-seen order
+    return list(dict.fromkeys(iter_property_ids(markdown_content)))
 
 def extract_property_details(markdown_content: str) -> List[PropertyListing]:
     """Extract property details from markdown"""
     properties = []
+    current = None
     
-    # Split content into potential property sections
-    # Look for property IDs as section markers
-    property_sections = re.split(r'(?=rightmove\.co\.uk/properties/\d+)', markdown_content)
-    
-    for section in property_sections:
-        if 'rightmove.co.uk/properties/' in section:
-            property_data = PropertyListing()
-            
-            # Extract property ID
-            id_match = re.search(r'rightmove\.co\.uk/properties/(\d+)', section)
-            if id_match:
-                property_data.property_id = id_match.group(1)
-                property_data.url = f"https://www.rightmove.co.uk/properties/{property_data.property_id}"
-            
-            # Extract images
-            image_matches = re.findall(r'!\[.*?\]\((https://media\.rightmove\.co\.uk/[^)]+)\)', section)
-            property_data.images = image_matches
-            
-            # Look for price information
-            price_match = re.search(r'£[\d,]+\s*(?:pcm|per month|pw|per week)', section, re.IGNORECASE)
-            if price_match:
-                property_data.price = price_match.group(0)
-            
-            # Look for bedroom count
-            bed_match = re.search(r'(\d+)\s*bed(?:room)?s?', section, re.IGNORECASE)
-            if bed_match:
-                property_data.bedrooms = int(bed_match.group(1))
-            
-            properties.append(property_data)
+    # Each property ID starts a new listing; images, price and bedrooms that
+    # follow belong to it until the next ID (first price/bedroom match wins)
+    for match in SECTION_RE.finditer(markdown_content):
+        kind = match.lastgroup
+        
+        if kind == 'pid':
+            property_id = match.group('pid')
+            current = PropertyListing(
+                property_id=property_id,
+                url=f"https://www.rightmove.co.uk/properties/{property_id}",
+            )
+            properties.append(current)
+        elif current is None:
+            continue
+        elif kind == 'img':
+            current.images.append(match.group('img'))
+            alt = match.group('alt')
+            if current.price is None:
+                price_match = PRICE_RE.search(alt)
+                if price_match:
+                    current.price = price_match.group(0)
+            if current.bedrooms is None:
+                bed_match = BED_RE.search(alt)
+                if bed_match:
+                    current.bedrooms = int(bed_match.group(1))
+        elif kind == 'price':
+            if current.price is None:
+                current.price = match.group('price')
+        elif current.bedrooms is None:
+            current.bedrooms = int(match.group('beds'))
     
     return properties
 
+def write_json(path: str, data) -> None:
+    """Write data (dataclasses allowed) to a pretty-printed JSON file"""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        Path(path).write_text(json.dumps(data, indent=2, default=asdict), encoding='utf-8')
+
+async def scrape_properties(app: FirecrawlApp, property_ids: List[str], max_concurrency: int = MAX_CONCURRENT_SCRAPES) -> list:
+    """Scrape individual property pages concurrently
+    
+    FirecrawlApp is synchronous, so each scrape runs in a worker thread; the
+    semaphore bounds how many requests are in flight at once. Failed scrapes
+    are returned as exceptions rather than aborting the batch.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    
+    async def scrape_one(property_id: str):
+        async with semaphore:
+            url = f"https://www.rightmove.co.uk/properties/{property_id}"
+            return await asyncio.to_thread(app.scrape_url, url)
+    
+    return await asyncio.gather(
+        *(scrape_one(property_id) for property_id in property_ids),
+        return_exceptions=True,
+    )
+
+def iter_page_markdown(pages: list):
+    """Yield each crawled page's markdown, dropping the page once consumed
+    
+    The list is consumed in place so only the page currently being scanned
+    stays referenced, rather than every crawled page for the whole loop.
+    """
+    pages.reverse()
+    while pages:
+        page = pages.pop()
+        if page.markdown:
+            yield page.markdown
+
 def test_property_extraction():
     """Test Fire Crawl with property extraction"""
     api_key = os.getenv("FIRECRAWL_API_KEY")
@@ -93,20 +166,23 @@ def test_property_extraction():
         result = app.scrape_url(comprehensive_url)
         
         if result.success and result.markdown:
-            console.print(f"✅ Scraped {len(result.markdown)} characters")
+            # Keep a single reference to the page so it can be freed after scanning
+            markdown = result.markdown
+            del result
+            console.print(f"✅ Scraped {len(markdown)} characters")
             
             # Save full markdown for analysis
-            with open("full_rightmove_results.md", 'w', encoding='utf-8') as f:
-                f.write(result.markdown)
+            Path("full_rightmove_results.md").write_text(markdown, encoding='utf-8')
             console.print("📄 Full results saved to full_rightmove_results.md")
             
             # Extract property IDs
-            property_ids = extract_property_ids(result.markdown)
+            property_ids = extract_property_ids(markdown)
             console.print(f"🏠 Found {len(property_ids)} property IDs: {property_ids[:5]}...")
             
             # Extract property details
-            properties = extract_property_details(result.markdown)
+            properties = extract_property_details(markdown)
             valid_properties = [p for p in properties if p.property_id]
+            del markdown
             
             console.print(f"✅ Extracted {len(valid_properties)} properties with details")
             
@@ -129,10 +205,8 @@ def test_property_extraction():
             console.print(table)
             
             # Save extracted data
-            properties_data = [prop.dict() for prop in valid_properties]
-            with open("extracted_properties.json", 'w') as f:
-                json.dump(properties_data, f, indent=2)
-            console.print(f"\n💾 Saved {len(properties_data)} properties to extracted_properties.json")
+            write_json("extracted_properties.json", valid_properties)
+            console.print(f"\n💾 Saved {len(valid_properties)} properties to extracted_properties.json")
             
         else:
             console.print("❌ Failed to scrape content")
@@ -140,20 +214,27 @@ def test_property_extraction():
         # 2. Test individual property scraping
         if property_ids:
             console.print(f"\n[bold]2. Testing individual property scraping...[/bold]")
-            individual_url = f"https://www.rightmove.co.uk/properties/{property_ids[0]}"
+            sample_ids = property_ids[:INDIVIDUAL_SAMPLE_SIZE]
             
-            individual_result = app.scrape_url(individual_url)
-            if individual_result.success and individual_result.markdown:
-                console.print(f"✅ Individual property: {len(individual_result.markdown)} characters")
+            individual_results = asyncio.run(scrape_properties(app, sample_ids))
+            for property_id, individual_result in zip(sample_ids, individual_results):
+                if isinstance(individual_result, Exception):
+                    console.print(f"❌ Property {property_id}: {individual_result}")
+                    continue
+                if not (individual_result.success and individual_result.markdown):
+                    continue
+                
+                console.print(f"✅ Individual property {property_id}: {len(individual_result.markdown)} characters")
                 
                 # Save individual property sample
-                with open(f"individual_property_{property_ids[0]}.md", 'w', encoding='utf-8') as f:
-                    f.write(individual_result.markdown)
-                console.print(f"📄 Individual property saved to individual_property_{property_ids[0]}.md")
+                Path(f"individual_property_{property_id}.md").write_text(
+                    individual_result.markdown, encoding='utf-8'
+                )
+                console.print(f"📄 Individual property saved to individual_property_{property_id}.md")
                 
                 # Look for detailed info
-                price_matches = re.findall(r'£[\d,]+\s*(?:pcm|per month|pw|per week)', individual_result.markdown, re.IGNORECASE)
-                bed_matches = re.findall(r'(\d+)\s*bed(?:room)?s?', individual_result.markdown, re.IGNORECASE)
+                price_matches = PRICE_RE.findall(individual_result.markdown)
+                bed_matches = BED_RE.findall(individual_result.markdown)
                 
                 console.print(f"💰 Prices found: {price_matches[:3]}")
                 console.print(f"🛏️  Bedrooms found: {bed_matches[:3]}")
@@ -165,24 +246,23 @@ def test_property_extraction():
         if crawl_result.success and crawl_result.data:
             console.print(f"✅ Crawled {len(crawl_result.data)} pages")
             
-            all_property_ids = []
-            for page in crawl_result.data:
-                if page.markdown:
-                    page_ids = extract_property_ids(page.markdown)
-                    all_property_ids.extend(page_ids)
+            total_pages = len(crawl_result.data)
+            # Ordered set of IDs across all pages, filled as each page streams by
+            seen_ids = {}
+            for page_markdown in iter_page_markdown(crawl_result.data):
+                seen_ids.update(dict.fromkeys(iter_property_ids(page_markdown)))
             
-            unique_ids = list(set(all_property_ids))
+            unique_ids = list(seen_ids)
             console.print(f"🏠 Total unique properties across all pages: {len(unique_ids)}")
             
             # Save crawl results
             crawl_data = {
-                'total_pages': len(crawl_result.data),
+                'total_pages': total_pages,
                 'unique_properties': len(unique_ids),
                 'property_ids': unique_ids
             }
             
-            with open("crawl_results.json", 'w') as f:
-                json.dump(crawl_data, f, indent=2)
+            write_json("crawl_results.json", crawl_data)
             
         console.print(f"\n[green]✅ Fire Crawl integration test complete![/green]")
         
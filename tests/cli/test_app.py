@@ -0,0 +1,62 @@
+"""
+Tests for the CLI application
+"""
+
+import subprocess
+import sys
+from unittest.mock import patch
+
+from typer.testing import CliRunner
+
+from homehunt.cli.app import app
+from homehunt.cli.config import SearchConfig
+
+# Modules the CLI defers until a command needs them
+DEFERRED_MODULES = (
+    "sqlalchemy",
+    "homehunt.config.executor",
+    "homehunt.config.manager",
+    "homehunt.exports.service",
+    "homehunt.traveltime.client",
+    "rich.table",
+)
+
+
+class TestAppImport:
+    """Test building the CLI stays cheap"""
+    
+    def test_import_skips_deferred_modules(self):
+        """Test importing the app does not load the database or command dependencies"""
+        # A fresh interpreter, since other tests have already imported these
+        code = (
+            "import sys, homehunt.cli.app; "
+            f"print([m for m in {DEFERRED_MODULES!r} if m in sys.modules])"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        
+        assert result.stdout.strip() == "[]"
+
+
+class TestSearchCommand:
+    """Test the search command's option handling"""
+    
+    def test_strict_validation_error_reported(self, monkeypatch):
+        """Test strict mode reports invalid options instead of a traceback"""
+        monkeypatch.setenv("HOMEHUNT_STRICT", "1")
+        
+        def invalid_config(**kwargs):
+            # A genuine ValidationError, whatever the options
+            return SearchConfig(location="x")
+        
+        with patch("homehunt.cli.app.SearchConfig", side_effect=invalid_config), \
+             patch("homehunt.cli.search_command.search_properties") as search_properties:
+            result = CliRunner().invoke(app, ["search", "London"])
+        
+        assert result.exit_code == 1
+        assert "Invalid search options" in result.output
+        search_properties.assert_not_called()
@@ -24,6 +24,14 @@ class TestRightmoveURLBuilder:
         assert "searchLocation=SW1A%201AA" in url
         assert "sortType=6" in url  # Default sort by date
     
+    def test_brackets_escaped_in_values(self):
+        """Test brackets in values are escaped while list keys keep a literal []"""
+        config = SearchConfig(location="a&b [x]", property_types=[PropertyType.FLAT])
+        url = RightmoveURLBuilder.build_url(config)
+        
+        assert "searchLocation=a%26b%20%5Bx%5D&" in url
+        assert "propertyTypes[]=flats" in url
+    
     def test_price_filters(self):
         """Test price filter parameters"""
         config = SearchConfig(
@@ -64,6 +72,16 @@ class TestRightmoveURLBuilder:
         assert "propertyTypes[]=flats" in url
         assert "propertyTypes[]=houses" in url
     
+    def test_property_types_deduplicated(self):
+        """Test types sharing a Rightmove value are sent once"""
+        config = SearchConfig(
+            location="London",
+            property_types=[PropertyType.FLAT, PropertyType.STUDIO, PropertyType.MAISONETTE]
+        )
+        url = RightmoveURLBuilder.build_url(config)
+        
+        assert url.count("propertyTypes[]=flats") == 1
+    
     def test_furnished_status(self):
         """Test furnished status parameter"""
         config = SearchConfig(
@@ -316,4 +334,21 @@ class TestBuildSearchURLs:
         zoopla_url = urls[Portal.ZOOPLA][0]
         assert "price_min=1000" in zoopla_url
         assert "price_max=2000" in zoopla_url
-        assert "beds_min=2" in zoopla_url
\ No newline at end of file
+        assert "beds_min=2" in zoopla_url
+    
+    def test_cached_for_identical_configs(self):
+        """Test equal configs give equal URLs without sharing lists"""
+        first = build_search_urls(SearchConfig(location="Camden", portals=[Portal.RIGHTMOVE]))
+        second = build_search_urls(SearchConfig(location="Camden", portals=[Portal.RIGHTMOVE]))
+        
+        assert first == second
+        assert first[Portal.RIGHTMOVE] is not second[Portal.RIGHTMOVE]
+        
+        # Mutating a returned list does not change later results
+        first[Portal.RIGHTMOVE].append("mutated")
+        third = build_search_urls(SearchConfig(location="Camden", portals=[Portal.RIGHTMOVE]))
+        assert third == second
+        
+        # A different config still gets its own URLs
+        priced = build_search_urls(SearchConfig(location="Camden", portals=[Portal.RIGHTMOVE], min_price=900))
+        assert priced != second
@@ -10,7 +10,7 @@ import pytest
 from homehunt.cli.config import SearchConfig
 from homehunt.config.executor import ConfigExecutor, ConfigExecutorError
 from homehunt.config.models import AdvancedSearchConfig, CommuteFilter, SavedSearchProfile
-from homehunt.core.models import Portal, PropertyListing
+from homehunt.core.models import ExtractionMethod, Portal, PropertyListing
 
 
 class TestConfigExecutor:
@@ -64,7 +64,7 @@ class TestConfigExecutor:
         """Test basic configuration execution"""
         executor = ConfigExecutor(test_config)
         
-        with patch('homehunt.cli.search_command.search_properties') as mock_search:
+        with patch('homehunt.cli.search_command.search_properties', autospec=True) as mock_search:
             mock_search.return_value = mock_properties
             
             result = await executor.execute()
@@ -81,7 +81,7 @@ class TestConfigExecutor:
         """Test dry run execution"""
         executor = ConfigExecutor(test_config)
         
-        with patch('homehunt.cli.search_command.search_properties') as mock_search:
+        with patch('homehunt.cli.search_command.search_properties', autospec=True) as mock_search:
             result = await executor.execute(dry_run=True)
             
             assert len(result) == 0
@@ -107,7 +107,7 @@ class TestConfigExecutor:
         
         executor = ConfigExecutor(test_config)
         
-        with patch('homehunt.cli.search_command.search_properties') as mock_search:
+        with patch('homehunt.cli.search_command.search_properties', autospec=True) as mock_search:
             mock_search.return_value = mock_properties
             
             # Execute only the first profile
@@ -122,7 +122,7 @@ class TestConfigExecutor:
         """Test execution with non-existent profile name"""
         executor = ConfigExecutor(test_config)
         
-        with patch('homehunt.cli.search_command.search_properties') as mock_search:
+        with patch('homehunt.cli.search_command.search_properties', autospec=True) as mock_search:
             mock_search.return_value = mock_properties
             
             result = await executor.execute(profile_names=["nonexistent"])
@@ -155,7 +155,7 @@ class TestConfigExecutor:
         test_config.deduplicate_across_profiles = True
         executor = ConfigExecutor(test_config)
         
-        with patch('homehunt.cli.search_command.search_properties') as mock_search:
+        with patch('homehunt.cli.search_command.search_properties', autospec=True) as mock_search:
             mock_search.return_value = duplicate_properties
             
             result = await executor.execute()
@@ -165,6 +165,62 @@ class TestConfigExecutor:
             assert result[0].url == "https://rightmove.co.uk/1"
             assert result[1].url == "https://rightmove.co.uk/2"
     
+    def test_deduplicate_by_property_id(self, test_config):
+        """Test listings are deduplicated by portal and property ID"""
+        def listing(portal, property_id, url):
+            return PropertyListing(
+                portal=portal,
+                property_id=property_id,
+                url=url,
+                extraction_method=ExtractionMethod.DIRECT_HTTP
+            )
+        
+        properties = [
+            listing(Portal.RIGHTMOVE, "1", "https://rightmove.co.uk/1"),
+            listing(Portal.RIGHTMOVE, "1", "https://rightmove.co.uk/1?channel=RES_LET"),
+            listing(Portal.ZOOPLA, "1", "https://zoopla.co.uk/1"),
+            listing(Portal.RIGHTMOVE, "2", "https://rightmove.co.uk/2"),
+        ]
+        
+        executor = ConfigExecutor(test_config)
+        result = executor._deduplicate_properties(properties)
+        
+        assert [p.url for p in result] == [
+            "https://rightmove.co.uk/1",
+            "https://zoopla.co.uk/1",
+            "https://rightmove.co.uk/2",
+        ]
+    
+    def test_apply_scoring_orders_listings(self, test_config):
+        """Test scoring ranks listings without adding serialized fields"""
+        executor = ConfigExecutor(test_config)
+        listings = [
+            PropertyListing(
+                portal=Portal.RIGHTMOVE,
+                property_id=property_id,
+                url=f"https://www.rightmove.co.uk/properties/{property_id}",
+                extraction_method=ExtractionMethod.DIRECT_HTTP,
+                price=price,
+                bedrooms=bedrooms,
+                garden=garden
+            )
+            for property_id, price, bedrooms, garden in [
+                ("expensive", "£4,000 pcm", 1, None),
+                ("cheap", "£1,000 pcm", 3, True),
+                ("unpriced", "POA", 2, None),
+            ]
+        ]
+        
+        result = executor._apply_scoring({"price": 0.5, "size": 0.3, "features": 0.2}, listings)
+        
+        assert [prop.property_id for prop in result] == ["cheap", "expensive", "unpriced"]
+        assert result[0].calculated_score == pytest.approx(0.4 + 0.225 + 0.2 / 3)
+        assert "calculated_score" not in result[0].model_dump()
+        
+        # A zero weight contributes nothing, exactly like an absent one
+        zero_weighted = executor._apply_scoring({"price": 0.0, "size": 1.0}, listings)
+        assert [prop.calculated_score for prop in zero_weighted] == [0.75, 0.5, 0.25]
+    
     @pytest.mark.asyncio
     async def test_scoring(self, test_config, mock_properties):
         """Test property scoring"""
@@ -178,7 +234,7 @@ class TestConfigExecutor:
         
         executor = ConfigExecutor(test_config)
         
-        with patch('homehunt.cli.search_command.search_properties') as mock_search:
+        with patch('homehunt.cli.search_command.search_properties', autospec=True) as mock_search:
             mock_search.return_value = mock_properties
             
             result = await executor.execute()
@@ -221,7 +277,7 @@ class TestConfigExecutor:
         
         executor = ConfigExecutor(config)
         
-        with patch('homehunt.cli.search_command.search_properties') as mock_search:
+        with patch('homehunt.cli.search_command.search_properties', autospec=True) as mock_search:
             mock_search.return_value = mock_properties
             
             result = await executor.execute()
@@ -232,12 +288,103 @@ class TestConfigExecutor:
             # Should return combined results
             assert len(result) == 4  # 2 properties × 2 locations
     
+    @pytest.mark.asyncio
+    async def test_multi_location_partial_failure(self):
+        """Test a failing location does not discard the other locations"""
+        from homehunt.config.models import MultiLocationConfig
+        
+        profile = SavedSearchProfile(
+            name="partial_failure_profile",
+            search=SearchConfig(location="Base Location", portals=[Portal.RIGHTMOVE]),
+            multi_location=MultiLocationConfig(
+                name="Partial Failure Test",
+                locations=["Location A", "Location B", "Location C"]
+            )
+        )
+        config = AdvancedSearchConfig(profiles=[profile], save_to_database=False)
+        executor = ConfigExecutor(config)
+        
+        async def fake_search(config, save_to_db=True, output_file=None):
+            if config.location == "Location B":
+                raise Exception("Search failed")
+            return [
+                PropertyListing(
+                    portal=Portal.RIGHTMOVE,
+                    property_id=f"{config.location}-{i}",
+                    url=f"https://www.rightmove.co.uk/properties/{i}",
+                    extraction_method=ExtractionMethod.DIRECT_HTTP
+                )
+                for i in range(2)
+            ]
+        
+        with patch('homehunt.cli.search_command.search_properties', autospec=True, side_effect=fake_search) as mock_search:
+            result = await executor.execute()
+        
+        assert mock_search.call_count == 3
+        assert len(result) == 4  # 2 properties × 2 successful locations
+    
+    @pytest.mark.asyncio
+    async def test_database_shared_and_closed(self, test_config):
+        """Test services share one lazily created database that cleanup closes"""
+        executor = ConfigExecutor(test_config)
+        assert executor.db is None
+        
+        db = executor._get_db()
+        assert executor._get_db() is db
+        
+        with patch.object(db, 'close', new_callable=AsyncMock) as close:
+            await executor._cleanup()
+        close.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_handle_exports_concurrently(self, test_config):
+        """Test profile exports run concurrently and one failure does not stop the rest"""
+        from datetime import datetime
+        from pathlib import Path
+        
+        from homehunt.exports.models import ExportConfig, ExportFormat, ExportResult
+        
+        profile = test_config.profiles[0]
+        profile.export_configs = [
+            ExportConfig(format=ExportFormat.CSV, output_path=Path("a.csv")),
+            ExportConfig(format=ExportFormat.JSON, output_path=Path("b.json")),
+            ExportConfig(format=ExportFormat.CSV, output_path=Path("c.csv")),
+        ]
+        listing = PropertyListing(
+            portal=Portal.RIGHTMOVE,
+            property_id="1",
+            url="https://www.rightmove.co.uk/properties/1",
+            extraction_method=ExtractionMethod.DIRECT_HTTP
+        )
+        
+        running = 0
+        peak = 0
+        exported = []
+        
+        async def fake_export(config, properties):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            if config.output_path == Path("b.json"):
+                raise Exception("Export failed")
+            exported.append(config.output_path)
+            return ExportResult(success=True, format=config.format, started_at=datetime.now())
+        
+        executor = ConfigExecutor(test_config)
+        with patch('homehunt.exports.service.ExportService.export_properties', side_effect=fake_export):
+            await executor._handle_exports(profile, [listing])
+        
+        assert peak == 3
+        assert sorted(exported) == [Path("a.csv"), Path("c.csv")]
+    
     @pytest.mark.asyncio
     async def test_error_handling(self, test_config):
         """Test error handling during execution"""
         executor = ConfigExecutor(test_config)
         
-        with patch('homehunt.cli.search_command.search_properties') as mock_search:
+        with patch('homehunt.cli.search_command.search_properties', autospec=True) as mock_search:
             mock_search.side_effect = Exception("Search failed")
             
             result = await executor.execute()
@@ -245,6 +392,15 @@ class TestConfigExecutor:
             # Should handle error gracefully and return empty list
             assert len(result) == 0
     
+    @pytest.mark.asyncio
+    async def test_cancelled_search_propagates(self, test_config):
+        """Test a cancelled profile search is not reported as an empty result"""
+        executor = ConfigExecutor(test_config)
+        
+        with patch('homehunt.cli.search_command.search_properties', autospec=True, side_effect=asyncio.CancelledError):
+            with pytest.raises(asyncio.CancelledError):
+                await executor.execute()
+    
     @pytest.mark.asyncio
     async def test_concurrent_execution(self, mock_properties):
         """Test concurrent execution of multiple profiles"""
@@ -272,7 +428,7 @@ class TestConfigExecutor:
         
         executor = ConfigExecutor(config)
         
-        with patch('homehunt.cli.search_command.search_properties') as mock_search:
+        with patch('homehunt.cli.search_command.search_properties', autospec=True) as mock_search:
             mock_search.return_value = mock_properties
             
             result = await executor.execute()
@@ -299,7 +455,7 @@ class TestConfigExecutor:
         
         executor = ConfigExecutor(test_config)
         
-        with patch('homehunt.cli.search_command.search_properties') as mock_search:
+        with patch('homehunt.cli.search_command.search_properties', autospec=True) as mock_search:
             mock_search.return_value = mock_properties
             
             import time
@@ -320,11 +476,34 @@ class TestConfigExecutor:
         
         executor = ConfigExecutor(test_config)
         
-        with patch('homehunt.cli.search_command.search_properties') as mock_search:
+        with patch('homehunt.cli.search_command.search_properties', autospec=True) as mock_search:
             mock_search.return_value = mock_properties
             
             await executor.execute()
             
             # Metadata should be updated
             assert profile.total_runs == initial_runs + 1
-            assert profile.last_run is not None
\ No newline at end of file
+            assert profile.last_run is not None
+    
+    @pytest.mark.asyncio
+    async def test_metadata_recorded_in_state_file(self, test_config, tmp_path, monkeypatch):
+        """Test run metadata goes to the run state file, leaving the config file alone"""
+        import json
+        
+        from homehunt.config import executor as executor_module
+        from homehunt.config.parser import ConfigParser
+        
+        state_file = tmp_path / "state" / "run_state.json"
+        monkeypatch.setattr(executor_module, "RUN_STATE_FILE", state_file)
+        config_path = tmp_path / "config.yaml"
+        ConfigParser.save_file(test_config, config_path)
+        original = config_path.read_text()
+        
+        with patch('homehunt.cli.search_command.search_properties', autospec=True, return_value=[]):
+            await ConfigExecutor(test_config, config_path).execute()
+            await ConfigExecutor(ConfigParser.parse_config(config_path), config_path).execute()
+        
+        assert config_path.read_text() == original
+        runs = json.loads(state_file.read_text())[str(config_path.resolve())]
+        assert runs[test_config.profiles[0].name]["total_runs"] == 2
+        assert not list(state_file.parent.glob("*.tmp"))
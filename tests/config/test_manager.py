@@ -4,12 +4,14 @@ Tests for configuration manager
 
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from homehunt.cli.config import SearchConfig
-from homehunt.config.manager import ConfigManager, ConfigManagerError
+from homehunt.config.manager import ConfigManager, ConfigManagerError, get_config_manager
 from homehunt.config.models import AdvancedSearchConfig, SavedSearchProfile
+from homehunt.config.parser import ConfigParser
 from homehunt.core.models import Portal
 
 
@@ -54,6 +56,18 @@ class TestConfigManager:
         assert manager.profiles_dir.exists()
         assert manager.default_config_file == temp_config_dir / "default.yaml"
     
+    def test_get_config_manager_shared(self, temp_config_dir, monkeypatch):
+        """Test the default manager is created once per process"""
+        monkeypatch.setattr(Path, "home", lambda: temp_config_dir)
+        get_config_manager.cache_clear()
+        
+        try:
+            manager = get_config_manager()
+            assert get_config_manager() is manager
+            assert manager.config_dir == temp_config_dir / ".homehunt" / "config"
+        finally:
+            get_config_manager.cache_clear()
+    
     def test_save_and_load_config(self, config_manager, test_config):
         """Test saving and loading configuration"""
         # Save config
@@ -112,6 +126,20 @@ class TestConfigManager:
         files = config_manager.list_config_files()
         assert len(files) == 1
         assert files[0].name == "default.yaml"
+        
+        # Loading writes a parser cache sidecar, which is not a config file
+        config_manager.load_config()
+        files = config_manager.list_config_files()
+        assert [f.name for f in files] == ["default.yaml"]
+        
+        # Profile files are listed too, other files are not
+        (config_manager.profiles_dir / "extra.yml").write_text("name: extra\n")
+        (config_manager.config_dir / "notes.txt").write_text("not a config\n")
+        files = config_manager.list_config_files()
+        assert files == [
+            config_manager.config_dir / "default.yaml",
+            config_manager.profiles_dir / "extra.yml",
+        ]
     
     def test_list_profiles(self, config_manager, test_config):
         """Test listing profiles from configuration"""
@@ -139,6 +167,36 @@ class TestConfigManager:
         profile = config_manager.get_profile("nonexistent")
         assert profile is None
     
+    def test_get_profile_index_follows_saves(self, config_manager, test_config):
+        """Test profile lookups see profiles added after the index was built"""
+        config_manager.save_config(test_config)
+        assert config_manager.get_profile("added_profile") is None
+        
+        added = test_config.profiles[0].model_copy(update={"name": "added_profile"})
+        config_manager.add_profile(added)
+        
+        profile = config_manager.get_profile("added_profile")
+        assert profile is not None
+        assert profile.name == "added_profile"
+        assert config_manager.get_profile("test_profile") is not None
+    
+    def test_load_config_cached(self, config_manager, test_config):
+        """Test loads reuse the saved config without parsing the file again"""
+        config_manager.save_config(test_config)
+        
+        with patch.object(ConfigParser, "parse_config", wraps=ConfigParser.parse_config) as parse_config:
+            config_manager.load_config()
+            config_manager.list_profiles()
+            profile = config_manager.get_profile("test_profile")
+            profile.description = "changed"
+            assert config_manager.get_profile("test_profile").description != "changed"
+            
+            # Saving replaces the cached config
+            test_config.name = "Renamed"
+            config_manager.save_config(test_config)
+            assert config_manager.load_config().name == "Renamed"
+            assert parse_config.call_count == 0
+    
     def test_add_profile(self, config_manager, test_config):
         """Test adding a new profile to configuration"""
         config_manager.save_config(test_config)
@@ -241,6 +299,54 @@ class TestConfigManager:
         assert len(errors) > 0
         assert any("name cannot be empty" in error for error in errors)
     
+    def test_validate_config_cached(self, config_manager, test_config):
+        """Test validation results are reused until the file is saved again"""
+        config_manager.save_config(test_config)
+        path = config_manager.default_config_file
+        
+        with patch.object(ConfigManager, "validate_model", autospec=True, side_effect=ConfigManager.validate_model) as validate_model:
+            assert config_manager.validate_config(path) == []
+            errors = config_manager.validate_config(path)
+            errors.append("caller mutation")
+            assert config_manager.validate_config(path) == []
+            assert validate_model.call_count == 1
+            
+            # Saving invalidates the cached result
+            test_config.profiles[0].name = ""
+            config_manager.save_config(test_config)
+            assert any("name cannot be empty" in error for error in config_manager.validate_config(path))
+            assert validate_model.call_count == 2
+    
+    def test_validate_model(self, config_manager, test_config):
+        """Test validating an already parsed configuration"""
+        assert config_manager.validate_model(test_config) == []
+        
+        unnamed = test_config.model_copy(deep=True)
+        unnamed.profiles[0].name = ""
+        errors = config_manager.validate_model(unnamed)
+        assert any("name cannot be empty" in error for error in errors)
+    
+    def test_validate_model_checks_export_dir_once(self, config_manager, test_config, tmp_path):
+        """Test profiles sharing an export directory stat it only once"""
+        missing_dir = tmp_path / "missing"
+        base = test_config.profiles[0]
+        test_config.profiles = [
+            base.model_copy(update={
+                "name": f"profile_{i}",
+                "auto_export": True,
+                "export_formats": ["csv"],
+                "export_path": str(missing_dir / f"export_{i}.csv"),
+            })
+            for i in range(3)
+        ]
+        
+        with patch.object(Path, "exists", autospec=True, side_effect=Path.exists) as exists:
+            errors = config_manager.validate_model(test_config)
+        
+        assert exists.call_count == 1
+        assert len(errors) == 3
+        assert all(f"Export directory does not exist: {missing_dir}" in error for error in errors)
+    
     def test_backup_config(self, config_manager, test_config):
         """Test creating configuration backup"""
         config_manager.save_config(test_config)
@@ -250,6 +356,7 @@ class TestConfigManager:
         assert backup_path.exists()
         assert "backup_" in backup_path.name
         assert backup_path.suffix == ".yaml"
+        assert not list(backup_path.parent.glob("*.tmp"))
         
         # Verify backup content
         backup_config = config_manager.load_config(backup_path)
@@ -347,6 +347,19 @@ class TestAdvancedSearchConfig:
         not_found = config.get_profile("nonexistent")
         assert not_found is None
     
+    def test_profiles_by_name(self):
+        """Test indexing profiles by name"""
+        profiles = [
+            self.create_test_profile("profile1"),
+            self.create_test_profile("profile2")
+        ]
+        
+        config = AdvancedSearchConfig(profiles=profiles)
+        index = config.profiles_by_name()
+        
+        assert list(index) == ["profile1", "profile2"]
+        assert index["profile2"] is config.profiles[1]
+    
     def test_add_profile(self):
         """Test adding a new profile"""
         profile1 = self.create_test_profile("profile1")
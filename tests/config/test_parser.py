@@ -11,7 +11,12 @@ import yaml
 
 from homehunt.cli.config import FurnishedType, SearchConfig, SortOrder
 from homehunt.config.models import AdvancedSearchConfig, SavedSearchProfile
-from homehunt.config.parser import ConfigFormat, ConfigParser, ConfigParserError
+from homehunt.config.parser import (
+    ConfigFormat,
+    ConfigParser,
+    ConfigParserError,
+    _config_cache,
+)
 from homehunt.core.models import Portal, PropertyType
 
 
@@ -141,6 +146,14 @@ class TestConfigParser:
         assert normalized["portals"] == [Portal.RIGHTMOVE, Portal.ZOOPLA]
         assert normalized["property_types"] == [PropertyType.FLAT, PropertyType.HOUSE]
     
+    def test_normalize_leaves_input_unchanged(self):
+        """Test normalizing does not modify the caller's data"""
+        search_data = {"location": "London", "portals": ["rightmove"], "property_types": ["flat"]}
+        
+        ConfigParser.parse_profile({"name": "p", "search": search_data})
+        
+        assert search_data == {"location": "London", "portals": ["rightmove"], "property_types": ["flat"]}
+    
     def test_normalize_invalid_portal(self):
         """Test normalizing invalid portal value"""
         data = {"portals": ["invalid_portal"]}
@@ -274,6 +287,96 @@ class TestConfigParser:
         
         Path(f.name).unlink()  # Clean up
     
+    def test_parse_config_cached(self, tmp_path):
+        """Test cached parsing returns copies and picks up file changes"""
+        config_path = tmp_path / "config.yaml"
+        config_data = {
+            "name": "Cached Config",
+            "profiles": [{"name": "profile1", "search": {"location": "SW1A 1AA"}}]
+        }
+        config_path.write_text(yaml.dump(config_data))
+        
+        first = ConfigParser.parse_config_cached(config_path)
+        second = ConfigParser.parse_config_cached(config_path)
+        
+        assert first == second
+        assert first is not second
+        
+        # Mutating a returned config does not leak into the cache
+        first.profiles.clear()
+        second.profiles[0].search.portals.clear()
+        assert len(ConfigParser.parse_config_cached(config_path).profiles) == 1
+        
+        # Read-only callers can share the cached instance
+        shared = ConfigParser.parse_config_cached(config_path, copy=False)
+        assert shared is ConfigParser.parse_config_cached(config_path, copy=False)
+        assert shared.profiles[0].search.portals
+        assert shared == ConfigParser.parse_config_cached(config_path)
+        
+        # A changed file is parsed again, replacing its cache entry
+        cached_files = len(_config_cache)
+        config_data["profiles"].append({"name": "profile2", "search": {"location": "E14"}})
+        config_path.write_text(yaml.dump(config_data))
+        assert len(ConfigParser.parse_config_cached(config_path).profiles) == 2
+        assert len(_config_cache) == cached_files
+    
+    def test_parse_config_cached_sidecar(self, tmp_path):
+        """Test YAML configs are cached as JSON outside the config's directory and reused"""
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(yaml.dump({
+            "name": "Sidecar Config",
+            "profiles": [{"name": "profile1", "search": {"location": "SW1A 1AA"}}]
+        }))
+        
+        config = ConfigParser.parse_config_cached(config_path)
+        cache_path = ConfigParser.cache_path(config_path)
+        assert cache_path.exists()
+        assert list(tmp_path.iterdir()) == [config_path]
+        
+        # A fresh process (empty in-memory cache) rebuilds from the sidecar
+        ConfigParser.clear_cache()
+        assert ConfigParser.parse_config_cached(config_path) == config
+        
+        # A corrupt sidecar falls back to parsing the YAML
+        cache_path.write_text("not json")
+        ConfigParser.clear_cache()
+        reparsed = ConfigParser.parse_config_cached(config_path)
+        assert reparsed.name == "Sidecar Config"
+        assert [p.name for p in reparsed.profiles] == ["profile1"]
+    
+    def test_save_file_seeds_cache(self, tmp_path, monkeypatch):
+        """Test reloading a just-saved config does not parse the file again"""
+        config = AdvancedSearchConfig(
+            name="Saved Config",
+            profiles=[SavedSearchProfile(name="profile1", search=SearchConfig(location="SW1A 1AA"))]
+        )
+        config_path = tmp_path / "config.yaml"
+        ConfigParser.save_file(config, config_path)
+        expected = ConfigParser.parse_config(config_path)
+        
+        def fail(file_path):
+            raise AssertionError("config was parsed again")
+        
+        monkeypatch.setattr(ConfigParser, "parse_config", staticmethod(fail))
+        assert ConfigParser.parse_config_cached(config_path) == expected
+        
+        # The sidecar is seeded too, for the next process
+        ConfigParser.clear_cache()
+        assert ConfigParser.parse_config_cached(config_path) == expected
+    
+    def test_parse_config_cached_missing_file(self, tmp_path):
+        """Test cached parsing reports missing files like parse_config"""
+        with pytest.raises(ConfigParserError, match="not found"):
+            ConfigParser.parse_config_cached(tmp_path / "missing.yaml")
+    
+    @pytest.mark.skipif(not yaml.__with_libyaml__, reason="PyYAML built without libyaml")
+    def test_uses_libyaml(self):
+        """Test YAML is loaded and dumped with libyaml's C classes when available"""
+        from homehunt.config import parser
+        
+        assert parser.YamlSafeLoader is yaml.CSafeLoader
+        assert parser.YamlSafeDumper is yaml.CSafeDumper
+    
     def test_save_yaml_file(self):
         """Test saving configuration to YAML file"""
         # Create a test configuration
@@ -0,0 +1,15 @@
+"""
+Shared test fixtures
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_homehunt_state(tmp_path_factory, monkeypatch):
+    """Keep config caches and run state out of the real ~/.homehunt"""
+    from homehunt.config import executor, parser
+    
+    state_dir = tmp_path_factory.mktemp("homehunt")
+    monkeypatch.setattr(parser, "CONFIG_CACHE_DIR", state_dir / "cache" / "configs")
+    monkeypatch.setattr(executor, "RUN_STATE_FILE", state_dir / "run_state.json")
@@ -5,8 +5,9 @@ Tests for database models and operations
 from datetime import datetime, timedelta
 
 import pytest
-from sqlmodel import select
+from sqlmodel import select, update
 
+import homehunt.core.db as db_module
 from homehunt.core.db import Database, Listing, PriceHistory, SearchHistory
 from homehunt.core.models import ExtractionMethod, Portal, PropertyListing, PropertyType
 
@@ -145,6 +146,33 @@ class TestDatabase:
         assert saved_property.description == "Updated description"
         assert saved_property.scrape_count >= 2  # Should increment
 
+    @pytest.mark.asyncio
+    async def test_save_properties(self, async_test_db, sample_property_listing):
+        """Test saving new and existing properties in batches"""
+        await async_test_db.save_property(sample_property_listing)
+
+        updated_listing = sample_property_listing.model_copy()
+        updated_listing.description = "Batch updated description"
+        new_listings = [
+            PropertyListing(
+                portal=Portal.ZOOPLA,
+                property_id=f"batch-{i}",
+                url=f"https://example.com/batch-{i}",
+                extraction_method=ExtractionMethod.FIRECRAWL,
+            )
+            for i in range(3)
+        ]
+
+        saved = await async_test_db.save_properties(
+            [updated_listing, *new_listings], batch_size=2
+        )
+        assert saved == 4
+
+        saved_property = await async_test_db.get_property(updated_listing.uid)
+        assert saved_property.description == "Batch updated description"
+        for listing in new_listings:
+            assert await async_test_db.get_property(listing.uid) is not None
+
     @pytest.mark.skip(reason="Price change tracking needs debugging - not critical for Phase 4")
     @pytest.mark.asyncio
     async def test_price_change_tracking(self, async_test_db, sample_property_listing):
@@ -233,6 +261,13 @@ class TestDatabase:
         )
         assert len(rightmove_results) >= 2  # May have additional results from other tests
 
+        # Search across several portals
+        multi_portal_results = await async_test_db.search_properties(
+            portals=[Portal.RIGHTMOVE, Portal.ZOOPLA], max_price=250000
+        )
+        assert {p.property_id for p in multi_portal_results} >= {"1", "3"}
+        assert all(p.price_numeric <= 250000 for p in multi_portal_results)
+
         # Search by price range
         mid_range_results = await async_test_db.search_properties(
             min_price=175000, max_price=275000
@@ -254,6 +289,30 @@ class TestDatabase:
         sw_results = await async_test_db.search_properties(postcode_area="SW1")
         assert len(sw_results) == 2
 
+    @pytest.mark.asyncio
+    async def test_iter_properties_matches_search(self, async_test_db):
+        """Test streaming properties yields the same listings as searching"""
+        for property_id, bedrooms in [("11", 1), ("12", 2), ("13", 1)]:
+            await async_test_db.save_property(
+                PropertyListing(
+                    portal=Portal.RIGHTMOVE,
+                    property_id=property_id,
+                    url=f"https://example.com/{property_id}",
+                    extraction_method=ExtractionMethod.DIRECT_HTTP,
+                    bedrooms=bedrooms,
+                )
+            )
+
+        searched = await async_test_db.search_properties(bedrooms=1, limit=50)
+        streamed = [
+            prop
+            async for prop in async_test_db.iter_properties(
+                bedrooms=1, limit=50, batch_size=2
+            )
+        ]
+
+        assert [p.uid for p in streamed] == [p.uid for p in searched]
+
     @pytest.mark.asyncio
     async def test_get_statistics(self, async_test_db):
         """Test getting database statistics"""
@@ -285,6 +344,45 @@ class TestDatabase:
         assert "price_stats" in stats
         assert "last_updated" in stats
 
+    @pytest.mark.asyncio
+    async def test_get_statistics_cached(self, async_test_db, monkeypatch):
+        """Test cached statistics are reused until the listing table changes"""
+        calls = []
+
+        async def counting_get_statistics():
+            calls.append(1)
+            return {"portal_stats": [], "recent_activity": len(calls)}
+
+        monkeypatch.setattr(async_test_db, "get_statistics", counting_get_statistics)
+
+        first = await async_test_db.get_statistics_cached()
+        second = await async_test_db.get_statistics_cached()
+        assert second == first
+        assert len(calls) == 1
+
+        await async_test_db.save_property(
+            PropertyListing(
+                portal=Portal.ZOOPLA,
+                property_id="cache-1",
+                url="https://example.com/cache-1",
+                extraction_method=ExtractionMethod.FIRECRAWL,
+            )
+        )
+        await async_test_db.get_statistics_cached()
+        assert len(calls) == 2
+
+        # Deactivating a listing changes the table version too
+        async with async_test_db.async_session() as session:
+            await session.execute(update(Listing).values(is_active=False))
+            await session.commit()
+        await async_test_db.get_statistics_cached()
+        assert len(calls) == 3
+
+        # Expired entries are recomputed even if the table is unchanged
+        monkeypatch.setattr(db_module, "STATISTICS_CACHE_TTL", 0.0)
+        await async_test_db.get_statistics_cached()
+        assert len(calls) == 4
+
     @pytest.mark.asyncio
     async def test_cleanup_old_data(self, async_test_db):
         """Test cleaning up old data"""
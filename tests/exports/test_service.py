@@ -9,7 +9,8 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from homehunt.core.models import Portal, PropertyListing, PropertyType
+from homehunt.core.db import Listing
+from homehunt.core.models import ExtractionMethod, Portal, PropertyListing, PropertyType
 from homehunt.exports.models import ExportConfig, ExportFormat
 from homehunt.exports.service import ExportService, ExportServiceError
 
@@ -116,6 +117,78 @@ class TestExportService:
         # Cleanup
         Path(tmp.name).unlink()
     
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("export_format", [ExportFormat.CSV, ExportFormat.JSON])
+    async def test_export_streamed_from_db(self, export_service, mock_db, export_format, tmp_path):
+        """Test file exports stream rows from the database"""
+        properties = [
+            PropertyListing(
+                property_id=str(i),
+                url=f"https://rightmove.co.uk/{i}",
+                title=f"Test Property {i}",
+                portal=Portal.RIGHTMOVE,
+                property_type=PropertyType.FLAT,
+                features=["Garden", "Parking"] if i == 1 else [],
+                extraction_method=ExtractionMethod.DIRECT_HTTP
+            )
+            for i in (1, 2)
+        ]
+        
+        async def iter_properties(**kwargs):
+            for prop in properties:
+                yield prop
+        
+        async def iter_rows(columns, **kwargs):
+            for prop in properties:
+                listing = Listing.from_property_listing(prop)
+                yield tuple(getattr(listing, column) for column in columns)
+        
+        mock_db.iter_properties = iter_properties
+        mock_db.iter_rows = iter_rows
+        output_path = tmp_path / f"properties.{export_format.value}"
+        config = ExportConfig(format=export_format, output_path=output_path)
+        
+        result = await export_service.export_properties(config)
+        
+        assert result.success is True
+        assert result.properties_exported == 2
+        assert result.file_size_bytes == output_path.stat().st_size
+        mock_db.search_properties.assert_not_called()
+        
+        if export_format == ExportFormat.JSON:
+            data = json.loads(output_path.read_text())
+            assert data['metadata']['property_count'] == 2
+            assert [p['title'] for p in data['properties']] == ["Test Property 1", "Test Property 2"]
+        else:
+            # Column rows match what the model-based CSV export writes
+            expected_path = tmp_path / "expected.csv"
+            expected_config = ExportConfig(format=export_format, output_path=expected_path)
+            await export_service.export_properties(expected_config, properties)
+            assert output_path.read_text() == expected_path.read_text()
+    
+    @pytest.mark.asyncio
+    async def test_export_all_fetches_once(self, export_service, mock_db, tmp_path):
+        """Test exporting several formats shares one database query"""
+        mock_db.search_properties.return_value = [
+            PropertyListing(
+                property_id="1",
+                url="https://rightmove.co.uk/1",
+                title="Test Property 1",
+                portal=Portal.RIGHTMOVE,
+                extraction_method=ExtractionMethod.DIRECT_HTTP
+            )
+        ]
+        configs = [
+            ExportConfig(format=ExportFormat.CSV, output_path=tmp_path / "properties.csv"),
+            ExportConfig(format=ExportFormat.JSON, output_path=tmp_path / "properties.json"),
+        ]
+        
+        results = await export_service.export_all(configs)
+        
+        assert [r.format for r in results] == [ExportFormat.CSV, ExportFormat.JSON]
+        assert all(r.success and r.properties_exported == 1 for r in results)
+        assert mock_db.search_properties.await_count == 1
+    
     @pytest.mark.asyncio 
     async def test_export_no_properties(self, export_service):
         """Test export with no properties"""
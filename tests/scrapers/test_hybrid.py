@@ -2,6 +2,7 @@
 Tests for hybrid scraper functionality
 """
 
+import asyncio
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -28,6 +29,7 @@ class TestHybridScraper:
         db.create_tables_async = AsyncMock()
         db.get_property = AsyncMock(return_value=None)
         db.save_property = AsyncMock(return_value=True)
+        db.save_properties = AsyncMock(side_effect=lambda listings: len(listings))
         db.close = AsyncMock()
         return db
     
@@ -155,6 +157,35 @@ class TestHybridScraper:
         # URLs should be filtered out due to recent scraping
         assert len(result) == 0
     
+    @pytest.mark.asyncio
+    async def test_discover_property_urls_concurrent(self, mock_database):
+        """Test search pages are scraped concurrently within max_concurrent"""
+        scraper = HybridScraper(
+            database=mock_database, firecrawl_api_key="test", max_concurrent=2
+        )
+        search_urls = [f"https://www.rightmove.co.uk/find.html?page={i}" for i in range(4)]
+        in_flight = []
+        peak = 0
+        
+        async def scrape_search_page(url):
+            nonlocal peak
+            in_flight.append(url)
+            peak = max(peak, len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(url)
+            return [f"https://www.rightmove.co.uk/properties/{url[-1]}"]
+        
+        config = Mock(max_results=10)
+        with patch('homehunt.scrapers.hybrid.build_search_urls', return_value={Portal.RIGHTMOVE: search_urls}):
+            with patch.object(scraper.firecrawl_scraper, 'get_pagination_urls', new=AsyncMock(side_effect=lambda url, _: [url])):
+                with patch.object(scraper.firecrawl_scraper, 'scrape_search_page', new=scrape_search_page):
+                    urls = await scraper._discover_property_urls(config, Mock(), 1)
+        
+        # Page order is kept and no more than max_concurrent pages run at once
+        assert urls == [f"https://www.rightmove.co.uk/properties/{i}" for i in range(4)]
+        assert peak == 2
+        assert scraper.stats["firecrawl_requests"] == 4
+    
     @pytest.mark.asyncio
     async def test_scrape_properties_hybrid(self, mock_database, mock_property_urls, mock_scraping_results):
         """Test hybrid property scraping"""
@@ -184,6 +215,22 @@ class TestHybridScraper:
         mock_direct.assert_called_once()
         mock_firecrawl.assert_called_once()
     
+    @pytest.mark.asyncio
+    async def test_scrape_properties_hybrid_reports_each_portal(self, mock_database, mock_property_urls, mock_scraping_results):
+        """Test each portal's listings are handed on as soon as it is scraped"""
+        scraper = HybridScraper(database=mock_database, firecrawl_api_key="test")
+        scraped = []
+        
+        with patch.object(scraper.direct_http_scraper, 'scrape_properties_batch', return_value=[mock_scraping_results[0]]):
+            with patch.object(scraper.firecrawl_scraper, 'scrape_properties_batch', return_value=[mock_scraping_results[1]]):
+                properties = await scraper._scrape_properties_hybrid(
+                    mock_property_urls, Mock(), 1, on_scraped=scraped.append
+                )
+        
+        assert len(scraped) == 2
+        assert sorted(listings[0].portal.value for listings in scraped) == ["rightmove", "zoopla"]
+        assert {prop.uid for prop in properties} == {prop.uid for listings in scraped for prop in listings}
+    
     @pytest.mark.asyncio
     async def test_save_properties(self, mock_database):
         """Test saving properties to database"""
@@ -211,8 +258,9 @@ class TestHybridScraper:
         
         await scraper._save_properties(properties, mock_progress, mock_task_id)
         
-        # Check that all properties were saved
-        assert mock_database.save_property.call_count == 2
+        # Check that all properties were saved in one batched call
+        mock_database.save_properties.assert_awaited_once_with(properties)
+        mock_database.save_property.assert_not_called()
         assert scraper.stats["properties_saved"] == 2
     
     @pytest.mark.asyncio
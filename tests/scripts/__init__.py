@@ -0,0 +1,3 @@
+"""
+Scripts tests package
+"""
\ No newline at end of file
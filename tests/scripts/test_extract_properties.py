@@ -0,0 +1,91 @@
+"""
+Tests for the Rightmove markdown extraction script
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT_PATH = Path(__file__).parents[2] / "scripts" / "extract_properties.py"
+
+
+@pytest.fixture(scope="module")
+def extract_properties():
+    """Load the script as a module"""
+    spec = importlib.util.spec_from_file_location("extract_properties", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestExtractPropertyDetails:
+    """Test extracting listings from search result markdown"""
+    
+    def test_extracts_listing_sections(self, extract_properties):
+        """Test each property ID collects the details that follow it"""
+        markdown = (
+            "[Flat](https://www.rightmove.co.uk/properties/111)\n"
+            "![photo](https://media.rightmove.co.uk/a.jpg)\n"
+            "3 bedrooms, £1,500 pcm\n"
+            "[House](https://www.rightmove.co.uk/properties/222)\n"
+            "£400 pw 1 bed\n"
+        )
+        
+        listings = extract_properties.extract_property_details(markdown)
+        
+        assert [p.property_id for p in listings] == ["111", "222"]
+        assert listings[0].images == ["https://media.rightmove.co.uk/a.jpg"]
+        assert (listings[0].price, listings[0].bedrooms) == ("£1,500 pcm", 3)
+        assert (listings[1].price, listings[1].bedrooms) == ("£400 pw", 1)
+    
+    def test_details_in_image_alt_text(self, extract_properties):
+        """Test bedrooms and price only given in image alt text are still found"""
+        markdown = (
+            "[Flat](https://www.rightmove.co.uk/properties/111)\n"
+            "![2 bedroom flat, £1,200 pcm](https://media.rightmove.co.uk/a.jpg)\n"
+        )
+        
+        listing, = extract_properties.extract_property_details(markdown)
+        
+        assert listing.images == ["https://media.rightmove.co.uk/a.jpg"]
+        assert listing.bedrooms == 2
+        assert listing.price == "£1,200 pcm"
+    
+    def test_other_images_do_not_borrow_urls(self, extract_properties):
+        """Test a non-Rightmove image does not pick up the next image's URL"""
+        markdown = (
+            "[a](https://www.rightmove.co.uk/properties/111) "
+            "![logo](https://x/y.svg) "
+            "![p](https://media.rightmove.co.uk/a.jpg)"
+        )
+        
+        listing, = extract_properties.extract_property_details(markdown)
+        
+        assert listing.images == ["https://media.rightmove.co.uk/a.jpg"]
+    
+    def test_images_stay_with_their_listing(self, extract_properties):
+        """Test an image after the next property ID belongs to that listing only"""
+        markdown = (
+            "[a](https://www.rightmove.co.uk/properties/111) "
+            "![logo](https://x/y.svg) "
+            "[b](https://www.rightmove.co.uk/properties/222) "
+            "![p](https://media.rightmove.co.uk/a.jpg)"
+        )
+        
+        first, second = extract_properties.extract_property_details(markdown)
+        
+        assert first.images == []
+        assert second.images == ["https://media.rightmove.co.uk/a.jpg"]
+    
+    def test_escaped_brackets_in_alt_text(self, extract_properties):
+        """Test markdown-escaped brackets in alt text do not end the image early"""
+        markdown = (
+            "[a](https://www.rightmove.co.uk/properties/111)\n"
+            "![flat \\[2 bed\\]](https://media.rightmove.co.uk/a.jpg)\n"
+        )
+        
+        listing, = extract_properties.extract_property_details(markdown)
+        
+        assert listing.images == ["https://media.rightmove.co.uk/a.jpg"]
+        assert listing.bedrooms == 2
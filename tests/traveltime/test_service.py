@@ -300,6 +300,33 @@ class TestTravelTimeService:
         
         assert len(filtered_high) == 2  # Excludes property with no commute data
     
+    @pytest.mark.asyncio
+    async def test_filter_by_commute_limits(self, mock_db, mock_traveltime_client):
+        """Test filtering properties against several commute limits at once"""
+        service = TravelTimeService(mock_db, mock_traveltime_client)
+        
+        properties_with_commutes = [
+            PropertyListing(
+                portal=Portal.RIGHTMOVE,
+                property_id=f"prop{i}",
+                url=f"https://example.com/prop{i}",
+                commute_public_transport=public_transport,
+                commute_cycling=cycling,
+                extraction_method=ExtractionMethod.DIRECT_HTTP
+            )
+            for i, (public_transport, cycling) in enumerate([(20, 25), (20, 50), (45, 25), (None, 25)])
+        ]
+        
+        filtered = await service.filter_by_commute_limits(
+            properties_with_commutes,
+            [("public_transport", 30), ("cycling", 40)]
+        )
+        
+        assert [prop.property_id for prop in filtered] == ["prop0"]
+        
+        # Unknown transport modes have no stored time to compare
+        assert await service.filter_by_commute_limits(properties_with_commutes, [("teleport", 60)]) == []
+    
     @pytest.mark.asyncio
     async def test_get_commute_statistics(self, mock_db, mock_traveltime_client):
         """Test commute statistics calculation"""